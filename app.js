@@ -8,6 +8,8 @@ let answeredQuestions = new Set();
 let firstAttempts = new Map(); // Track first attempt results: { questionId: { isCorrect: boolean, userAnswer: any } }
 let bookmarkedQuestions = new Set();
 let shuffledQuestions = [];
+let isShuffled = false;
+let allQuestionsLoaded = Promise.resolve();
 let touchStartX = 0;
 let touchEndX = 0;
 
@@ -51,9 +53,8 @@ const elements = {
 // ========================================
 async function init() {
     try {
-        // Load quiz data
-        const response = await fetch('data/quiz_data.json');
-        quizData = await response.json();
+        // Load quiz data (manifest + first shard, rest in background)
+        quizData = await loadQuizData();
 
         // Initialize shuffled questions (original order)
         shuffledQuestions = [...quizData.questions];
@@ -78,6 +79,85 @@ async function init() {
     }
 }
 
+// ========================================
+// DATA LOADING
+// ========================================
+const BUNDLE_DIR = 'data/bundle/';
+
+async function fetchJson(url) {
+    const response = await fetch(url);
+    if (!response.ok) {
+        const error = new Error(`${url}: ${response.status}`);
+        error.status = response.status;
+        throw error;
+    }
+    return response.json();
+}
+
+// 분할 번들(scripts/build_bundles.py)이 있으면 첫 샤드만 받아서 바로 시작
+// 없거나 문제은행보다 오래됐으면 (server.js가 409) 기존처럼 quiz_data.json 전체를 받음
+async function loadQuizData() {
+    let manifest;
+    try {
+        manifest = await fetchJson(BUNDLE_DIR + 'manifest.json');
+    } catch (error) {
+        if (error.status === 409) {
+            console.warn('번들이 quiz_data.json과 달라 전체 문제은행을 받습니다 (scripts/build_bundles.py 재실행 필요)');
+        }
+        return fetchJson('data/quiz_data.json');
+    }
+
+    const { shards, ...meta } = manifest;
+    const data = { ...meta, questions: [] };
+    if (shards.length === 0) {
+        return data;
+    }
+
+    const firstShard = await fetchJson(BUNDLE_DIR + shards[0].file);
+    data.questions = firstShard.questions;
+
+    allQuestionsLoaded = loadRemainingShards(data, shards.slice(1));
+    return data;
+}
+
+const SHARD_RETRIES = 2;
+
+async function fetchShard(shard) {
+    for (let attempt = 0; ; attempt++) {
+        try {
+            return await fetchJson(BUNDLE_DIR + shard.file);
+        } catch (error) {
+            if (attempt >= SHARD_RETRIES) throw error;
+            await new Promise(resolve => setTimeout(resolve, 500 * (attempt + 1)));
+        }
+    }
+}
+
+async function loadRemainingShards(data, shards) {
+    try {
+        // 병렬로 받고 매니페스트 순서대로 붙임 (샤드마다 재시도)
+        const rest = await Promise.all(shards.map(fetchShard));
+        rest.forEach(shard => data.questions.push(...shard.questions));
+    } catch (error) {
+        // 재시도해도 실패하면 전체 문제은행으로 교체
+        console.error('Error loading quiz data shards:', error);
+        try {
+            const full = await fetchJson('data/quiz_data.json');
+            data.questions.splice(0, data.questions.length, ...full.questions);
+        } catch (fallbackError) {
+            console.error('Error loading quiz data:', fallbackError);
+            alert(`문제를 모두 불러오지 못했습니다 (${data.questions.length}/${data.totalQuestions}개). 새로고침해 주세요.`);
+            return;
+        }
+    }
+
+    if (!isShuffled) {
+        shuffledQuestions = [...data.questions];
+    }
+    createQuestionJumpButtons();
+    updateUI();
+}
+
 // ========================================
 // EVENT LISTENERS
 // ========================================
@@ -875,7 +955,10 @@ function nextQuestion() {
 // ========================================
 // SHUFFLE
 // ========================================
-function shuffleQuestions() {
+async function shuffleQuestions() {
+    // 나머지 샤드를 받는 중이면 전체가 올 때까지 기다린 뒤 섞음
+    await allQuestionsLoaded;
+
     // Fisher-Yates shuffle
     const array = [...quizData.questions];
     for (let i = array.length - 1; i > 0; i--) {
@@ -884,6 +967,7 @@ function shuffleQuestions() {
     }
 
     shuffledQuestions = array;
+    isShuffled = true;
     currentQuestionIndex = 0;
 
     // Reset quiz state
@@ -931,16 +1015,161 @@ function saveBookmarks() {
 // ========================================
 // SEARCH
 // ========================================
+// 역색인(scripts/search_index.py가 만든 data/search_index.json): 글자 2-gram → 문제 번호 델타 목록
+// 검색어의 gram 목록을 교집합해서 후보를 고르고, 후보만 실제 텍스트로 확인
+// 색인의 ids / textHash가 불러온 문제와 다르면 (문제은행을 고치고 색인을 다시 만들지 않은 경우) 선형 탐색
+let searchIndex = null;
+let searchIndexLoading = null;
+let searchPositionSource = null;
+let searchPositionById = new Map();
+const searchTextCache = new WeakMap();
+
+function loadSearchIndex() {
+    if (!searchIndexLoading) {
+        searchIndexLoading = fetchJson('data/search_index.json')
+            .then(async index => {
+                // 색인은 전체 문제 기준이므로 나머지 샤드까지 받은 뒤 비교
+                await allQuestionsLoaded;
+                if (searchIndexMatches(index, quizData.questions)) {
+                    searchIndex = index;
+                } else {
+                    console.warn('Search index does not match quiz data, using linear search (rerun scripts/search_index.py build)');
+                }
+            })
+            .catch(error => console.warn('Search index unavailable, using linear search:', error));
+    }
+    return searchIndexLoading;
+}
+
+// search_index.py normalize()와 동일: 소문자 + 연속 공백을 공백 하나로
+function normalizeSearchText(text) {
+    return text.toLowerCase().split(/\s+/).filter(Boolean).join(' ');
+}
+
+// 검색 대상: 문제 + 선택지 + 해설 (search_index.py searchable_text()와 동일)
+function searchableText(question) {
+    let text = searchTextCache.get(question);
+    if (text === undefined) {
+        const parts = [question.question || ''];
+        (question.options || []).forEach(option => {
+            if (typeof option === 'string') {
+                parts.push(option);
+            } else if (option && typeof option.text === 'string') {
+                parts.push(option.text);
+            }
+        });
+        parts.push(question.explanation || '');
+        text = normalizeSearchText(parts.join('\n'));
+        searchTextCache.set(question, text);
+    }
+    return text;
+}
+
+// search_index.py text_hash()와 동일: 문제별 검색 텍스트를 줄바꿈으로 이은 문자열의 FNV-1a 32비트 해시
+function searchTextHash(questions) {
+    let hash = 0x811c9dc5;
+    questions.forEach((question, i) => {
+        if (i > 0) {
+            hash = Math.imul(hash ^ 10, 0x01000193) >>> 0;
+        }
+        const text = searchableText(question);
+        for (let j = 0; j < text.length; j++) {
+            hash = Math.imul(hash ^ text.charCodeAt(j), 0x01000193) >>> 0;
+        }
+    });
+    return hash;
+}
+
+function searchIndexMatches(index, questions) {
+    return Array.isArray(index.ids) &&
+        index.ids.length === questions.length &&
+        questions.every((question, i) => question.id === index.ids[i]) &&
+        index.textHash === searchTextHash(questions);
+}
+
+function decodePostings(deltas) {
+    const docs = new Array(deltas.length);
+    let current = 0;
+    for (let i = 0; i < deltas.length; i++) {
+        current += deltas[i];
+        docs[i] = current;
+    }
+    return docs;
+}
+
+// 검색어 → 후보 문제 id Set (null이면 색인으로 좁힐 수 없음 → 전체 확인)
+function searchCandidateIds(query) {
+    if (!searchIndex) return null;
+
+    const n = searchIndex.ngram;
+    const grams = new Set();
+    for (let i = 0; i + n <= query.length; i++) {
+        grams.add(query.slice(i, i + n));
+    }
+
+    const common = new Set(searchIndex.common);
+    const lists = [];
+    for (const gram of grams) {
+        if (common.has(gram)) continue;
+        const deltas = searchIndex.postings[gram];
+        if (!deltas) return new Set();
+        lists.push(deltas);
+    }
+    if (lists.length === 0) return null;
+
+    // 짧은 목록부터 교집합
+    lists.sort((a, b) => a.length - b.length);
+    let docs = decodePostings(lists[0]);
+    for (let i = 1; i < lists.length && docs.length > 0; i++) {
+        const other = new Set(decodePostings(lists[i]));
+        docs = docs.filter(doc => other.has(doc));
+    }
+    return new Set(docs.map(doc => searchIndex.ids[doc]));
+}
+
+// 현재 순서(shuffledQuestions)에서 문제 id → 위치
+function searchPositions() {
+    if (searchPositionSource !== shuffledQuestions) {
+        searchPositionById = new Map(shuffledQuestions.map((question, i) => [question.id, i]));
+        searchPositionSource = shuffledQuestions;
+    }
+    return searchPositionById;
+}
+
+// 현재 위치 다음부터 검색하고, 없으면 처음부터 현재 위치까지 (못 찾으면 -1)
+function findNextMatch(rawQuery) {
+    const query = normalizeSearchText(rawQuery);
+    const candidates = searchCandidateIds(query);
+    const matches = (i) => searchableText(shuffledQuestions[i]).includes(query);
+
+    let positions;
+    if (candidates === null) {
+        positions = shuffledQuestions.map((_, i) => i);
+    } else {
+        const positionById = searchPositions();
+        positions = [...candidates]
+            .map(id => positionById.get(id))
+            .filter(i => i !== undefined)
+            .sort((a, b) => a - b);
+    }
+
+    const after = positions.find(i => i > currentQuestionIndex && matches(i));
+    if (after !== undefined) return after;
+    const before = positions.find(i => i <= currentQuestionIndex && matches(i));
+    return before !== undefined ? before : -1;
+}
+
 function toggleSearch() {
     elements.searchBox.classList.toggle('active');
     if (elements.searchBox.classList.contains('active')) {
+        loadSearchIndex();
         elements.searchInput.focus();
     } else {
         elements.searchInput.value = '';
     }
 }
 
-function searchNextQuestion() {
+async function searchNextQuestion() {
     const query = elements.searchInput.value.toLowerCase().trim();
 
     if (!query) {
@@ -948,31 +1177,11 @@ function searchNextQuestion() {
         return;
     }
 
-    // 현재 위치 다음부터 검색
-    let found = false;
-    let searchStartIndex = currentQuestionIndex + 1;
-
-    // 현재 위치 다음부터 끝까지 검색
-    for (let i = searchStartIndex; i < shuffledQuestions.length; i++) {
-        if (shuffledQuestions[i].question.toLowerCase().includes(query)) {
-            currentQuestionIndex = i;
-            found = true;
-            break;
-        }
-    }
-
-    // 못 찾았으면 처음부터 현재 위치까지 검색
-    if (!found) {
-        for (let i = 0; i < searchStartIndex; i++) {
-            if (shuffledQuestions[i].question.toLowerCase().includes(query)) {
-                currentQuestionIndex = i;
-                found = true;
-                break;
-            }
-        }
-    }
+    await loadSearchIndex();
+    const found = findNextMatch(query);
 
-    if (found) {
+    if (found !== -1) {
+        currentQuestionIndex = found;
         displayQuestion();
         updateUI();
         // 검색어는 유지 (다음 검색을 위해)
@@ -981,38 +1190,18 @@ function searchNextQuestion() {
     }
 }
 
-function handleSearch(e) {
+async function handleSearch(e) {
     const query = e.target.value.toLowerCase().trim();
 
     if (!query) {
         return;
     }
 
-    // 현재 위치 다음부터 검색
-    let found = false;
-    let searchStartIndex = currentQuestionIndex + 1;
-
-    // 현재 위치 다음부터 끝까지 검색
-    for (let i = searchStartIndex; i < shuffledQuestions.length; i++) {
-        if (shuffledQuestions[i].question.toLowerCase().includes(query)) {
-            currentQuestionIndex = i;
-            found = true;
-            break;
-        }
-    }
-
-    // 못 찾았으면 처음부터 현재 위치까지 검색
-    if (!found) {
-        for (let i = 0; i < searchStartIndex; i++) {
-            if (shuffledQuestions[i].question.toLowerCase().includes(query)) {
-                currentQuestionIndex = i;
-                found = true;
-                break;
-            }
-        }
-    }
+    await loadSearchIndex();
+    const found = findNextMatch(query);
 
-    if (found) {
+    if (found !== -1) {
+        currentQuestionIndex = found;
         displayQuestion();
         updateUI();
         elements.searchInput.value = ''; // 검색 후 입력창 비우기
@@ -2,11 +2,12 @@
 Placeholder 문제들의 빈칸 위치 분석
 """
 
-import json
 import re
 import sys
 import io
 
+from quiz_store import QuizStore
+
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
 def analyze_blank_position(question_text):
@@ -54,8 +55,7 @@ def main():
     """메인 함수"""
     
     print("JSON 로딩 중...")
-    with open('quiz_data.json', 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    store = QuizStore('quiz_data.json')
     
     target_ids = [104, 115, 118, 126, 132, 188, 212, 219, 230, 231, 232, 
                   251, 265, 281, 296, 297, 298, 299, 306, 310, 329, 338, 372, 403]
@@ -67,11 +67,7 @@ def main():
     
     for q_id in target_ids:
         # JSON에서 해당 문제 찾기
-        question = None
-        for q in data['questions']:
-            if q['id'] == q_id:
-                question = q
-                break
+        question = store.get(q_id)
         
         if not question:
             print(f"Q{q_id}: 찾을 수 없음")
@@ -0,0 +1,316 @@
+"""
+PDF 수집(ingestion) 파이프라인 벤치마크
+fitz로 합성 시험 PDF를 만들고 단계별 pages/sec, questions/sec, 최대 RSS를 측정
+네트워크 없이 동작하며 시드 고정으로 매번 같은 PDF를 생성
+
+사용법:
+    python bench_ingest.py                     # 500, 5000, 50000 문제
+    python bench_ingest.py 500 5000            # 크기 지정
+    python bench_ingest.py 500 --json out.json # 결과를 JSON으로도 저장
+"""
+
+import json
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+import multiprocessing as mp
+from queue import Empty
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
+
+DEFAULT_SIZES = [500, 5000, 50000]
+SEED = 900
+POLL_SECONDS = 5  # 자식 프로세스가 살아 있는지 확인하는 간격
+
+PAGE_WIDTH, PAGE_HEIGHT = 595, 842
+MARGIN = 50
+LINE_HEIGHT = 13
+BODY_SIZE = 10
+HEADER_SIZE = 12
+
+WORDS = ("Azure subscription resource group region availability zone virtual machine "
+         "storage account policy blueprint tenant cost management support plan service "
+         "level agreement network security group identity directory compliance").split()
+
+
+# ---------------------------------------------------------------------------
+# 합성 PDF 생성
+# ---------------------------------------------------------------------------
+
+def _sentence(rng, n_words):
+    words = [rng.choice(WORDS) for _ in range(n_words)]
+    return " ".join(words).capitalize() + "."
+
+
+def _question_lines(rng, q_num):
+    """한 문제의 (텍스트, 굵게 여부, 이미지 종류) 줄 목록"""
+    roll = rng.random()
+    lines = [(f"Question #{q_num}", True, None)]
+
+    if roll < 0.2:
+        lines.append(("HOTSPOT -", False, None))
+        lines.append(("For each of the following statements, select Yes if the statement is true.", False, None))
+        lines.append(("Otherwise, select No.", False, None))
+        lines.append(("NOTE: Each correct selection is worth one point.", False, None))
+        lines.append(("Hot Area:", False, "shared" if q_num % 2 else "unique"))
+        lines.append(("Correct Answer:", False, None))
+        for box in range(1, 4):
+            answer = rng.choice(["Yes", "No"])
+            lines.append((f"Box {box}: {answer} - {_sentence(rng, 10)}", False, None))
+    elif roll < 0.3:
+        lines.append(("DRAG DROP -", False, None))
+        lines.append(("Match the Azure service to the correct description.", False, None))
+        lines.append(("Select and Place:", False, "unique"))
+        lines.append(("Correct Answer:", False, None))
+        for box in range(1, 4):
+            lines.append((f"Box {box}: {rng.choice(WORDS).capitalize()}", False, None))
+    else:
+        lines.append((_sentence(rng, 14), False, None))
+        lines.append((_sentence(rng, 8), False, None))
+        for letter in "ABCD":
+            lines.append((f"{letter}. {_sentence(rng, 5)}", False, None))
+        lines.append((f"Correct Answer: {rng.choice('ABCD')}", False, None))
+
+    lines.append(("Reference:", False, None))
+    lines.append((f"https://docs.microsoft.com/en-us/azure/{rng.choice(WORDS)}", False, None))
+    return lines
+
+
+def generate_synthetic_pdf(path, n_questions, seed=SEED):
+    """'Question #N / Correct Answer: / Reference:' 형식의 합성 PDF 생성"""
+    import fitz
+
+    rng = random.Random(seed)
+    doc = fitz.open()
+
+    # 반복되는 이미지(로고/답안 영역 배경)는 같은 xref로 재사용되도록 한 번만 삽입
+    shared_pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 120, 60), False)
+    shared_pix.set_rect(shared_pix.irect, (200, 200, 230))
+    shared_xref = 0
+
+    page = None
+    y = PAGE_HEIGHT
+
+    def new_page():
+        return doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT), MARGIN
+
+    for q_num in range(1, n_questions + 1):
+        for text, bold, image in _question_lines(rng, q_num):
+            needed = LINE_HEIGHT + (70 if image else 0)
+            if page is None or y + needed > PAGE_HEIGHT - MARGIN:
+                page, y = new_page()
+
+            page.insert_text(
+                (MARGIN, y + BODY_SIZE),
+                text,
+                fontname="hebo" if bold else "helv",
+                fontsize=HEADER_SIZE if bold else BODY_SIZE
+            )
+            y += LINE_HEIGHT
+
+            if image:
+                rect = fitz.Rect(MARGIN, y, MARGIN + 120, y + 60)
+                if image == "shared":
+                    if shared_xref:
+                        page.insert_image(rect, xref=shared_xref)
+                    else:
+                        shared_xref = page.insert_image(rect, pixmap=shared_pix)
+                else:
+                    pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 40, 20), False)
+                    pix.set_rect(pix.irect, (q_num % 256, (q_num * 7) % 256, (q_num * 13) % 256))
+                    page.insert_image(fitz.Rect(MARGIN, y, MARGIN + 40, y + 20), pixmap=pix)
+                y += 70
+
+    doc.save(path, garbage=3, deflate=True)
+    page_count = doc.page_count
+    doc.close()
+    return page_count
+
+
+# ---------------------------------------------------------------------------
+# 측정 단계 (각 단계는 별도 프로세스에서 실행해 최대 RSS를 분리 측정)
+# ---------------------------------------------------------------------------
+
+def _stage_extract_cold(pdf_path):
+    import pdf_cache
+    pdf_cache.clear_cache()
+    pdf_cache.load_pages(pdf_path, workers=1)
+    return None
+
+
+def _stage_extract_parallel(pdf_path):
+    import pdf_cache
+    pdf_cache.clear_cache()
+    pdf_cache.load_pages(pdf_path, workers=os.cpu_count() or 1)
+    return None
+
+
+def _stage_extract_warm(pdf_path):
+    import pdf_cache
+    pdf_cache.load_pages(pdf_path)
+    return None
+
+
+def _stage_parse_v2(pdf_path):
+    import parse_pdf_v2
+    data = parse_pdf_v2.parse_az900_pdf(pdf_path, "bench_v2.json", "bench_images", workers=1)
+    return data["totalQuestions"]
+
+
+def _stage_parse_v2_stream(pdf_path):
+    import parse_pdf_v2
+    return parse_pdf_v2.parse_az900_pdf_stream(pdf_path, "bench_v2_stream.json", "bench_images")
+
+
+def _stage_parse_all_text(pdf_path):
+    import parse_all_questions
+    data = parse_all_questions.extract_all_questions_from_pdf(pdf_path, "bench_all.json", "bench_images")
+    return data["totalQuestions"]
+
+
+def _stage_parse_all_layout(pdf_path):
+    import parse_all_questions
+    data = parse_all_questions.extract_all_questions_from_layout(pdf_path, "bench_layout.json", "bench_images")
+    return data["totalQuestions"]
+
+
+def _stage_hotspot(pdf_path):
+    import process_hotspot_questions as hp
+    from question_index import QuestionIndex
+
+    index = QuestionIndex.from_pdf(pdf_path)
+    count = 0
+    for q_num in index.numbers():
+        content = index.segment(q_num)
+        if 'HOTSPOT' not in content:
+            continue
+        q_type = hp.classify_hotspot_type(content)
+        if q_type == 'checkbox':
+            hp.parse_checkbox_question(q_num, content)
+        elif q_type == 'dropdown':
+            hp.parse_dropdown_question(q_num, content)
+        count += 1
+    return count
+
+
+STAGES = [
+    ("extract_cold", _stage_extract_cold),
+    ("extract_parallel", _stage_extract_parallel),
+    ("extract_warm", _stage_extract_warm),
+    ("parse_v2", _stage_parse_v2),
+    ("parse_v2_stream", _stage_parse_v2_stream),
+    ("parse_all_text", _stage_parse_all_text),
+    ("parse_all_layout", _stage_parse_all_layout),
+    ("hotspot", _stage_hotspot),
+]
+
+
+def _run_stage(stage_name, workdir, pdf_path, queue):
+    """자식 프로세스: 출력은 버리고 시간/최대 RSS만 보고"""
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.chdir(workdir)
+
+    func = dict(STAGES)[stage_name]
+    start = time.perf_counter()
+    questions = func(pdf_path)
+    elapsed = time.perf_counter() - start
+
+    # 리눅스 ru_maxrss 단위는 KB
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((elapsed, questions, peak_kb))
+
+
+def measure(stage_name, workdir, pdf_path):
+    """
+    단계 하나를 새 프로세스에서 실행 → (시간, 문제 수, 최대 RSS KB)
+    자식이 결과 없이 끝나면 (예외, fitz 없음, OOM kill 등) 기다리지 않고 RuntimeError
+    """
+    ctx = mp.get_context("spawn")
+    queue = ctx.Queue()
+    proc = ctx.Process(target=_run_stage, args=(stage_name, workdir, pdf_path, queue))
+    proc.start()
+    try:
+        while True:
+            try:
+                result = queue.get(timeout=POLL_SECONDS)
+                break
+            except Empty:
+                if proc.is_alive():
+                    continue
+                # 종료 직전에 넣은 결과가 아직 전달 중일 수 있으므로 한 번 더 확인
+                try:
+                    result = queue.get(timeout=1)
+                    break
+                except Empty:
+                    proc.join()
+                    raise RuntimeError(f"{stage_name} 단계가 결과 없이 종료됨 (exitcode {proc.exitcode})")
+    except BaseException:
+        # Ctrl+C 등으로 빠져나갈 때 자식이 남지 않도록
+        if proc.is_alive():
+            proc.terminate()
+        proc.join()
+        raise
+    proc.join()
+    return result
+
+
+def run_benchmarks(sizes, seed=SEED):
+    results = []
+
+    for n_questions in sizes:
+        with tempfile.TemporaryDirectory(prefix="bench_ingest_") as workdir:
+            pdf_path = os.path.join(workdir, f"synthetic_{n_questions}.pdf")
+
+            start = time.perf_counter()
+            page_count = generate_synthetic_pdf(pdf_path, n_questions, seed)
+            gen_time = time.perf_counter() - start
+            print(f"\n[생성] {n_questions}문제 / {page_count}페이지 ({gen_time:.1f}초)")
+
+            print(f"  {'단계':<18} {'시간(s)':>9} {'pages/s':>10} {'questions/s':>12} {'RSS(MB)':>9}")
+            for stage_name, _ in STAGES:
+                elapsed, questions, peak_kb = measure(stage_name, workdir, pdf_path)
+                questions = n_questions if questions is None else questions
+                row = {
+                    "questions": n_questions,
+                    "pages": page_count,
+                    "stage": stage_name,
+                    "seconds": round(elapsed, 4),
+                    "pagesPerSec": round(page_count / elapsed, 1) if elapsed else None,
+                    "questionsPerSec": round(questions / elapsed, 1) if elapsed else None,
+                    "peakRssMB": round(peak_kb / 1024, 1)
+                }
+                results.append(row)
+                print(f"  {stage_name:<18} {elapsed:>9.3f} {row['pagesPerSec']:>10} "
+                      f"{row['questionsPerSec']:>12} {row['peakRssMB']:>9}")
+
+    return results
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    args = sys.argv[1:]
+    json_out = None
+    if "--json" in args:
+        pos = args.index("--json")
+        json_out = args[pos + 1]
+        del args[pos:pos + 2]
+
+    sizes = [int(a) for a in args] or DEFAULT_SIZES
+
+    print("=" * 60)
+    print(f"PDF 수집 벤치마크 (시드 {SEED})")
+    print("=" * 60)
+
+    results = run_benchmarks(sizes)
+
+    if json_out:
+        with open(json_out, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n[저장] {json_out}")
@@ -0,0 +1,107 @@
+"""
+문제은행 분할 번들 생성
+quiz_data.json을 고정 크기 샤드 여러 개 + 작은 매니페스트로 나눠서
+app.js가 매니페스트와 첫 샤드만 받고 바로 첫 문제를 그린 뒤 나머지는 백그라운드로 받게 함
+
+출력 (기본 data/bundle/):
+    manifest.json               title, description, totalQuestions, sourceHash, shardSize, ids, types, shards
+    shard_000.<해시>.json        {"index": 0, "questions": [...]}
+    ...
+샤드 파일 이름에 내용 해시가 들어가므로 오래 캐시해도 되고, 매니페스트만 새로 받으면 됨
+ids / types는 문제 순서대로의 id / questionType - 샤드를 다 받기 전에도 문제 목록을 만들거나 거를 수 있음
+
+번들은 문제은행을 고칠 때마다 다시 만들어야 함 (배포 전에 실행, .agent/workflows/deploy.md)
+sourceHash는 원본 문제은행 파일의 SHA-256 - 로컬 개발 서버(server.js)는 data/quiz_data.json과 다르면
+매니페스트를 내주지 않으므로 (409) app.js가 quiz_data.json을 받음 (GitHub Pages 같은 정적 호스팅에는 없는 검사)
+
+사용법:
+    python build_bundles.py [quiz_data.json] [출력 폴더] [샤드 크기]
+"""
+
+import hashlib
+import json
+import os
+import sys
+
+DEFAULT_JSON = os.path.join("data", "quiz_data.json")
+DEFAULT_OUT = os.path.join("data", "bundle")
+SHARD_SIZE = 50  # 첫 샤드 = 처음 보여줄 문제 묶음 (문제 이동 버튼 단위와 동일)
+MANIFEST_NAME = "manifest.json"
+
+
+def _compact(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def _write(path, text):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def build_bundles(json_path=DEFAULT_JSON, out_dir=DEFAULT_OUT, shard_size=SHARD_SIZE):
+    """
+    샤드 + 매니페스트 생성 (이전 빌드의 샤드 파일은 삭제)
+    반환: 매니페스트 dict
+    """
+    if shard_size < 1:
+        raise ValueError("샤드 크기는 1 이상이어야 함")
+
+    with open(json_path, 'rb') as f:
+        raw = f.read()
+    data = json.loads(raw)
+    questions = data["questions"]
+
+    os.makedirs(out_dir, exist_ok=True)
+
+    shards = []
+    for index, start in enumerate(range(0, len(questions), shard_size)):
+        chunk = questions[start:start + shard_size]
+        text = _compact({"index": index, "questions": chunk})
+        digest = hashlib.sha256(text.encode('utf-8')).hexdigest()[:12]
+        file_name = f"shard_{index:03d}.{digest}.json"
+        _write(os.path.join(out_dir, file_name), text)
+        shards.append({
+            "file": file_name,
+            "start": start,
+            "count": len(chunk),
+            "bytes": len(text.encode('utf-8'))
+        })
+
+    manifest = {key: value for key, value in data.items() if key != "questions"}
+    manifest.update({
+        "totalQuestions": len(questions),
+        "sourceHash": hashlib.sha256(raw).hexdigest(),
+        "shardSize": shard_size,
+        "ids": [q["id"] for q in questions],
+        "types": [q.get("questionType") for q in questions],
+        "shards": shards
+    })
+    # 매니페스트는 샤드를 다 쓴 뒤에 교체 (읽는 쪽이 없는 샤드를 가리키지 않도록)
+    _write(os.path.join(out_dir, MANIFEST_NAME), _compact(manifest))
+
+    current = {shard["file"] for shard in shards}
+    for name in os.listdir(out_dir):
+        if name.startswith("shard_") and name.endswith(".json") and name not in current:
+            os.remove(os.path.join(out_dir, name))
+
+    return manifest
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    json_file = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_JSON
+    out_folder = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_OUT
+    size = int(sys.argv[3]) if len(sys.argv) > 3 else SHARD_SIZE
+
+    manifest = build_bundles(json_file, out_folder, size)
+    manifest_bytes = os.path.getsize(os.path.join(out_folder, MANIFEST_NAME))
+    first = manifest["shards"][0]["bytes"] if manifest["shards"] else 0
+    total = sum(shard["bytes"] for shard in manifest["shards"])
+
+    print(f"[번들] {json_file} → {out_folder}")
+    print(f"   문제 {manifest['totalQuestions']}개 / 샤드 {len(manifest['shards'])}개 ({size}문제씩)")
+    print(f"   첫 화면: 매니페스트 {manifest_bytes / 1024:.1f} KB + 첫 샤드 {first / 1024:.1f} KB")
+    print(f"   전체 샤드: {total / 1024:.1f} KB")
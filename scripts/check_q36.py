@@ -2,27 +2,17 @@
 36번 문제 확인
 """
 
-import fitz
 import sys
 import io
 
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-
-pdf = fitz.open("AZ-900 영문 474.pdf")
+from pdf_daemon import fetch_segment
 
-all_text = ""
-for page in pdf:
-    all_text += page.get_text() + "\n"
-
-pdf.close()
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
 # Question #36 찾기
-import re
-pattern = r'Question #36\n(.+?)Question #37'
-match = re.search(pattern, all_text, re.DOTALL)
+q36_text = fetch_segment(36)
 
-if match:
-    q36_text = match.group(1)
+if q36_text:
     print("=" * 60)
     print("Question #36")
     print("=" * 60)
@@ -2,27 +2,17 @@
 50번 문제 확인
 """
 
-import fitz
 import sys
 import io
-import re
 
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-
-pdf = fitz.open("AZ-900 영문 474.pdf")
+from pdf_daemon import fetch_segment
 
-all_text = ""
-for page in pdf:
-    all_text += page.get_text() + "\n"
-
-pdf.close()
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
 # Question #50 찾기
-pattern = r'Question #50\n(.+?)Question #51'
-match = re.search(pattern, all_text, re.DOTALL)
+q50_text = fetch_segment(50)
 
-if match:
-    q50_text = match.group(1)
+if q50_text:
     print("=" * 60)
     print("Question #50")
     print("=" * 60)
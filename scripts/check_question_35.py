@@ -2,27 +2,17 @@
 35번 문제 확인
 """
 
-import fitz
 import sys
 import io
 
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-
-pdf = fitz.open("AZ-900 영문 474.pdf")
+from pdf_daemon import fetch_segment
 
-all_text = ""
-for page in pdf:
-    all_text += page.get_text() + "\n"
-
-pdf.close()
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
 # Question #35 찾기
-import re
-pattern = r'Question #35\n(.+?)Question #36'
-match = re.search(pattern, all_text, re.DOTALL)
+q35_text = fetch_segment(35)
 
-if match:
-    q35_text = match.group(1)
+if q35_text:
     print("=" * 60)
     print("Question #35")
     print("=" * 60)
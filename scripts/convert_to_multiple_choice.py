@@ -2,29 +2,25 @@
 Placeholder 문제들을 MULTIPLE_CHOICE로 변환 (문장 끝 빈칸)
 """
 
-import fitz
-import json
 import re
 import sys
 import io
 
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+from question_index import QuestionIndex
+from quiz_store import QuizStore
 
-def get_pdf_text():
-    """PDF 텍스트 로드"""
+# 변환 대상 (드롭다운 placeholder 문제)
+TARGET_IDS = [104, 115, 118, 126, 132, 188, 212, 219, 230, 231, 232,
+              251, 265, 281, 296, 297, 298, 299, 306, 310, 329, 338, 372, 403]
+
+def load_index():
+    """PDF 문제 구간 인덱스 로드"""
     print("PDF 로딩 중...")
-    pdf = fitz.open("AZ-900 영문 474.pdf")
-    text = ""
-    for page in pdf:
-        text += page.get_text() + "\n"
-    pdf.close()
-    return text
+    return QuestionIndex.from_pdf("AZ-900 영문 474.pdf")
 
-def extract_question(pdf_text, q_num):
+def extract_question(index, q_num):
     """특정 문제 추출"""
-    pattern = rf'Question #{q_num}\n(.+?)(?=Question #{q_num + 1}|Topic \d+|$)'
-    match = re.search(pattern, pdf_text, re.DOTALL)
-    return match.group(1) if match else None
+    return index.segment(q_num, stop_at_topic=True)
 
 def parse_hotspot_dropdown(content, q_num):
     """HOTSPOT 드롭다운 문제 파싱"""
@@ -92,73 +88,75 @@ def parse_hotspot_dropdown(content, q_num):
     
     return sentence, options, answer_letter, explanation
 
+def convert_fields(content, q_num):
+    """
+    PDF 문제 텍스트 → MULTIPLE_CHOICE 변경 필드 (문장을 못 찾으면 None)
+    적용 시 dropdowns 필드는 제거
+    """
+    sentence, options, answer, explanation = parse_hotspot_dropdown(content, q_num)
+    if not sentence:
+        return None
+    
+    # 문장 끝에 빈칸 추가
+    clean_sentence = sentence.strip()
+    if not clean_sentence.endswith('_'):
+        # 마지막 마침표 제거하고 빈칸 추가
+        clean_sentence = clean_sentence.rstrip('.')
+        clean_sentence = clean_sentence + ' _______'
+    
+    fields = {
+        'question': clean_sentence,
+        'questionType': 'MULTIPLE_CHOICE',
+        'options': options,
+        'answer': answer
+    }
+    
+    # 해설이 있으면 업데이트
+    if explanation:
+        fields['explanation'] = explanation
+    
+    return fields
+
 def convert_all_questions():
     """모든 문제 변환"""
     
-    pdf_text = get_pdf_text()
+    index = load_index()
     
     print("JSON 로딩 중...")
-    with open('quiz_data.json', 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    target_ids = [104, 115, 118, 126, 132, 188, 212, 219, 230, 231, 232, 
-                  251, 265, 281, 296, 297, 298, 299, 306, 310, 329, 338, 372, 403]
+    store = QuizStore('quiz_data.json')
     
     converted = []
     failed = []
     
-    for q_id in target_ids:
+    for q_id in TARGET_IDS:
         print(f"\n{'='*60}")
         print(f"Q{q_id} 처리 중...")
         
         # PDF에서 추출
-        content = extract_question(pdf_text, q_id)
+        content = extract_question(index, q_id)
         if not content:
             print(f"  ✗ PDF에서 찾을 수 없음")
             failed.append(q_id)
             continue
         
         # HOTSPOT 드롭다운 파싱
-        sentence, options, answer, explanation = parse_hotspot_dropdown(content, q_id)
+        fields = convert_fields(content, q_id)
         
-        if not sentence:
+        if not fields:
             print(f"  ✗ 문장을 찾을 수 없음")
             failed.append(q_id)
             continue
         
-        print(f"  문장: {sentence[:80]}...")
-        print(f"  정답: {answer}")
+        print(f"  문장: {fields['question'][:80]}...")
+        print(f"  정답: {fields['answer']}")
         
-        # JSON에서 해당 문제 찾아서 수정
-        for q in data['questions']:
-            if q['id'] == q_id:
-                # 문장 끝에 빈칸 추가
-                clean_sentence = sentence.strip()
-                if not clean_sentence.endswith('_'):
-                    # 마지막 마침표 제거하고 빈칸 추가
-                    clean_sentence = clean_sentence.rstrip('.')
-                    clean_sentence = clean_sentence + ' _______'
-                
-                q['question'] = clean_sentence
-                q['questionType'] = 'MULTIPLE_CHOICE'
-                q['options'] = options
-                q['answer'] = answer
-                
-                # 해설이 있으면 업데이트
-                if explanation:
-                    q['explanation'] = explanation
-                
-                # dropdowns 제거
-                if 'dropdowns' in q:
-                    del q['dropdowns']
-                
-                converted.append(q_id)
-                print(f"  ✓ MULTIPLE_CHOICE로 변환 완료")
-                break
+        # JSON에서 해당 문제 수정 (dropdowns 제거)
+        if store.update(q_id, fields, remove=['dropdowns']):
+            converted.append(q_id)
+            print(f"  ✓ MULTIPLE_CHOICE로 변환 완료")
     
     # 저장
-    with open('quiz_data.json', 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    store.save()
     
     # 결과 출력
     print(f"\n{'='*60}")
@@ -173,5 +171,6 @@ def convert_all_questions():
     print(f"\n{'='*60}")
 
 if __name__ == "__main__":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
     convert_all_questions()
 
@@ -1,34 +1,39 @@
 """
 Placeholder가 있는 문제들 찾기
+문제은행을 스트리밍으로 한 문제씩 읽으므로 큰 파일도 메모리에 다 올리지 않음
 """
 
-import json
 import sys
 import io
 
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+from quiz_stream import iter_questions
 
-# JSON 로드
-with open('quiz_data.json', 'r', encoding='utf-8') as f:
-    data = json.load(f)
 
-placeholder_questions = []
-
-for q in data['questions']:
+def has_placeholder(q):
     # Dropdown 형식에서 placeholder 확인
     if 'options' in q and q['options']:
         for opt in q['options']:
             if 'PDF 참조' in opt.get('text', '') or 'PDF 이미지' in opt.get('text', ''):
-                placeholder_questions.append(q['id'])
-                break
-    
+                return True
+
     # Checkbox 형식에서 placeholder 확인
     if 'statements' in q and q['statements']:
         for stmt in q['statements']:
             if '이미지로 되어 있어' in str(stmt) or 'PDF 참조' in str(stmt):
-                placeholder_questions.append(q['id'])
-                break
+                return True
+
+    return False
+
+
+def find_placeholder_questions(path='quiz_data.json'):
+    """placeholder가 있는 문제 id 리스트"""
+    return [q['id'] for q in iter_questions(path) if has_placeholder(q)]
+
+
+if __name__ == "__main__":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
-print(f"Placeholder가 있는 문제: {len(placeholder_questions)}개")
-print(f"문제 번호: {sorted(placeholder_questions)}")
+    placeholder_questions = find_placeholder_questions()
 
+    print(f"Placeholder가 있는 문제: {len(placeholder_questions)}개")
+    print(f"문제 번호: {sorted(placeholder_questions)}")
@@ -3,12 +3,13 @@
 PDF에서 실제 내용 추출
 """
 
-import fitz
 import json
 import re
 import sys
 import io
 
+from question_index import QuestionIndex
+
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
 # 문제별 매핑 데이터 (수동으로 확인한 주요 문제들)
@@ -29,20 +30,13 @@ QUESTION_FIXES = {
     }
 }
 
-def load_pdf():
-    """PDF 로드"""
-    pdf = fitz.open("AZ-900 영문 474.pdf")
-    text = ""
-    for page in pdf:
-        text += page.get_text() + "\n"
-    pdf.close()
-    return text
+def load_index():
+    """PDF 문제 구간 인덱스 로드"""
+    return QuestionIndex.from_pdf("AZ-900 영문 474.pdf")
 
-def extract_question_content(pdf_text, q_num):
+def extract_question_content(index, q_num):
     """특정 문제 번호의 내용 추출"""
-    pattern = rf'Question #{q_num}\n(.+?)(?=Question #{q_num + 1}|$)'
-    match = re.search(pattern, pdf_text, re.DOTALL)
-    return match.group(1) if match else None
+    return index.segment(q_num)
 
 def parse_dropdown_from_content(content):
     """Content에서 dropdown 정보 파싱"""
@@ -129,7 +123,7 @@ def extract_sentence_pattern(content):
     
     return "To complete the sentence, select the appropriate option."
 
-def fix_all_placeholders(pdf_text, json_path):
+def fix_all_placeholders(index, json_path):
     """모든 placeholder 문제 수정"""
     
     with open(json_path, 'r', encoding='utf-8') as f:
@@ -154,7 +148,7 @@ def fix_all_placeholders(pdf_text, json_path):
         print(f"Q{q_num} 처리 중...")
         
         # PDF에서 추출
-        content = extract_question_content(pdf_text, q_num)
+        content = extract_question_content(index, q_num)
         if not content:
             print(f"  - PDF에서 찾을 수 없음")
             failed.append(q_num)
@@ -185,10 +179,10 @@ def fix_all_placeholders(pdf_text, json_path):
 
 if __name__ == "__main__":
     print("PDF 로딩 중...")
-    pdf_text = load_pdf()
+    index = load_index()
     
     print("문제 수정 중...")
-    fix_all_placeholders(pdf_text, "quiz_data.json")
+    fix_all_placeholders(index, "quiz_data.json")
     
     print("\n완료!")
 
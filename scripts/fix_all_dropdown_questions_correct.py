@@ -2,13 +2,10 @@
 HOTSPOT 드롭다운 문제들을 PDF에서 제대로 추출해서 수정
 """
 
-import fitz
-import json
-import re
 import sys
 import io
 
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+from quiz_store import QuizPatch, QuizStore
 
 # 각 문제별 올바른 내용 (PDF에서 수동 확인)
 QUESTION_DATA = {
@@ -174,47 +171,49 @@ QUESTION_DATA = {
     }
 }
 
+def build_patch():
+    """QUESTION_DATA를 MULTIPLE_CHOICE 변경 패치로 변환 (dropdowns 제거)"""
+    
+    patch = QuizPatch(source='fix_all_dropdown_questions_correct')
+    
+    for q_id, q_data in QUESTION_DATA.items():
+        # 선택지 생성
+        options = []
+        for i, opt_text in enumerate(q_data['options']):
+            options.append({
+                'letter': chr(65 + i),
+                'text': opt_text
+            })
+        
+        patch.set(q_id, {
+            'question': q_data['question'],
+            'questionType': 'MULTIPLE_CHOICE',
+            'options': options,
+            'answer': q_data['answer']
+        })
+        patch.remove(q_id, 'dropdowns')
+    
+    return patch
+
 def update_all_questions():
     """모든 문제 업데이트"""
     
     print("JSON 로딩 중...")
-    with open('quiz_data.json', 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    store = QuizStore('quiz_data.json')
     
-    updated = []
+    updated, _ = store.apply(build_patch())
     
+    # 저장
+    store.save()
+    
+    # 저장이 끝난 뒤에 문제별 결과 출력
     for q_id, q_data in QUESTION_DATA.items():
-        print(f"\nQ{q_id} 업데이트 중...")
+        print(f"\nQ{q_id}")
         print(f"  문제: {q_data['question'][:80]}...")
-        
-        # JSON에서 해당 문제 찾아서 수정
-        for q in data['questions']:
-            if q['id'] == q_id:
-                q['question'] = q_data['question']
-                q['questionType'] = 'MULTIPLE_CHOICE'
-                
-                # 선택지 생성
-                options = []
-                for i, opt_text in enumerate(q_data['options']):
-                    options.append({
-                        'letter': chr(65 + i),
-                        'text': opt_text
-                    })
-                
-                q['options'] = options
-                q['answer'] = q_data['answer']
-                
-                # dropdowns 제거
-                if 'dropdowns' in q:
-                    del q['dropdowns']
-                
-                updated.append(q_id)
-                print(f"  ✓ 업데이트 완료")
-                break
-    
-    # 저장
-    with open('quiz_data.json', 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+        if q_id in updated:
+            print(f"  ✓ 업데이트 완료")
+        else:
+            print(f"  - 해당 문제 없음")
     
     # 결과 출력
     print(f"\n{'='*60}")
@@ -223,5 +222,6 @@ def update_all_questions():
     print(f"\n{'='*60}")
 
 if __name__ == "__main__":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
     update_all_questions()
 
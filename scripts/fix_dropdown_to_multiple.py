@@ -3,29 +3,23 @@ Placeholder 문제들을 MULTIPLE_CHOICE로 변환
 드롭다운이 앞/뒤에 있는 경우만 처리
 """
 
-import fitz
-import json
 import re
 import sys
 import io
 
+from question_index import QuestionIndex
+from quiz_store import QuizStore
+
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
-def get_pdf_text():
-    """PDF 텍스트 로드"""
+def load_index():
+    """PDF 문제 구간 인덱스 로드"""
     print("PDF 로딩 중...")
-    pdf = fitz.open("AZ-900 영문 474.pdf")
-    text = ""
-    for page in pdf:
-        text += page.get_text() + "\n"
-    pdf.close()
-    return text
+    return QuestionIndex.from_pdf("AZ-900 영문 474.pdf")
 
-def extract_question(pdf_text, q_num):
+def extract_question(index, q_num):
     """특정 문제 추출"""
-    pattern = rf'Question #{q_num}\n(.+?)(?=Question #{q_num + 1}|Topic \d+|$)'
-    match = re.search(pattern, pdf_text, re.DOTALL)
-    return match.group(1) if match else None
+    return index.segment(q_num, stop_at_topic=True)
 
 def analyze_dropdown_position(content):
     """
@@ -149,11 +143,10 @@ def extract_options_from_explanation(content):
 def process_all_questions():
     """모든 문제 처리"""
     
-    pdf_text = get_pdf_text()
+    index = load_index()
     
     print("JSON 로딩 중...")
-    with open('quiz_data.json', 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    store = QuizStore('quiz_data.json')
     
     target_ids = [40, 104, 115, 118, 126, 132, 188, 212, 219, 230, 231, 232, 
                   251, 265, 281, 296, 297, 298, 299, 306, 310, 329, 338, 372, 403]
@@ -170,7 +163,7 @@ def process_all_questions():
         print(f"Q{q_id} 처리 중...")
         
         # PDF에서 추출
-        content = extract_question(pdf_text, q_id)
+        content = extract_question(index, q_id)
         if not content:
             print(f"  ✗ PDF에서 찾을 수 없음")
             failed.append(q_id)
@@ -195,34 +188,30 @@ def process_all_questions():
         options, answer, explanation = extract_options_from_explanation(content)
         
         # JSON에서 해당 문제 찾아서 수정
-        for q in data['questions']:
-            if q['id'] == q_id:
-                # 문장에 빈칸 추가
-                question_text = q.get('question', '')
-                
-                if position == 'front':
-                    question_text = "_______ " + question_text
-                elif position == 'back':
-                    if not question_text.endswith('_'):
-                        question_text = question_text.rstrip() + " _______"
-                
-                q['question'] = question_text
-                q['questionType'] = 'MULTIPLE_CHOICE'
-                q['options'] = options
-                q['answer'] = answer
-                q['explanation'] = explanation[:800] if explanation else q.get('explanation', '')
-                
-                # dropdowns 제거
-                if 'dropdowns' in q:
-                    del q['dropdowns']
-                
-                converted.append(q_id)
-                print(f"  ✓ MULTIPLE_CHOICE로 변환 완료")
-                break
+        q = store.get(q_id)
+        if q is not None:
+            # 문장에 빈칸 추가
+            question_text = q.get('question', '')
+            
+            if position == 'front':
+                question_text = "_______ " + question_text
+            elif position == 'back':
+                if not question_text.endswith('_'):
+                    question_text = question_text.rstrip() + " _______"
+            
+            store.update(q_id, {
+                'question': question_text,
+                'questionType': 'MULTIPLE_CHOICE',
+                'options': options,
+                'answer': answer,
+                'explanation': explanation[:800] if explanation else q.get('explanation', '')
+            }, remove=['dropdowns'])
+            
+            converted.append(q_id)
+            print(f"  ✓ MULTIPLE_CHOICE로 변환 완료")
     
     # 저장
-    with open('quiz_data.json', 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    store.save()
     
     # 결과 출력
     print(f"\n{'='*60}")
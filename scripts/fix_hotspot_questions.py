@@ -2,44 +2,42 @@
 HOTSPOT 문제 재파싱 스크립트
 """
 
-import fitz
 import json
 import re
 import sys
 import io
 
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+import patterns
+import pdf_cache
+from question_index import iter_segments
+
+HOTSPOT_LABEL = re.compile('HOTSPOT', re.IGNORECASE)
 
 def extract_hotspot_questions(pdf_path):
     """HOTSPOT 문제만 추출"""
     
-    pdf = fitz.open(pdf_path)
-    all_text = ""
-    
     print("PDF 읽는 중...")
-    for page_num in range(pdf.page_count):
-        all_text += pdf[page_num].get_text() + "\n"
+    all_text = pdf_cache.get_pdf_text(pdf_path)
     
-    pdf.close()
+    hotspot_questions = extract_hotspot_from_text(all_text)
+    for q in hotspot_questions:
+        print(f"Q{q['id']} - HOTSPOT 파싱 완료")
     
-    # Question #X 패턴으로 분리
-    questions_raw = re.split(r'Question #(\d+)', all_text)
+    return hotspot_questions
+
+
+def extract_hotspot_from_text(all_text):
+    """전체 텍스트에서 HOTSPOT 문제 파싱 (statement가 있는 문제만)"""
     
+    # Question #X 위치로 구간만 나누고 HOTSPOT 구간만 문자열로 만듦
     hotspot_questions = []
     
-    for i in range(1, len(questions_raw), 2):
-        if i + 1 >= len(questions_raw):
-            break
-        
-        q_num = questions_raw[i]
-        q_content = questions_raw[i + 1]
-        
+    for segment in iter_segments(all_text, patterns.QUESTION_HEADER):
         # HOTSPOT 문제만 처리
-        if 'HOTSPOT' in q_content.upper():
-            parsed = parse_hotspot_question(int(q_num), q_content)
+        if HOTSPOT_LABEL.search(segment.text, segment.start, segment.end):
+            parsed = parse_hotspot_question(int(segment.number), str(segment))
             if parsed:
                 hotspot_questions.append(parsed)
-                print(f"Q{q_num} - HOTSPOT 파싱 완료")
     
     return hotspot_questions
 
@@ -174,6 +172,17 @@ def parse_hotspot_answer(answer_text, num_statements):
     return answers if answers else ['Yes'] * num_statements
 
 
+def hotspot_fields(hotspot_data):
+    """파싱된 HOTSPOT 문제 → 기존 문제에 덮어쓸 필드"""
+    fields = {
+        'statements': hotspot_data['statements'],
+        'answer': hotspot_data['answer']
+    }
+    if hotspot_data['question']:
+        fields['question'] = hotspot_data['question']
+    return fields
+
+
 def update_json_with_hotspot(json_path, hotspot_questions):
     """기존 JSON에 HOTSPOT 문제 업데이트"""
     
@@ -187,11 +196,7 @@ def update_json_with_hotspot(json_path, hotspot_questions):
     updated_count = 0
     for q in data['questions']:
         if q['id'] in hotspot_map and q.get('questionType') == 'HOTSPOT':
-            hotspot_data = hotspot_map[q['id']]
-            q['statements'] = hotspot_data['statements']
-            q['answer'] = hotspot_data['answer']
-            if hotspot_data['question']:
-                q['question'] = hotspot_data['question']
+            q.update(hotspot_fields(hotspot_map[q['id']]))
             updated_count += 1
     
     # 저장
@@ -202,6 +207,8 @@ def update_json_with_hotspot(json_path, hotspot_questions):
 
 
 if __name__ == "__main__":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    
     print("=" * 60)
     print("HOTSPOT 문제 재파싱")
     print("=" * 60)
@@ -2,11 +2,10 @@
 Matching 문제 정확하게 수정 (PDF 기반)
 """
 
-import json
 import sys
 import io
 
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+from quiz_store import QuizPatch, QuizStore
 
 # PDF에서 확인한 정확한 내용
 CORRECT_MATCHING = {
@@ -87,39 +86,42 @@ CORRECT_MATCHING = {
     }
 }
 
+def build_patch():
+    """CORRECT_MATCHING을 MATCHING 변경 패치로 변환"""
+    
+    patch = QuizPatch(source='fix_matching_correct')
+    
+    for q_num, q_data in CORRECT_MATCHING.items():
+        # 정확한 데이터 적용
+        patch.set(q_num, {
+            'questionType': 'MATCHING',
+            'question': q_data['question'],
+            'matchingItems': q_data['items'],
+            'options': []
+        })
+        # 기존 필드 정리
+        patch.remove(q_num, 'statements')
+    
+    return patch
+
 def fix_matching_questions():
     """Matching 문제 정확하게 수정"""
     
     print("JSON 로딩 중...")
-    with open('quiz_data.json', 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    store = QuizStore('quiz_data.json')
     
-    for q in data['questions']:
-        if q['id'] in CORRECT_MATCHING:
-            q_num = q['id']
-            
-            print(f"Q{q_num} 수정 중...")
-            
-            # 정확한 데이터 적용
-            q['questionType'] = 'MATCHING'
-            q['question'] = CORRECT_MATCHING[q_num]['question']
-            q['matchingItems'] = CORRECT_MATCHING[q_num]['items']
-            
-            # 기존 필드 정리
-            if 'statements' in q:
-                del q['statements']
-            q['options'] = []
-            
-            print(f"  ✓ Q{q_num} 수정 완료")
+    updated, _ = store.apply(build_patch())
+    for q_num in updated:
+        print(f"  ✓ Q{q_num} 수정 완료")
     
     # 저장
-    with open('quiz_data.json', 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    store.save()
     
     print("\n" + "="*60)
     print("모든 MATCHING 문제 정확하게 수정 완료!")
     print("="*60)
 
 if __name__ == "__main__":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
     fix_matching_questions()
 
@@ -2,28 +2,22 @@
 82, 187, 249번 문제를 MATCHING 형식으로 수정
 """
 
-import fitz
 import json
 import re
 import sys
 import io
 
+from question_index import QuestionIndex
+
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
-def get_pdf_text():
-    """PDF 텍스트 로드"""
-    pdf = fitz.open("AZ-900 영문 474.pdf")
-    text = ""
-    for page in pdf:
-        text += page.get_text() + "\n"
-    pdf.close()
-    return text
+def load_index():
+    """PDF 문제 구간 인덱스 로드"""
+    return QuestionIndex.from_pdf("AZ-900 영문 474.pdf")
 
-def extract_question(pdf_text, q_num):
+def extract_question(index, q_num):
     """특정 문제 추출"""
-    pattern = rf'Question #{q_num}\n(.+?)(?=Question #{q_num + 1}|$)'
-    match = re.search(pattern, pdf_text, re.DOTALL)
-    return match.group(1) if match else None
+    return index.segment(q_num)
 
 # 문제별 데이터 (PDF에서 확인 필요)
 MATCHING_QUESTIONS = {
@@ -82,7 +76,7 @@ def fix_matching_questions():
         data = json.load(f)
     
     print("PDF 로딩 중...")
-    pdf_text = get_pdf_text()
+    index = load_index()
     
     for q in data['questions']:
         if q['id'] in MATCHING_QUESTIONS:
@@ -91,7 +85,7 @@ def fix_matching_questions():
             print(f"\nQ{q_num} 처리 중...")
             
             # PDF에서 추출
-            content = extract_question(pdf_text, q_num)
+            content = extract_question(index, q_num)
             
             # 기본 데이터 적용
             q['questionType'] = 'MATCHING'
@@ -2,29 +2,25 @@
 변환된 문제들의 선택지를 PDF에서 실제로 추출해서 업데이트
 """
 
-import fitz
-import json
-import re
 import sys
 import io
 
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+import patterns
+from question_index import QuestionIndex
+from quiz_store import QuizStore
 
-def get_pdf_text():
-    """PDF 텍스트 로드"""
+# 변환된 문제들
+TARGET_IDS = [104, 115, 118, 126, 132, 212, 219, 230, 231, 232,
+              251, 265, 296, 297, 298, 299, 306, 310, 329, 338, 372]
+
+def load_index():
+    """PDF 문제 구간 인덱스 로드"""
     print("PDF 로딩 중...")
-    pdf = fitz.open("AZ-900 영문 474.pdf")
-    text = ""
-    for page in pdf:
-        text += page.get_text() + "\n"
-    pdf.close()
-    return text
+    return QuestionIndex.from_pdf("AZ-900 영문 474.pdf")
 
-def extract_question(pdf_text, q_num):
+def extract_question(index, q_num):
     """특정 문제 추출"""
-    pattern = rf'Question #{q_num}\n(.+?)(?=Question #{q_num + 1}|Topic \d+|$)'
-    match = re.search(pattern, pdf_text, re.DOTALL)
-    return match.group(1) if match else None
+    return index.segment(q_num, stop_at_topic=True)
 
 def extract_dropdown_options(content):
     """
@@ -33,7 +29,7 @@ def extract_dropdown_options(content):
     """
     
     # Correct Answer 추출
-    answer_match = re.search(r'Correct Answer:\s*([A-D])', content)
+    answer_match = patterns.CORRECT_ANSWER_LETTER.search(content)
     answer_letter = answer_match.group(1) if answer_match else 'A'
     
     lines = [l.strip() for l in content.split('\n') if l.strip()]
@@ -108,25 +104,20 @@ def extract_dropdown_options(content):
 def update_all_options():
     """모든 변환된 문제의 선택지 업데이트"""
     
-    pdf_text = get_pdf_text()
+    index = load_index()
     
     print("JSON 로딩 중...")
-    with open('quiz_data.json', 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    # 변환된 문제들
-    target_ids = [104, 115, 118, 126, 132, 212, 219, 230, 231, 232, 
-                  251, 265, 296, 297, 298, 299, 306, 310, 329, 338, 372]
+    store = QuizStore('quiz_data.json')
     
     updated = []
     failed = []
     
-    for q_id in target_ids:
+    for q_id in TARGET_IDS:
         print(f"\n{'='*60}")
         print(f"Q{q_id} 처리 중...")
         
         # PDF에서 추출
-        content = extract_question(pdf_text, q_id)
+        content = extract_question(index, q_id)
         if not content:
             print(f"  ✗ PDF에서 찾을 수 없음")
             failed.append(q_id)
@@ -140,19 +131,13 @@ def update_all_options():
             print(f"    {opt['letter']}. {opt['text'][:60]}...")
         print(f"  정답: {answer}")
         
-        # JSON에서 해당 문제 찾아서 업데이트
-        for q in data['questions']:
-            if q['id'] == q_id:
-                q['options'] = options
-                q['answer'] = answer
-                
-                updated.append(q_id)
-                print(f"  ✓ 선택지 업데이트 완료")
-                break
+        # JSON에서 해당 문제 업데이트
+        if store.update(q_id, {'options': options, 'answer': answer}):
+            updated.append(q_id)
+            print(f"  ✓ 선택지 업데이트 완료")
     
     # 저장
-    with open('quiz_data.json', 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    store.save()
     
     # 결과 출력
     print(f"\n{'='*60}")
@@ -165,5 +150,6 @@ def update_all_options():
     print(f"\n{'='*60}")
 
 if __name__ == "__main__":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
     update_all_options()
 
@@ -2,23 +2,19 @@
 365번 문제 간단하게 수정
 """
 
-import json
 import sys
 import io
 
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+from quiz_store import QuizPatch, QuizStore
 
-# JSON 로드
-with open('quiz_data.json', 'r', encoding='utf-8') as f:
-    data = json.load(f)
-
-# 365번 문제 찾기
-for q in data['questions']:
-    if q['id'] == 365:
-        q['questionType'] = 'MATCHING'
-        q['question'] = 'How should you calculate the monthly uptime percentage?\n\nFormula: A / B × C\n\nTo answer, select the appropriate options for A, B, and C.\n\nNOTE: Each correct selection is worth one point.'
-        
-        q['matchingItems'] = [
+def build_patch():
+    """365번 문제 MATCHING 변환 패치"""
+    
+    patch = QuizPatch(source='fix_q365_simple')
+    patch.set(365, {
+        'questionType': 'MATCHING',
+        'question': 'How should you calculate the monthly uptime percentage?\n\nFormula: A / B × C\n\nTo answer, select the appropriate options for A, B, and C.\n\nNOTE: Each correct selection is worth one point.',
+        'matchingItems': [
             {
                 'item': 'A',
                 'options': [
@@ -46,21 +42,23 @@ for q in data['questions']:
                 ],
                 'answer': '100'
             }
-        ]
-        
-        q['explanation'] = 'Monthly Uptime % = (Maximum Available Minutes - Downtime in Minutes) / Maximum Available Minutes × 100\n\nA = (Maximum Available Minutes - Downtime in Minutes)\nB = Maximum Available Minutes\nC = 100'
-        
-        # 기존 필드 정리
-        if 'statements' in q:
-            del q['statements']
-        q['options'] = []
-        
-        print("365번 문제 수정 완료!")
-        break
-
-# 저장
-with open('quiz_data.json', 'w', encoding='utf-8') as f:
-    json.dump(data, f, ensure_ascii=False, indent=2)
-
-print("저장 완료!")
+        ],
+        'explanation': 'Monthly Uptime % = (Maximum Available Minutes - Downtime in Minutes) / Maximum Available Minutes × 100\n\nA = (Maximum Available Minutes - Downtime in Minutes)\nB = Maximum Available Minutes\nC = 100',
+        'options': []
+    })
+    # 기존 필드 정리
+    patch.remove(365, 'statements')
+    return patch
 
+if __name__ == "__main__":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    
+    store = QuizStore('quiz_data.json')
+    updated, _ = store.apply(build_patch())
+    if updated:
+        print("365번 문제 수정 완료!")
+    
+    # 저장
+    store.save()
+    
+    print("저장 완료!")
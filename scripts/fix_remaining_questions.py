@@ -3,29 +3,23 @@
 개선된 파싱 로직
 """
 
-import fitz
 import json
 import re
 import sys
 import io
 
+from question_index import QuestionIndex
+
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
-def get_pdf_text():
-    """PDF 텍스트 로드"""
+def load_index():
+    """PDF 문제 구간 인덱스 로드"""
     print("PDF 로딩 중...")
-    pdf = fitz.open("AZ-900 영문 474.pdf")
-    text = ""
-    for page in pdf:
-        text += page.get_text() + "\n"
-    pdf.close()
-    return text
+    return QuestionIndex.from_pdf("AZ-900 영문 474.pdf")
 
-def extract_question(pdf_text, q_num):
+def extract_question(index, q_num):
     """특정 문제 추출"""
-    pattern = rf'Question #{q_num}\n(.+?)(?=Question #{q_num + 1}|Topic \d+|$)'
-    match = re.search(pattern, pdf_text, re.DOTALL)
-    return match.group(1) if match else None
+    return index.segment(q_num, stop_at_topic=True)
 
 def smart_parse_dropdown(content, q_num):
     """개선된 dropdown 파싱"""
@@ -116,7 +110,7 @@ def extract_options_from_text(text):
 def fix_all_remaining():
     """남은 모든 문제 수정"""
     
-    pdf_text = get_pdf_text()
+    index = load_index()
     
     print("JSON 로딩 중...")
     with open('quiz_data.json', 'r', encoding='utf-8') as f:
@@ -140,7 +134,7 @@ def fix_all_remaining():
         print(f"Q{q_num} 처리 중...")
         
         # PDF에서 추출
-        content = extract_question(pdf_text, q_num)
+        content = extract_question(index, q_num)
         if not content:
             print(f"  - PDF에서 찾을 수 없음")
             continue
@@ -0,0 +1,328 @@
+"""
+문제은행 수정 규칙 파이프라인
+흩어져 있던 fix_*.py 수정을 규칙(선택 조건 + 변환 + 출처)으로 등록해 두고
+문제은행을 한 번 읽고, 모든 문제를 한 번 훑으면서 규칙을 순서대로 적용한 뒤, 한 번 저장
+
+규칙 순서 (order, name 순으로 항상 같음) = 예전에 스크립트를 돌리던 순서:
+     5 hotspot_classify       process_hotspot_questions       아직 처리 안 된 HOTSPOT/HOT_AREA 분류 + 파싱
+     7 hotspot_improve        improve_hotspot_extraction      placeholder statements/선택지를 해설에서 채움
+    10 hotspot_reparse        fix_hotspot_questions           PDF에서 HOTSPOT 문항/정답 재파싱
+    20 dropdown_to_choice     convert_to_multiple_choice      드롭다운 placeholder → MULTIPLE_CHOICE
+    30 dropdown_options       fix_options_from_pdf            PDF Answer Area에서 선택지 추출
+    40 dropdown_manual        fix_all_dropdown_questions_correct  수동 확인한 드롭다운 문제
+    50 matching_manual        fix_matching_correct            수동 확인한 MATCHING 문제
+    60 q36 / q46_matching / q50 / q365_simple / q365_division_sign  개별 문제 수정
+
+사용법:
+    python fix_rules.py [quiz_data.json] [--out=파일] [--only=q36,q50] [--dry-run]
+    python fix_rules.py --rebuild [--out=quiz_data.json]   # PDF 새로 파싱 + 전체 규칙 적용
+    python fix_rules.py --list
+    --pdf=경로 로 PDF 지정 (기본: pdf_cache.DEFAULT_PDF), --json 이면 규칙별 수정 id 목록도 출력
+"""
+
+import copy
+import json
+import sys
+import time
+
+import pdf_cache
+import convert_to_multiple_choice
+import fix_all_dropdown_questions_correct
+import fix_hotspot_questions
+import fix_matching_correct
+import fix_options_from_pdf
+import fix_q36
+import fix_q46_matching
+import fix_q50
+import fix_q365_division_sign
+import fix_q365_simple
+import improve_hotspot_extraction
+import process_hotspot_questions
+from question_index import QuestionIndex
+from quiz_store import QuizStore
+
+
+class Rule:
+    """
+    수정 규칙 하나
+    select(q, ctx) → 적용 대상이면 True
+    transform(q, ctx) → {"set": {...}, "remove": [...]} (QuizPatch 항목과 같은 형식) 또는 None(변경 없음)
+    """
+
+    def __init__(self, name, source, select, transform, order=100):
+        self.name = name
+        self.source = source
+        self.select = select
+        self.transform = transform
+        self.order = order
+
+    def __repr__(self):
+        return f"Rule({self.name!r}, source={self.source!r}, order={self.order})"
+
+
+RULES = {}
+
+
+def register(rule):
+    """규칙 등록 (같은 이름이면 ValueError)"""
+    if rule.name in RULES:
+        raise ValueError(f"규칙 이름 중복: {rule.name}")
+    RULES[rule.name] = rule
+    return rule
+
+
+def ordered_rules(only=None):
+    """적용 순서대로 정렬된 규칙 리스트 (only: 이름 목록으로 제한)"""
+    if only:
+        unknown = [name for name in only if name not in RULES]
+        if unknown:
+            raise KeyError(f"등록되지 않은 규칙: {unknown}")
+        rules = [RULES[name] for name in only]
+    else:
+        rules = list(RULES.values())
+    return sorted(rules, key=lambda rule: (rule.order, rule.name))
+
+
+def select_ids(ids):
+    """id가 ids 안에 있는 문제 선택"""
+    ids = frozenset(ids)
+    return lambda q, ctx: q.get('id') in ids
+
+
+def patch_rule(name, patch, order):
+    """QuizPatch를 규칙으로 등록 (패치에 있는 id만 선택, 출처는 patch.source)"""
+    changes = dict(patch.items())
+    return register(Rule(name, patch.source, select_ids(changes),
+                         lambda q, ctx: copy.deepcopy(changes[q['id']]), order))
+
+
+class RuleContext:
+    """
+    규칙이 공유하는 PDF 데이터 (필요할 때 한 번만 로드)
+    index: PDF 문제 구간 인덱스 (미리 만든 QuestionIndex를 넘기면 PDF를 읽지 않음)
+    """
+
+    def __init__(self, pdf_path=pdf_cache.DEFAULT_PDF, index=None):
+        self.pdf_path = pdf_path
+        self._index = index
+        self._hotspot = None
+
+    @property
+    def index(self):
+        if self._index is None:
+            self._index = QuestionIndex.from_pdf(self.pdf_path)
+        return self._index
+
+    @property
+    def hotspot(self):
+        """문제 번호 → 재파싱한 HOTSPOT 데이터"""
+        if self._hotspot is None:
+            parsed = fix_hotspot_questions.extract_hotspot_from_text(self.index.text)
+            self._hotspot = {q['id']: q for q in parsed}
+        return self._hotspot
+
+    def segment(self, q_id):
+        return self.index.segment(q_id, stop_at_topic=True)
+
+
+# ---------------------------------------------------------------------------
+# PDF 기반 규칙
+# ---------------------------------------------------------------------------
+
+def _unprocessed_hotspot(q, ctx):
+    """
+    parse_pdf_v2가 만든 그대로인 HOTSPOT/HOT_AREA (statements도 선택지도 없음)
+    process_hotspot_questions 스크립트는 모든 HOTSPOT을 다시 파싱하지만, 규칙은 이미 고친 문제를
+    placeholder로 되돌리지 않도록 아직 처리 안 된 문제만 선택
+    """
+    return (q.get('questionType') in ('HOTSPOT', 'HOT_AREA')
+            and q['id'] not in process_hotspot_questions.EXCLUDE_IDS
+            and not q.get('statements') and not q.get('options'))
+
+
+def _hotspot_classify_transform(q, ctx):
+    content = ctx.index.segment(q['id'])
+    if not content:
+        return None
+    _, parsed = process_hotspot_questions.classify_and_parse(q['id'], content)
+    if not parsed:
+        return None
+    return {"set": parsed, "remove": []}
+
+
+def _hotspot_improve_transform(q, ctx):
+    content = ctx.index.segment(q['id'])
+    if not content:
+        return None
+    improved = improve_hotspot_extraction.improve_single_question(q['id'], content)
+    if not improved:
+        return None
+    return {"set": improved, "remove": []}
+
+
+def _hotspot_transform(q, ctx):
+    return {"set": fix_hotspot_questions.hotspot_fields(ctx.hotspot[q['id']]), "remove": []}
+
+
+def _dropdown_to_choice_transform(q, ctx):
+    content = ctx.segment(q['id'])
+    if not content:
+        return None
+    fields = convert_to_multiple_choice.convert_fields(content, q['id'])
+    if not fields:
+        return None
+    return {"set": fields, "remove": ['dropdowns']}
+
+
+def _dropdown_options_transform(q, ctx):
+    content = ctx.segment(q['id'])
+    if not content:
+        return None
+    options, answer = fix_options_from_pdf.extract_dropdown_options(content)
+    return {"set": {'options': options, 'answer': answer}, "remove": []}
+
+
+register(Rule("hotspot_classify", "process_hotspot_questions",
+              _unprocessed_hotspot, _hotspot_classify_transform, order=5))
+register(Rule("hotspot_improve", "improve_hotspot_extraction",
+              lambda q, ctx: improve_hotspot_extraction.needs_improvement(q),
+              _hotspot_improve_transform, order=7))
+register(Rule("hotspot_reparse", "fix_hotspot_questions",
+              lambda q, ctx: q.get('questionType') == 'HOTSPOT' and q['id'] in ctx.hotspot,
+              _hotspot_transform, order=10))
+register(Rule("dropdown_to_choice", "convert_to_multiple_choice",
+              select_ids(convert_to_multiple_choice.TARGET_IDS),
+              _dropdown_to_choice_transform, order=20))
+register(Rule("dropdown_options", "fix_options_from_pdf",
+              select_ids(fix_options_from_pdf.TARGET_IDS),
+              _dropdown_options_transform, order=30))
+
+# ---------------------------------------------------------------------------
+# 수동 확인 데이터 규칙
+# ---------------------------------------------------------------------------
+
+patch_rule("dropdown_manual", fix_all_dropdown_questions_correct.build_patch(), order=40)
+patch_rule("matching_manual", fix_matching_correct.build_patch(), order=50)
+patch_rule("q36", fix_q36.build_patch(), order=60)
+patch_rule("q46_matching", fix_q46_matching.build_patch(), order=61)
+patch_rule("q50", fix_q50.build_patch(), order=62)
+patch_rule("q365_simple", fix_q365_simple.build_patch(), order=63)
+patch_rule("q365_division_sign", fix_q365_division_sign.build_patch(), order=64)
+
+
+# ---------------------------------------------------------------------------
+# 실행
+# ---------------------------------------------------------------------------
+
+def apply_rules(questions, ctx, rules=None):
+    """
+    문제 리스트에 규칙을 한 번의 순회로 적용 (제자리 수정)
+    문제마다 규칙을 순서대로 적용하므로 앞 규칙의 결과를 뒤 규칙이 봄
+    반환: 규칙 이름 → {"matched", "changed", "ids", "seconds"}
+    """
+    rules = ordered_rules() if rules is None else rules
+    stats = {rule.name: {"matched": 0, "changed": 0, "ids": [], "seconds": 0.0} for rule in rules}
+    clock = time.perf_counter
+
+    for q in questions:
+        for rule in rules:
+            stat = stats[rule.name]
+            start = clock()
+            if rule.select(q, ctx):
+                stat["matched"] += 1
+                change = rule.transform(q, ctx)
+                if change:
+                    q.update(change["set"])
+                    for key in change["remove"]:
+                        q.pop(key, None)
+                    stat["changed"] += 1
+                    stat["ids"].append(q['id'])
+            stat["seconds"] += clock() - start
+
+    return stats
+
+
+def rebuild_data(pdf_path=pdf_cache.DEFAULT_PDF, image_folder="images"):
+    """PDF를 새로 파싱한 문제은행 dict (parse_pdf_v2와 같은 형식)"""
+    import parse_pdf_v2
+
+    questions = list(parse_pdf_v2.iter_questions(pdf_path, image_folder))
+    return {
+        "title": "AZ-900 Azure Fundamentals",
+        "description": f"Microsoft Azure Fundamentals - {len(questions)} Questions",
+        "totalQuestions": len(questions),
+        "questions": questions
+    }
+
+
+def run(json_path="quiz_data.json", out_path=None, only=None, dry_run=False,
+        pdf_path=pdf_cache.DEFAULT_PDF, rebuild=False, ctx=None):
+    """
+    한 번 로드 → 규칙 적용 → 한 번 저장
+    rebuild=True면 json_path를 읽지 않고 PDF를 새로 파싱해서 시작 (결과는 out_path 또는 json_path에 저장)
+    반환: (규칙 리스트, 규칙별 통계, 단계별 시간)
+    """
+    ctx = ctx or RuleContext(pdf_path)
+    rules = ordered_rules(only)
+    timings = {}
+
+    start = time.perf_counter()
+    if rebuild:
+        store = QuizStore.from_data(rebuild_data(pdf_path), json_path)
+    else:
+        store = QuizStore(json_path)
+    timings["load"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    stats = apply_rules(store.questions, ctx, rules)
+    timings["rules"] = time.perf_counter() - start
+
+    if not dry_run:
+        start = time.perf_counter()
+        store.save(out_path)
+        timings["save"] = time.perf_counter() - start
+
+    return rules, stats, timings
+
+
+def print_report(rules, stats, timings):
+    print(f"{'규칙':<20} {'출처':<36} {'대상':>5} {'수정':>5} {'시간(ms)':>10}")
+    for rule in rules:
+        stat = stats[rule.name]
+        print(f"{rule.name:<20} {rule.source:<36} {stat['matched']:>5} {stat['changed']:>5} "
+              f"{stat['seconds'] * 1000:>10.2f}")
+    print(" / ".join(f"{step} {seconds:.2f}초" for step, seconds in timings.items()))
+
+
+def _option(name, default=None):
+    prefix = f"--{name}="
+    for arg in sys.argv[1:]:
+        if arg.startswith(prefix):
+            return arg[len(prefix):]
+    return default
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    if "--list" in sys.argv:
+        for rule in ordered_rules():
+            print(f"{rule.order:>3} {rule.name:<20} {rule.source}")
+        sys.exit(0)
+
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    json_file = args[0] if args else "quiz_data.json"
+    only = _option("only")
+
+    rules, stats, timings = run(
+        json_file,
+        out_path=_option("out"),
+        only=only.split(",") if only else None,
+        dry_run="--dry-run" in sys.argv,
+        pdf_path=_option("pdf", pdf_cache.DEFAULT_PDF),
+        rebuild="--rebuild" in sys.argv
+    )
+    print_report(rules, stats, timings)
+    if "--json" in sys.argv:
+        json.dump({name: stat["ids"] for name, stat in stats.items()}, sys.stdout, ensure_ascii=False, indent=2)
+        print()
@@ -0,0 +1,53 @@
+"""
+내용 주소(content-addressed) 이미지 저장소
+같은 이미지는 해시 기준으로 한 번만 기록하고, 문서 내 xref → 해시 매핑으로 재추출도 생략
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+
+class ImageStore:
+    """images/store/<sha256>.<ext> 형태로 저장하는 이미지 저장소"""
+
+    def __init__(self, image_folder="images", subfolder="store"):
+        self.folder = Path(image_folder) / subfolder
+        self.folder.mkdir(parents=True, exist_ok=True)
+        self.prefix = f"{image_folder}/{subfolder}"
+        self._xref_map = {}      # xref → 상대 경로 (문서 하나 단위)
+        self._written = set()    # 이번 실행에서 확인한 해시
+        self.stats = {"written": 0, "deduplicated": 0, "xref_hits": 0}
+
+    def reset_document(self):
+        """다른 PDF를 처리하기 전에 xref 매핑 초기화 (xref는 문서마다 다름)"""
+        self._xref_map.clear()
+
+    def put_bytes(self, image_bytes, ext):
+        """이미지 bytes 저장 후 상대 경로 반환 (이미 있으면 쓰지 않음)"""
+        digest = hashlib.sha256(image_bytes).hexdigest()
+        filename = f"{digest}.{ext}"
+
+        if digest in self._written or (self.folder / filename).exists():
+            self.stats["deduplicated"] += 1
+        else:
+            tmp_path = self.folder / (filename + ".tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(image_bytes)
+            os.replace(tmp_path, self.folder / filename)
+            self.stats["written"] += 1
+
+        self._written.add(digest)
+        return f"{self.prefix}/{filename}"
+
+    def put_xref(self, pdf, xref):
+        """PDF xref 이미지 저장 (같은 xref는 추출/해시 없이 바로 경로 반환)"""
+        path = self._xref_map.get(xref)
+        if path is not None:
+            self.stats["xref_hits"] += 1
+            return path
+
+        base_image = pdf.extract_image(xref)
+        path = self.put_bytes(base_image["image"], base_image["ext"])
+        self._xref_map[xref] = path
+        return path
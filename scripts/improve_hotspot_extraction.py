@@ -2,13 +2,12 @@
 HOTSPOT 문제 개선 - 해설에서 statements 추출
 """
 
-import fitz
 import json
-import re
 import sys
 import io
 
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+import patterns
+from question_index import QuestionIndex
 
 EXCLUDE_IDS = [97, 109, 112, 168, 199, 215, 276, 328]
 
@@ -22,8 +21,7 @@ def extract_statements_from_explanation(content):
     answers = []
     
     # Box 패턴 찾기
-    box_pattern = r'Box (\d+):\s*(Yes|No)\s*-\s*(.+?)(?=Box \d+:|References?:|Topic|$)'
-    matches = re.findall(box_pattern, content, re.DOTALL | re.IGNORECASE)
+    matches = patterns.BOX_STATEMENT.findall(content)
     
     for box_num, answer, explanation in matches:
         # 해설의 첫 문장을 statement로 사용
@@ -31,7 +29,7 @@ def extract_statements_from_explanation(content):
         explanation = explanation.strip()
         
         # 첫 문장만 추출 (마침표까지)
-        first_sentence = re.split(r'[.!?]\s+', explanation)[0]
+        first_sentence = patterns.SENTENCE_END.split(explanation, 1)[0]
         if first_sentence:
             first_sentence = first_sentence[:200]  # 최대 200자
         else:
@@ -52,7 +50,7 @@ def extract_dropdown_options(content):
     # 예: "in a private cloud", "in a hybrid cloud", "in the public cloud"
     
     # Correct Answer 찾기
-    answer_match = re.search(r'Correct Answer:\s*(.+?)(?=\n\n|References?:|Topic|$)', content, re.DOTALL)
+    answer_match = patterns.CORRECT_ANSWER_SECTION.search(content)
     if not answer_match:
         return None, None
     
@@ -63,15 +61,9 @@ def extract_dropdown_options(content):
     
     # 해설에서 옵션들 찾기
     # 일반적인 패턴들
-    options_patterns = [
-        r'(in (?:a|the) (?:private|public|hybrid) cloud)',
-        r'(on (?:a|the) .+? host)',
-        r'(Software|Platform|Infrastructure) as a Service',
-    ]
-    
     found_options = set()
-    for pattern in options_patterns:
-        matches = re.findall(pattern, content, re.IGNORECASE)
+    for pattern in patterns.DROPDOWN_OPTION_PATTERNS:
+        matches = pattern.findall(content)
         for match in matches:
             if isinstance(match, tuple):
                 match = match[0]
@@ -91,17 +83,17 @@ def extract_dropdown_options(content):
 def improve_single_question(q_id, content):
     """단일 문제 개선"""
     
-    content_upper = content.upper()
+    hits = patterns.scan_segment(content)
     
     # Checkbox 형식
-    if any(kw in content_upper for kw in ['BOX 1:', 'BOX 2:', 'BOX 3:']):
-        if 'SELECT YES IF' in content_upper or 'SELECT NO IF' in content_upper:
+    if any(kw in hits for kw in ['BOX 1:', 'BOX 2:', 'BOX 3:']):
+        if 'SELECT YES IF' in hits or 'SELECT NO IF' in hits:
             statements, answers = extract_statements_from_explanation(content)
             
             if statements and len(statements) == len(answers):
                 # 해설 전체
                 explanation = ""
-                exp_match = re.search(r'(Box 1:.+?)(?=References?:|Topic|$)', content, re.DOTALL | re.IGNORECASE)
+                exp_match = patterns.BOX_EXPLANATION.search(content)
                 if exp_match:
                     explanation = exp_match.group(1).strip()[:1000]
                 
@@ -114,18 +106,17 @@ def improve_single_question(q_id, content):
                 }
     
     # Dropdown 형식
-    if 'TO COMPLETE THE SENTENCE' in content_upper or 'SELECT THE APPROPRIATE OPTION' in content_upper:
+    if 'TO COMPLETE THE SENTENCE' in hits or 'SELECT THE APPROPRIATE OPTION' in hits:
         options, answer = extract_dropdown_options(content)
         
         if options:
             # 문장 패턴 찾기
-            sentence_pattern = r'(An? .+?_+.+?\.)'
-            sentence_match = re.search(sentence_pattern, content)
+            sentence_match = patterns.BLANK_SENTENCE.search(content)
             
             question = sentence_match.group(1) if sentence_match else "To complete the sentence, select the appropriate option in the answer area."
             
             # 해설
-            exp_match = re.search(r'Correct Answer:(.+?)(?=References?:|Topic|$)', content, re.DOTALL)
+            exp_match = patterns.CORRECT_ANSWER_EXPLANATION.search(content)
             explanation = exp_match.group(1).strip()[:1000] if exp_match else ""
             
             return {
@@ -138,35 +129,30 @@ def improve_single_question(q_id, content):
     
     return None
 
+def needs_improvement(q):
+    """개선 대상: placeholder statements/options가 남은 HOTSPOT/HOT_AREA 문제"""
+    if q['id'] in EXCLUDE_IDS or q.get('questionType') not in ['HOTSPOT', 'HOT_AREA']:
+        return False
+    # statements가 placeholder인 경우
+    if 'statements' in q:
+        return any('이미지로 되어 있어' in str(s) for s in q.get('statements', []))
+    # options가 placeholder인 경우
+    if 'options' in q:
+        return any('PDF 참조' in str(opt.get('text', '')) for opt in q.get('options', []))
+    return False
+
 def improve_all_questions(pdf_path, json_path):
     """모든 HOTSPOT 문제 개선"""
     
     print("PDF 로딩 중...")
-    pdf = fitz.open(pdf_path)
-    pdf_text = ""
-    for page in pdf:
-        pdf_text += page.get_text() + "\n"
-    pdf.close()
+    index = QuestionIndex.from_pdf(pdf_path)
     
     print("JSON 로딩 중...")
     with open(json_path, 'r', encoding='utf-8') as f:
         data = json.load(f)
     
     # 개선 대상 찾기
-    targets = []
-    for q in data['questions']:
-        if q['id'] in EXCLUDE_IDS:
-            continue
-        
-        if q.get('questionType') in ['HOTSPOT', 'HOT_AREA']:
-            # statements가 placeholder인 경우
-            if 'statements' in q:
-                if any('이미지로 되어 있어' in str(s) for s in q.get('statements', [])):
-                    targets.append(q)
-            # options가 placeholder인 경우
-            elif 'options' in q:
-                if any('PDF 참조' in str(opt.get('text', '')) for opt in q.get('options', [])):
-                    targets.append(q)
+    targets = [q for q in data['questions'] if needs_improvement(q)]
     
     print(f"개선 대상: {len(targets)}개")
     
@@ -176,19 +162,12 @@ def improve_all_questions(pdf_path, json_path):
         q_num = q['id']
         
         # PDF에서 추출
-        pattern = rf'Question #{q_num}\n(.+?)Question #{q_num + 1}'
-        match = re.search(pattern, pdf_text, re.DOTALL)
-        
-        if not match:
-            pattern = rf'Question #{q_num}\n(.+?)$'
-            match = re.search(pattern, pdf_text, re.DOTALL)
+        content = index.segment(q_num)
         
-        if not match:
+        if not content:
             print(f"Q{q_num}: PDF에서 찾을 수 없음")
             continue
         
-        content = match.group(1)
-        
         # 개선
         improved = improve_single_question(q_num, content)
         
@@ -206,5 +185,6 @@ def improve_all_questions(pdf_path, json_path):
     print(f"\n총 {improved_count}개 문제 개선 완료!")
 
 if __name__ == "__main__":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
     improve_all_questions("AZ-900 영문 474.pdf", "quiz_data.json")
 
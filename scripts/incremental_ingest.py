@@ -0,0 +1,143 @@
+"""
+PDF 개정판 증분 반영 스크립트
+페이지/문제 구간 지문(fingerprint)을 이전 실행의 manifest와 비교해서
+원문이 바뀐 문제만 다시 파싱하고, 바뀌지 않은 문제는 기존 레코드(수동 수정 포함)를 그대로 유지
+"""
+
+import hashlib
+import json
+import os
+import sys
+
+import pdf_cache
+from question_index import QuestionIndex
+from parse_pdf_v2 import parse_single_question
+
+MANIFEST_PATH = "ingest_manifest.json"
+
+
+def fingerprint(text):
+    """텍스트 지문 (SHA-1)"""
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def build_manifest(pdf_path, pages, index):
+    """현재 PDF의 페이지/문제 지문 manifest 생성"""
+    return {
+        "source": os.path.basename(pdf_path),
+        "sourceHash": pdf_cache.pdf_hash(pdf_path),
+        "pages": [fingerprint(page) for page in pages],
+        "questions": {
+            str(q_num): fingerprint(index.segment(q_num))
+            for q_num in index.numbers()
+        }
+    }
+
+
+def load_manifest(manifest_path=MANIFEST_PATH):
+    if not os.path.exists(manifest_path):
+        return None
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_json(path, data):
+    """임시 파일에 쓴 뒤 교체"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def incremental_ingest(pdf_path, json_path="quiz_data.json", manifest_path=MANIFEST_PATH,
+                       image_folder="images"):
+    """
+    변경된 문제만 다시 파싱해서 json_path에 반영
+
+    이전 manifest가 없으면 현재 PDF를 기준선으로 기록만 하고 문제는 건드리지 않음
+    반환: {"added": [...], "changed": [...], "removed": [...]} (기준선 기록 시 None)
+    """
+    pages = pdf_cache.load_pages(pdf_path)
+    index = QuestionIndex.from_pages(pages)
+    manifest = build_manifest(pdf_path, pages, index)
+    previous = load_manifest(manifest_path)
+
+    if previous is None:
+        save_json(manifest_path, manifest)
+        print(f"[기준선] manifest 생성: {manifest_path} ({len(index)}개 문제)")
+        return None
+
+    if previous.get("sourceHash") == manifest["sourceHash"]:
+        print("[변경 없음] PDF가 이전 실행과 동일합니다.")
+        return {"added": [], "changed": [], "removed": []}
+
+    # 페이지 단위 변경 보고
+    old_pages = previous.get("pages", [])
+    changed_pages = [
+        page_num + 1 for page_num, fp in enumerate(manifest["pages"])
+        if page_num >= len(old_pages) or old_pages[page_num] != fp
+    ]
+    print(f"변경된 페이지: {len(changed_pages)}개 / 전체 {len(pages)}개")
+
+    with open(json_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    existing = {q['id']: q for q in data['questions']}
+    old_questions = previous.get("questions", {})
+
+    added = []
+    changed = []
+    questions = []
+
+    for q_num in index.numbers():
+        key = str(q_num)
+        record = existing.get(q_num)
+
+        if record is not None and old_questions.get(key) == manifest["questions"][key]:
+            questions.append(record)
+            continue
+
+        parsed = parse_single_question(key, index.segment(q_num), None, image_folder)
+        if not parsed:
+            continue
+
+        questions.append(parsed)
+        if key in old_questions and record is not None:
+            changed.append(q_num)
+        else:
+            added.append(q_num)
+
+    # PDF에서 사라진 문제는 제거, manifest에 없던 수동 추가 문제는 유지
+    removed = []
+    for q_id, record in existing.items():
+        if q_id in index:
+            continue
+        if str(q_id) in old_questions:
+            removed.append(q_id)
+        else:
+            questions.append(record)
+
+    data['questions'] = questions
+    data['totalQuestions'] = len(questions)
+
+    save_json(json_path, data)
+    save_json(manifest_path, manifest)
+
+    print(f"\n추가: {len(added)}개 {added}")
+    print(f"변경: {len(changed)}개 {changed}")
+    print(f"삭제: {len(removed)}개 {removed}")
+    print(f"유지: {len(questions) - len(added) - len(changed)}개")
+
+    return {"added": added, "changed": changed, "removed": removed}
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    pdf_file = sys.argv[1] if len(sys.argv) > 1 else pdf_cache.DEFAULT_PDF
+    json_file = sys.argv[2] if len(sys.argv) > 2 else "quiz_data.json"
+
+    if not os.path.exists(pdf_file):
+        print(f"[오류] '{pdf_file}' 파일을 찾을 수 없습니다.")
+    else:
+        incremental_ingest(pdf_file, json_file)
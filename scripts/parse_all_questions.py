@@ -9,6 +9,8 @@ import re
 import os
 from pathlib import Path
 
+from image_store import ImageStore
+
 def extract_all_questions_from_pdf(pdf_path, output_json="quiz_data_full.json", image_folder="images"):
     """PDF에서 모든 문제 추출 (텍스트 + 이미지)"""
     
@@ -17,6 +19,7 @@ def extract_all_questions_from_pdf(pdf_path, output_json="quiz_data_full.json",
     
     # PDF 열기
     pdf = fitz.open(pdf_path)
+    store = ImageStore(image_folder)
     
     questions = []
     current_question = None
@@ -60,25 +63,18 @@ def extract_all_questions_from_pdf(pdf_path, output_json="quiz_data_full.json",
                 "hasImage": has_images
             }
             
-            # 이미지가 있으면 추출
+            # 이미지가 있으면 추출 (같은 xref/같은 내용은 한 번만 저장)
             if has_images and is_image_question:
-                for img_index, img in enumerate(images):
+                for img in images:
                     try:
-                        xref = img[0]
-                        base_image = pdf.extract_image(xref)
-                        image_bytes = base_image["image"]
-                        image_ext = base_image["ext"]
-                        
-                        image_filename = f"q{question_counter}_page{page_num + 1:03d}_img{img_index + 1}.{image_ext}"
-                        image_path = os.path.join(image_folder, image_filename)
-                        
-                        with open(image_path, "wb") as img_file:
-                            img_file.write(image_bytes)
-                        
-                        current_question["image"] = f"{image_folder}/{image_filename}"
-                        print(f"[OK] Q{question_counter} - 이미지 추출: {image_filename}")
-                    except:
-                        pass
+                        image_path = store.put_xref(pdf, img[0])
+                    except Exception:
+                        continue
+                    
+                    if image_path not in current_question.setdefault("images", []):
+                        current_question["images"].append(image_path)
+                    current_question.setdefault("image", image_path)
+                    print(f"[OK] Q{question_counter} - 이미지: {image_path}")
             
             # 텍스트 파싱 (간단한 버전)
             lines = text.split('\n')
@@ -180,7 +176,8 @@ def extract_all_questions_from_pdf(pdf_path, output_json="quiz_data_full.json",
     print("\n" + "=" * 60)
     print(f"[완료] 총 {len(questions)}개 문제 추출!")
     print(f"[파일] {output_json}")
-    print(f"[이미지] {image_folder}/ 폴더")
+    print(f"[이미지] {store.prefix}/ 폴더 (저장 {store.stats['written']}개, "
+          f"중복 생략 {store.stats['deduplicated'] + store.stats['xref_hits']}개)")
     
     # 통계
     text_questions = sum(1 for q in questions if q.get("questionType") == "TEXT")
@@ -193,6 +190,202 @@ def extract_all_questions_from_pdf(pdf_path, output_json="quiz_data_full.json",
     return quiz_data
 
 
+IMAGE_QUESTION_KEYWORDS = ["DRAG DROP", "HOT AREA", "HOTSPOT", "HOT SPOT"]
+BOLD_FLAG = 16  # PyMuPDF span flags: bit 4 = bold
+
+
+def walk_page_layout(page):
+    """
+    page.get_text("dict") 한 번으로 페이지 순회
+    텍스트는 줄 단위(글꼴 크기/굵기/bbox 포함), 이미지 블록은 bytes와 함께 같이 수집
+    """
+    lines = []
+    images = []
+    
+    for block in page.get_text("dict")["blocks"]:
+        if block["type"] == 1:
+            images.append({
+                "bbox": block["bbox"],
+                "ext": block.get("ext", "png"),
+                "image": block["image"]
+            })
+            continue
+        
+        for line in block.get("lines", []):
+            spans = line["spans"]
+            text = "".join(span["text"] for span in spans).strip()
+            if not text:
+                continue
+            lines.append({
+                "text": text,
+                "size": max(span["size"] for span in spans),
+                "bold": any(span["flags"] & BOLD_FLAG for span in spans),
+                "bbox": line["bbox"]
+            })
+    
+    return lines, images
+
+
+def body_font_size(lines):
+    """페이지 본문 글꼴 크기 (글자 수 기준 최빈값)"""
+    weights = {}
+    for line in lines:
+        size = round(line["size"], 1)
+        weights[size] = weights.get(size, 0) + len(line["text"])
+    return max(weights, key=weights.get) if weights else 0
+
+
+def header_number(line, body_size):
+    """
+    문제 머리글이면 번호 반환, 아니면 None
+    줄 전체가 'Question #N'이거나, 굵게/크게 쓰인 줄이 'Question N'으로 시작하는 경우
+    """
+    text = line["text"]
+    if not text.startswith(("Question", "QUESTION")):
+        return None
+    
+    rest = text[8:].lstrip(" #")
+    digits = ""
+    for ch in rest:
+        if not ch.isdigit():
+            break
+        digits += ch
+    if not digits:
+        return None
+    
+    is_heading = line["bold"] or line["size"] > body_size * 1.1
+    if rest == digits or is_heading:
+        return digits
+    return None
+
+
+def classify_line(line):
+    """본문 줄 종류 판별: 'answer' / 'explanation' / 'option' / 'text'"""
+    text = line["text"]
+    if text.startswith(("Correct Answer:", "Answer:")):
+        return "answer"
+    if text.startswith(("Explanation:", "Reference:", "References:")):
+        return "explanation"
+    if len(text) > 2 and text[0].isupper() and text[1] == "." and text[2] == " " and not line["bold"]:
+        return "option"
+    return "text"
+
+
+def extract_all_questions_from_layout(pdf_path, output_json="quiz_data_full.json", image_folder="images"):
+    """
+    구조화된 레이아웃(dict) 기반 추출
+    페이지마다 get_text("dict")를 한 번만 호출하고 글꼴 정보로 머리글/선택지/정답 블록을 판별
+    문제가 여러 페이지에 걸쳐도 이어서 수집
+    """
+    
+    Path(image_folder).mkdir(exist_ok=True)
+    
+    pdf = fitz.open(pdf_path)
+    store = ImageStore(image_folder)
+    
+    questions = []
+    current = None
+    section = None
+    
+    print(f"PDF 총 페이지 수: {pdf.page_count}")
+    print("=" * 60)
+    
+    def finish(question):
+        question["question"] = ' '.join(question.pop("_question_lines"))
+        question["explanation"] = ' '.join(question.pop("_explanation_lines"))
+        questions.append(question)
+    
+    for page_num in range(pdf.page_count):
+        lines, images = walk_page_layout(pdf[page_num])
+        body_size = body_font_size(lines)
+        
+        for line in lines:
+            q_num = header_number(line, body_size)
+            if q_num is not None:
+                if current:
+                    finish(current)
+                current = {
+                    "id": len(questions) + 1,
+                    "original_number": q_num,
+                    "page": page_num + 1,
+                    "question": "",
+                    "questionType": "TEXT",
+                    "options": [],
+                    "answer": "",
+                    "explanation": "",
+                    "hasImage": False,
+                    "_question_lines": [],
+                    "_explanation_lines": []
+                }
+                section = "question"
+                continue
+            
+            if current is None:
+                continue
+            
+            text = line["text"]
+            kind = classify_line(line)
+            
+            if section == "question" and any(kw in text.upper() for kw in IMAGE_QUESTION_KEYWORDS):
+                current["questionType"] = "IMAGE"
+            
+            if kind == "answer":
+                section = "answer"
+                current["answer"] = text.split(":", 1)[1].strip()
+            elif kind == "explanation":
+                section = "explanation"
+                first = text.split(":", 1)[1].strip()
+                if first:
+                    current["_explanation_lines"].append(first)
+            elif kind == "option" and section in ("question", "options"):
+                section = "options"
+                current["options"].append({
+                    "letter": text[0],
+                    "text": text[3:].strip()
+                })
+            elif section == "question":
+                current["_question_lines"].append(text)
+            elif section == "options":
+                current["options"][-1]["text"] += ' ' + text
+            elif section == "explanation":
+                current["_explanation_lines"].append(text)
+        
+        # 같은 순회에서 모은 이미지 블록 저장 (내용 해시 기준 중복 제거)
+        if current and images:
+            current["hasImage"] = True
+            if current["questionType"] == "IMAGE":
+                for img in images:
+                    image_path = store.put_bytes(img["image"], img["ext"])
+                    if image_path not in current.setdefault("images", []):
+                        current["images"].append(image_path)
+                    current.setdefault("image", image_path)
+        
+        if (page_num + 1) % 50 == 0:
+            print(f"진행 중... {page_num + 1} 페이지, {len(questions)}개 문제")
+    
+    if current:
+        finish(current)
+    
+    pdf.close()
+    
+    quiz_data = {
+        "title": "AZ-900 Azure Fundamentals - Full",
+        "description": f"Microsoft Azure Fundamentals - {len(questions)} Questions",
+        "totalQuestions": len(questions),
+        "questions": questions
+    }
+    
+    with open(output_json, 'w', encoding='utf-8') as f:
+        json.dump(quiz_data, f, ensure_ascii=False, indent=2)
+    
+    print("\n" + "=" * 60)
+    print(f"[완료] 총 {len(questions)}개 문제 추출!")
+    print(f"[파일] {output_json}")
+    print(f"[이미지] {store.prefix}/ 폴더 (저장 {store.stats['written']}개, 중복 생략 {store.stats['deduplicated']}개)")
+    
+    return quiz_data
+
+
 if __name__ == "__main__":
     import sys
     import io
@@ -213,7 +406,10 @@ if __name__ == "__main__":
         print(f"[PDF] {pdf_file}")
         print("추출 시작...\n")
         
-        result = extract_all_questions_from_pdf(pdf_file)
+        if "--layout" in sys.argv[1:]:
+            result = extract_all_questions_from_layout(pdf_file)
+        else:
+            result = extract_all_questions_from_pdf(pdf_file)
         
         print("\n[완료!]")
         print("\n다음 단계:")
@@ -3,54 +3,49 @@ AZ-900 PDF 파싱 스크립트 v2
 실제 PDF 구조에 맞게 수정
 """
 
-import fitz
 import json
-import re
 import os
 import sys
 import io
+import shutil
 from pathlib import Path
 
+import patterns
+import pdf_cache
+from question_index import SegmentView, iter_segments, segment_bounds, slice_stripped
+
 # UTF-8 출력
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
-def parse_az900_pdf(pdf_path, output_json="quiz_data_full.json", image_folder="images"):
-    """AZ-900 PDF 파싱"""
+def parse_az900_pdf(pdf_path, output_json="quiz_data_full.json", image_folder="images", workers=None):
+    """AZ-900 PDF 파싱
+
+    workers: 페이지 추출 프로세스 수 (None이면 CPU 코어 수, 1이면 순차)
+    """
     
     Path(image_folder).mkdir(exist_ok=True)
     
-    pdf = fitz.open(pdf_path)
-    all_text = ""
+    if workers is None:
+        workers = os.cpu_count() or 1
     
-    print(f"PDF 총 페이지: {pdf.page_count}")
-    print("텍스트 추출 중...")
+    print(f"텍스트 추출 중... (워커 {workers}개)")
     
-    # 모든 텍스트 추출
-    for page_num in range(pdf.page_count):
-        page = pdf[page_num]
-        all_text += page.get_text() + "\n"
-        
-        if (page_num + 1) % 50 == 0:
-            print(f"  {page_num + 1} 페이지 처리...")
+    # 페이지별 텍스트 추출 (캐시 히트 시 PDF를 열지 않음)
+    pages = pdf_cache.load_pages(pdf_path, workers=workers)
+    print(f"PDF 총 페이지: {len(pages)}")
     
-    print("문제 파싱 중...")
+    # 페이지 순서대로 한 번에 합침
+    all_text = "".join(page + "\n" for page in pages)
+    del pages
     
-    # Question #X 패턴으로 문제 분리
-    question_pattern = r'Question #(\d+)'
-    questions_raw = re.split(question_pattern, all_text)
+    print("문제 파싱 중...")
     
+    # Question #X 위치만 기록하고 구간 view로 파싱 (문서를 문제별 문자열로 복사하지 않음)
     questions = []
     
-    # questions_raw는 [시작텍스트, 번호1, 내용1, 번호2, 내용2, ...] 형태
-    for i in range(1, len(questions_raw), 2):
-        if i + 1 >= len(questions_raw):
-            break
-            
-        question_num = questions_raw[i]
-        question_content = questions_raw[i + 1]
-        
+    for segment in iter_segments(all_text, patterns.QUESTION_HEADER):
         # 문제 파싱
-        q_data = parse_single_question(question_num, question_content, pdf, image_folder)
+        q_data = parse_single_question(segment.number, segment, None, image_folder)
         
         if q_data:
             questions.append(q_data)
@@ -58,8 +53,6 @@ def parse_az900_pdf(pdf_path, output_json="quiz_data_full.json", image_folder="i
             if len(questions) % 10 == 0:
                 print(f"  {len(questions)}개 문제 처리...")
     
-    pdf.close()
-    
     # JSON 생성
     quiz_data = {
         "title": "AZ-900 Azure Fundamentals",
@@ -86,10 +79,102 @@ def parse_az900_pdf(pdf_path, output_json="quiz_data_full.json", image_folder="i
     return quiz_data
 
 
+def iter_questions(pdf_path, image_folder="images"):
+    """
+    스트리밍 파싱: 'Question #N' 경계를 넘을 때마다 문제 dict를 바로 yield
+    페이지 사이에는 아직 끝나지 않은 문제 꼬리만 유지
+    """
+    tail = ""
+    current_num = None
+    
+    for page_text in pdf_cache.iter_pages(pdf_path):
+        buffer = tail + page_text + "\n"
+        pos = 0
+        
+        # 꼬리는 이미 스캔했고 줄바꿈으로 끝나므로 새 페이지 부분만 검색
+        for match in patterns.QUESTION_HEADER.finditer(buffer, len(tail)):
+            if current_num is not None:
+                q_data = parse_single_question(current_num, SegmentView(buffer, pos, match.start()), None, image_folder)
+                if q_data:
+                    yield q_data
+            current_num = match.group(1)
+            pos = match.end()
+        
+        # 첫 문제 이전 텍스트는 버림 (re.split 결과의 첫 요소와 동일)
+        tail = buffer[pos:] if current_num is not None else ""
+    
+    if current_num is not None:
+        q_data = parse_single_question(current_num, tail, None, image_folder)
+        if q_data:
+            yield q_data
+
+
+def parse_az900_pdf_stream(pdf_path, output_json="quiz_data_full.json", image_folder="images"):
+    """
+    스트리밍 모드 파싱
+    문제를 하나씩 임시 파일에 기록한 뒤 최종 JSON을 조립 (전체 문제 리스트를 메모리에 두지 않음)
+    """
+    
+    Path(image_folder).mkdir(exist_ok=True)
+    
+    print("스트리밍 파싱 중...")
+    
+    questions_tmp = output_json + ".questions.tmp"
+    count = 0
+    image_q = 0
+    
+    with open(questions_tmp, 'w', encoding='utf-8') as out:
+        for q_data in iter_questions(pdf_path, image_folder):
+            if count:
+                out.write(",\n")
+            # indent=2 출력과 같은 모양이 되도록 들여쓰기
+            body = json.dumps(q_data, ensure_ascii=False, indent=2)
+            out.write("    " + body.replace("\n", "\n    "))
+            
+            count += 1
+            if q_data.get('image'):
+                image_q += 1
+            
+            if count % 10 == 0:
+                print(f"  {count}개 문제 처리...")
+    
+    header = {
+        "title": "AZ-900 Azure Fundamentals",
+        "description": f"Microsoft Azure Fundamentals - {count} Questions",
+        "totalQuestions": count
+    }
+    
+    with open(output_json, 'w', encoding='utf-8') as f:
+        head = json.dumps(header, ensure_ascii=False, indent=2)
+        f.write(head[:-2] + ',\n  "questions": [')
+        if count:
+            f.write("\n")
+            with open(questions_tmp, 'r', encoding='utf-8') as tmp:
+                shutil.copyfileobj(tmp, f)
+            f.write("\n  ]\n}")
+        else:
+            f.write("]\n}")
+    
+    os.remove(questions_tmp)
+    
+    print("\n" + "=" * 60)
+    print(f"[완료] {count}개 문제 추출!")
+    print(f"[저장] {output_json}")
+    
+    print(f"\n[통계]")
+    print(f"  텍스트 문제: {count - image_q}개")
+    print(f"  이미지 문제: {image_q}개")
+    
+    return count
+
+
 def parse_single_question(question_num, content, pdf, image_folder):
-    """개별 문제 파싱"""
+    """
+    개별 문제 파싱
+    content: 문제 본문 문자열 또는 SegmentView (view면 문서에서 바로 검색하고 필드만 잘라냄)
+    """
     
-    lines = content.strip().split('\n')
+    text, pos, endpos = segment_bounds(content)
     
     # 기본 데이터
     q_data = {
@@ -101,59 +186,48 @@ def parse_single_question(question_num, content, pdf, image_folder):
         "explanation": ""
     }
     
-    # DRAG DROP, Hot Area 등 확인
-    content_upper = content.upper()
-    if 'DRAG DROP' in content_upper:
-        q_data["questionType"] = "DRAG_DROP"
-    elif 'HOT AREA' in content_upper or 'HOTAREA' in content_upper:
-        q_data["questionType"] = "HOT_AREA"
-    elif 'HOTSPOT' in content_upper or 'HOT SPOT' in content_upper:
-        q_data["questionType"] = "HOTSPOT"
-    else:
-        q_data["questionType"] = "MULTIPLE_CHOICE"
+    # DRAG DROP, Hot Area 등 확인 (키워드 한 번 스캔)
+    q_data["questionType"] = patterns.question_type(patterns.scan_segment(text, pos, endpos))
     
     # 정답 추출 (Correct Answer: X)
-    answer_match = re.search(r'Correct Answer:\s*([A-Z,\s]+)', content)
+    answer_match = patterns.CORRECT_ANSWER.search(text, pos, endpos)
     if answer_match:
-        q_data["answer"] = answer_match.group(1).strip()
+        q_data["answer"] = slice_stripped(text, answer_match.start(1), answer_match.end(1))
     
     # References/Explanation 추출
-    ref_match = re.search(r'(?:References?|Explanation):\s*(.+?)(?=Community vote|Topic|Question|$)', content, re.DOTALL | re.IGNORECASE)
+    ref_match = patterns.REFERENCE_SECTION.search(text, pos, endpos)
     if ref_match:
-        q_data["explanation"] = ref_match.group(1).strip()[:500]  # 최대 500자
+        q_data["explanation"] = slice_stripped(text, ref_match.start(1), ref_match.end(1), 500)  # 최대 500자
     
     # 질문 텍스트 추출
     # Correct Answer 이전까지가 질문 + 선택지
-    answer_pos = content.find('Correct Answer:')
-    if answer_pos > 0:
-        question_part = content[:answer_pos]
-    else:
-        question_part = content
+    answer_pos = text.find('Correct Answer:', pos, endpos)
+    question_end = answer_pos if answer_pos > pos else endpos
     
     # 선택지 추출 (A. B. C. D.)
-    options_pattern = r'^([A-Z])\.\s*(.+?)(?=^[A-Z]\.|Correct Answer:|$)'
-    option_matches = re.findall(options_pattern, question_part, re.MULTILINE | re.DOTALL)
-    
-    for letter, text in option_matches:
+    first_letter = None
+    for match in patterns.iter_options(text, pos, question_end):
+        if first_letter is None:
+            first_letter = match.group(1)
         q_data["options"].append({
-            "letter": letter,
-            "text": text.strip()[:200]  # 최대 200자
+            "letter": match.group(1),
+            "text": slice_stripped(text, match.start(2), match.end(2), 200)  # 최대 200자
         })
     
     # 질문 텍스트 (선택지 이전까지)
-    if option_matches:
-        first_option_pos = question_part.find(f"{option_matches[0][0]}.")
-        question_text = question_part[:first_option_pos] if first_option_pos > 0 else question_part
-    else:
-        question_text = question_part
+    text_end = question_end
+    if first_letter is not None:
+        first_option_pos = text.find(f"{first_letter}.", pos, question_end)
+        if first_option_pos > pos:
+            text_end = first_option_pos
     
-    # 불필요한 부분 제거
-    question_text = re.sub(r'DRAG DROP\s*-?\s*', '', question_text, flags=re.IGNORECASE)
-    question_text = re.sub(r'Select and Place:\s*', '', question_text, flags=re.IGNORECASE)
-    question_text = re.sub(r'HOT AREA\s*-?\s*', '', question_text, flags=re.IGNORECASE)
-    question_text = question_text.strip()
+    # 불필요한 부분 제거 (라벨이 없으면 sub는 같은 문자열을 그대로 돌려줌)
+    question_text = text[pos:text_end]
+    question_text = patterns.DRAG_DROP_LABEL.sub('', question_text)
+    question_text = patterns.SELECT_AND_PLACE_LABEL.sub('', question_text)
+    question_text = patterns.HOT_AREA_LABEL.sub('', question_text)
     
-    q_data["question"] = question_text[:1000]  # 최대 1000자
+    q_data["question"] = slice_stripped(question_text, 0, len(question_text), 1000)  # 최대 1000자
     
     return q_data
 
@@ -166,7 +240,12 @@ if __name__ == "__main__":
     pdf_file = "AZ-900 영문 474.pdf"
     
     if os.path.exists(pdf_file):
-        result = parse_az900_pdf(pdf_file)
+        args = sys.argv[1:]
+        if "--stream" in args:
+            result = parse_az900_pdf_stream(pdf_file)
+        else:
+            workers = int(args[0]) if args else None
+            result = parse_az900_pdf(pdf_file, workers=workers)
         print("\n완료!")
     else:
         print(f"[오류] {pdf_file} 파일을 찾을 수 없습니다.")
@@ -0,0 +1,154 @@
+"""
+공용 정규식/키워드 레지스트리
+문제마다 같은 정규식을 다시 조회하지 않도록 미리 컴파일해 두고,
+'kw in content_upper' 반복 대신 한 번의 스캔으로 모든 키워드 위치를 찾는 다중 키워드 매처 제공
+"""
+
+import re
+
+# ---------------------------------------------------------------------------
+# 미리 컴파일된 정규식
+# ---------------------------------------------------------------------------
+
+QUESTION_HEADER = re.compile(r'Question #(\d+)')
+
+CORRECT_ANSWER = re.compile(r'Correct Answer:\s*([A-Z,\s]+)')
+CORRECT_ANSWER_LETTER = re.compile(r'Correct Answer:\s*([A-D])')
+CORRECT_ANSWER_LINE = re.compile(r'Correct Answer:\s*(.+)')
+CORRECT_ANSWER_SECTION = re.compile(r'Correct Answer:\s*(.+?)(?=\n\n|References?:|Topic|$)', re.DOTALL)
+CORRECT_ANSWER_EXPLANATION = re.compile(r'Correct Answer:(.+?)(?=References?:|Topic|$)', re.DOTALL)
+
+REFERENCE_SECTION = re.compile(
+    r'(?:References?|Explanation):\s*(.+?)(?=Community vote|Topic|Question|$)',
+    re.DOTALL | re.IGNORECASE
+)
+REFERENCE_TO_TOPIC = re.compile(r'(?:References?|Explanation):\s*(.+?)(?=Topic|$)', re.DOTALL | re.IGNORECASE)
+
+OPTIONS = re.compile(r'^([A-Z])\.\s*(.+?)(?=^[A-Z]\.|Correct Answer:|$)', re.MULTILINE | re.DOTALL)
+# view 시작 위치용: pos 인자로 검색하면 ^는 앞 글자가 \n일 때만 맞으므로 ^ 없이 match
+OPTION_AT_START = re.compile(r'([A-Z])\.\s*(.+?)(?=^[A-Z]\.|Correct Answer:|$)', re.MULTILINE | re.DOTALL)
+
+BOX_ANY = re.compile(r'Box \d+:')
+BOX_YES_NO = re.compile(r'Box (\d+):\s*(Yes|No)', re.IGNORECASE)
+BOX_STATEMENT = re.compile(
+    r'Box (\d+):\s*(Yes|No)\s*-\s*(.+?)(?=Box \d+:|References?:|Topic|$)',
+    re.DOTALL | re.IGNORECASE
+)
+BOX_EXPLANATION = re.compile(r'(Box 1:.+?)(?=References?:|Topic|$)', re.DOTALL | re.IGNORECASE)
+
+SENTENCE_END = re.compile(r'[.!?]\s+')
+BLANK_SENTENCE = re.compile(r'(An? .+?_+.+?\.)')
+
+DRAG_DROP_LABEL = re.compile(r'DRAG DROP\s*-?\s*', re.IGNORECASE)
+SELECT_AND_PLACE_LABEL = re.compile(r'Select and Place:\s*', re.IGNORECASE)
+HOT_AREA_LABEL = re.compile(r'HOT AREA\s*-?\s*', re.IGNORECASE)
+
+DROPDOWN_OPTION_PATTERNS = [
+    re.compile(r'(in (?:a|the) (?:private|public|hybrid) cloud)', re.IGNORECASE),
+    re.compile(r'(on (?:a|the) .+? host)', re.IGNORECASE),
+    re.compile(r'(Software|Platform|Infrastructure) as a Service', re.IGNORECASE),
+]
+
+
+# ---------------------------------------------------------------------------
+# 다중 키워드 매처
+# ---------------------------------------------------------------------------
+
+class KeywordMatcher:
+    """
+    여러 키워드를 한 번의 스캔으로 찾는 매처 (대소문자 무시)
+
+    모든 키워드를 긴 것부터 나열한 하나의 전방탐색 패턴으로 컴파일해서
+    각 위치마다 가장 긴 키워드를 찾고, 같은 위치에서 시작하는 더 짧은 키워드(접두사)도 함께 기록
+    전방탐색이라 서로 겹치는 키워드도 모두 찾음
+    """
+
+    def __init__(self, keywords):
+        self.keywords = sorted({kw.upper() for kw in keywords}, key=len, reverse=True)
+        alternatives = '|'.join(re.escape(kw) for kw in self.keywords)
+        self._pattern = re.compile(f'(?=({alternatives}))', re.IGNORECASE)
+        self._prefixes = {
+            kw: [other for other in self.keywords if other != kw and kw.startswith(other)]
+            for kw in self.keywords
+        }
+
+    def scan(self, text, pos=0, endpos=None):
+        """키워드 → 시작 오프셋 리스트 (찾은 키워드만 포함)"""
+        if endpos is None:
+            endpos = len(text)
+        hits = {}
+        for match in self._pattern.finditer(text, pos, endpos):
+            keyword = match.group(1).upper()
+            start = match.start()
+            hits.setdefault(keyword, []).append(start)
+            for prefix in self._prefixes[keyword]:
+                hits.setdefault(prefix, []).append(start)
+        return hits
+
+
+# 문제 유형
+TYPE_KEYWORDS = {
+    "DRAG_DROP": ['DRAG DROP'],
+    "HOT_AREA": ['HOT AREA', 'HOTAREA'],
+    "HOTSPOT": ['HOTSPOT', 'HOT SPOT'],
+}
+
+# HOTSPOT 세부 형식
+CHECKBOX_KEYWORDS = [
+    'SELECT YES IF THE STATEMENT IS TRUE',
+    'SELECT NO IF',
+    'FOR EACH OF THE FOLLOWING STATEMENTS',
+    'EACH CORRECT SELECTION IS WORTH ONE POINT'
+]
+DROPDOWN_KEYWORDS = [
+    'TO COMPLETE THE SENTENCE',
+    'SELECT THE APPROPRIATE OPTION',
+    'ANSWER AREA'
+]
+
+# 위치 표시자
+MARKER_KEYWORDS = [
+    'CORRECT ANSWER:',
+    'SELECT YES IF',
+    'BOX 1:', 'BOX 2:', 'BOX 3:',
+    'REFERENCE:', 'REFERENCES:',
+    'COMMUNITY VOTE'
+]
+
+SEGMENT_MATCHER = KeywordMatcher(
+    [kw for kws in TYPE_KEYWORDS.values() for kw in kws]
+    + CHECKBOX_KEYWORDS + DROPDOWN_KEYWORDS + MARKER_KEYWORDS
+)
+
+
+def scan_segment(content, pos=0, endpos=None):
+    """문제 구간 한 번 스캔 → {키워드: [오프셋...]}"""
+    return SEGMENT_MATCHER.scan(content, pos, endpos)
+
+
+def question_type(hits):
+    """스캔 결과로 문제 유형 결정 (DRAG DROP > HOT AREA > HOTSPOT > 객관식)"""
+    for q_type, keywords in TYPE_KEYWORDS.items():
+        if any(kw in hits for kw in keywords):
+            return q_type
+    return "MULTIPLE_CHOICE"
+
+
+def keyword_score(hits, keywords):
+    """목록 중 등장한 키워드 개수"""
+    return sum(1 for kw in keywords if kw in hits)
+
+
+def iter_options(text, pos=0, endpos=None):
+    """
+    [pos, endpos) 구간의 선택지 match를 순서대로 (text[pos:endpos]에 OPTIONS.finditer와 같은 결과)
+    구간이 줄 머리에서 시작하지 않으면 첫 선택지는 OPTION_AT_START로 따로 확인
+    """
+    if endpos is None:
+        endpos = len(text)
+    if 0 < pos < endpos and text[pos - 1] != '\n':
+        first = OPTION_AT_START.match(text, pos, endpos)
+        if first:
+            yield first
+            pos = first.end()
+    yield from OPTIONS.finditer(text, pos, endpos)
@@ -0,0 +1,183 @@
+"""
+PDF 페이지 텍스트 캐시
+PDF 내용 해시 + 페이지 번호 기준으로 추출 텍스트를 디스크에 저장
+두 번째 실행부터는 PyMuPDF를 열지 않고 캐시에서 읽음
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+DEFAULT_PDF = "AZ-900 영문 474.pdf"
+CACHE_DIR = ".pdf_cache"
+
+
+def pdf_hash(pdf_path):
+    """PDF 파일 내용의 SHA-256 해시"""
+    digest = hashlib.sha256()
+    with open(pdf_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _cache_folder(pdf_path, cache_dir):
+    return Path(cache_dir) / pdf_hash(pdf_path)
+
+
+def _page_file(folder, page_num):
+    return folder / f"page_{page_num:05d}.txt"
+
+
+def _read_meta(folder):
+    """완료된 캐시의 메타데이터 (없으면 None)"""
+    meta_path = folder / "meta.json"
+    if not meta_path.exists():
+        return None
+    with open(meta_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_page(folder, page_num, text):
+    with open(_page_file(folder, page_num), 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def _write_meta(folder, pdf_path, page_count):
+    """meta.json은 마지막에 써서 캐시 완료 표시"""
+    meta = {
+        "source": os.path.basename(pdf_path),
+        "page_count": page_count
+    }
+    tmp_path = folder / "meta.json.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False)
+    os.replace(tmp_path, folder / "meta.json")
+
+
+def _write_cache(folder, pdf_path, pages):
+    """페이지별 텍스트 저장"""
+    folder.mkdir(parents=True, exist_ok=True)
+    for page_num, text in enumerate(pages):
+        _write_page(folder, page_num, text)
+    _write_meta(folder, pdf_path, len(pages))
+
+
+def _extract_page_range(args):
+    """워커 프로세스: 자체 문서를 열어 [start, end) 페이지 텍스트 추출"""
+    import fitz
+
+    pdf_path, start, end = args
+    pdf = fitz.open(pdf_path)
+    pages = [pdf[page_num].get_text() for page_num in range(start, end)]
+    pdf.close()
+    return pages
+
+
+def _page_ranges(page_count, workers):
+    """워커당 여러 구간으로 나눠 부하를 고르게 분배"""
+    chunk = max(1, -(-page_count // (workers * 4)))
+    return [(start, min(start + chunk, page_count))
+            for start in range(0, page_count, chunk)]
+
+
+def _extract_pages(pdf_path, workers=1):
+    """PyMuPDF로 전체 페이지 텍스트 추출 (workers > 1이면 프로세스 병렬)"""
+    import fitz
+
+    pdf = fitz.open(pdf_path)
+    if workers <= 1:
+        pages = [page.get_text() for page in pdf]
+        pdf.close()
+        return pages
+
+    page_count = pdf.page_count
+    pdf.close()
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    tasks = [(pdf_path, start, end) for start, end in _page_ranges(page_count, workers)]
+    pages = []
+    # map()은 제출 순서대로 결과를 돌려주므로 페이지 순서가 항상 동일
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk_pages in pool.map(_extract_page_range, tasks):
+            pages.extend(chunk_pages)
+    return pages
+
+
+def load_pages(pdf_path=DEFAULT_PDF, cache_dir=CACHE_DIR, workers=1):
+    """페이지별 텍스트 리스트 반환 (캐시 우선, 미스 시 workers개 프로세스로 추출)"""
+    folder = _cache_folder(pdf_path, cache_dir)
+    meta = _read_meta(folder)
+
+    if meta is not None:
+        pages = []
+        for page_num in range(meta["page_count"]):
+            with open(_page_file(folder, page_num), 'r', encoding='utf-8') as f:
+                pages.append(f.read())
+        return pages
+
+    pages = _extract_pages(pdf_path, workers)
+    _write_cache(folder, pdf_path, pages)
+    return pages
+
+
+def iter_pages(pdf_path=DEFAULT_PDF, cache_dir=CACHE_DIR):
+    """
+    페이지 텍스트를 한 페이지씩 yield (메모리에는 현재 페이지만 유지)
+    캐시 미스 시 추출하면서 동시에 캐시에 기록
+    """
+    folder = _cache_folder(pdf_path, cache_dir)
+    meta = _read_meta(folder)
+
+    if meta is not None:
+        for page_num in range(meta["page_count"]):
+            with open(_page_file(folder, page_num), 'r', encoding='utf-8') as f:
+                yield f.read()
+        return
+
+    import fitz
+
+    folder.mkdir(parents=True, exist_ok=True)
+    pdf = fitz.open(pdf_path)
+    try:
+        for page_num in range(pdf.page_count):
+            text = pdf[page_num].get_text()
+            _write_page(folder, page_num, text)
+            yield text
+        _write_meta(folder, pdf_path, pdf.page_count)
+    finally:
+        pdf.close()
+
+
+def get_pdf_text(pdf_path=DEFAULT_PDF, cache_dir=CACHE_DIR, workers=1):
+    """전체 텍스트 반환 (기존 스크립트와 동일하게 페이지마다 줄바꿈 추가)"""
+    return "".join(page + "\n" for page in load_pages(pdf_path, cache_dir, workers))
+
+
+def clear_cache(cache_dir=CACHE_DIR):
+    """캐시 폴더 전체 삭제"""
+    import shutil
+
+    if os.path.exists(cache_dir):
+        shutil.rmtree(cache_dir)
+
+
+if __name__ == "__main__":
+    import sys
+    import io
+    import time
+
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+    pdf_file = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PDF
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+
+    if not os.path.exists(pdf_file):
+        print(f"[오류] '{pdf_file}' 파일을 찾을 수 없습니다.")
+    else:
+        start = time.perf_counter()
+        pages = load_pages(pdf_file, workers=workers)
+        elapsed = time.perf_counter() - start
+        print(f"[캐시] {pdf_file}: {len(pages)} 페이지 ({elapsed:.2f}초)")
@@ -0,0 +1,227 @@
+"""
+PDF 조회 데몬 + 클라이언트
+PDF를 한 번만 로드해서 페이지 텍스트와 문제 구간 인덱스를 메모리에 유지하고
+localhost HTTP로 '문제 N / 페이지 P / 텍스트 검색' 요청에 응답
+
+실행:
+    python pdf_daemon.py [PDF 경로] [포트]
+
+클라이언트:
+    from pdf_daemon import PdfClient, fetch_segment
+    text = fetch_segment(36)   # 데몬이 없으면 로컬 캐시로 대체
+"""
+
+import json
+import os
+import re
+import sys
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pdf_cache
+from question_index import QuestionIndex
+
+HOST = "127.0.0.1"
+PORT = 8765
+SEARCH_LIMIT = 50
+CONTEXT_CHARS = 80
+
+
+class PdfDocument:
+    """메모리에 올린 PDF 텍스트 + 인덱스"""
+
+    def __init__(self, pdf_path):
+        self.pdf_path = pdf_path
+        self.index = QuestionIndex.from_pdf(pdf_path)
+
+    def segment(self, q_num):
+        text = self.index.segment(q_num)
+        if text is None:
+            return None
+        return {
+            "number": q_num,
+            "pages": self.index.page_span(q_num),
+            "text": text
+        }
+
+    def page(self, page_num):
+        text = self.index.page(page_num)
+        if text is None:
+            return None
+        return {"page": page_num, "text": text}
+
+    def search(self, query, limit=SEARCH_LIMIT):
+        """
+        대소문자 무시 부분 문자열 검색 (겹치는 위치도 모두)
+        원문에서 바로 찾음 - text.lower()는 길이가 바뀔 수 있어('İ' → 'i̇') 오프셋이 어긋남
+        """
+        results = []
+        if not query:
+            return results
+
+        text = self.index.text
+        pattern = re.compile(re.escape(query), re.IGNORECASE)
+        match = pattern.search(text)
+        while match and len(results) < limit:
+            pos = match.start()
+            start = max(0, pos - CONTEXT_CHARS)
+            end = min(len(text), match.end() + CONTEXT_CHARS)
+            results.append({
+                "offset": pos,
+                "question": self.index.question_at(pos),
+                "page": self.index.page_at(pos),
+                "context": text[start:end]
+            })
+            match = pattern.search(text, pos + 1)
+        return results
+
+
+class PdfRequestHandler(BaseHTTPRequestHandler):
+    """GET /segment/N, /page/P, /search?q=..., /health"""
+
+    document = None
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urllib.parse.urlparse(self.path)
+        parts = [p for p in url.path.split('/') if p]
+        doc = self.document
+
+        try:
+            if parts == ["health"]:
+                self._send_json(200, {
+                    "pdf": os.path.basename(doc.pdf_path),
+                    "path": os.path.abspath(doc.pdf_path),
+                    "questions": len(doc.index)
+                })
+            elif len(parts) == 2 and parts[0] == "segment":
+                result = doc.segment(int(parts[1]))
+                self._send_json(200 if result else 404, result or {"error": "not found"})
+            elif len(parts) == 2 and parts[0] == "page":
+                result = doc.page(int(parts[1]))
+                self._send_json(200 if result else 404, result or {"error": "not found"})
+            elif parts == ["search"]:
+                params = urllib.parse.parse_qs(url.query)
+                query = params.get("q", [""])[0]
+                limit = int(params.get("limit", [SEARCH_LIMIT])[0])
+                self._send_json(200, {"query": query, "results": doc.search(query, limit)})
+            else:
+                self._send_json(404, {"error": "unknown endpoint"})
+        except ValueError:
+            self._send_json(400, {"error": "bad request"})
+
+    def log_message(self, format, *args):
+        # 요청마다 로그를 찍지 않음
+        pass
+
+
+def serve(pdf_path=pdf_cache.DEFAULT_PDF, host=HOST, port=PORT):
+    """데몬 실행 (Ctrl+C로 종료)"""
+    start = time.perf_counter()
+    PdfRequestHandler.document = PdfDocument(pdf_path)
+    elapsed = time.perf_counter() - start
+
+    server = ThreadingHTTPServer((host, port), PdfRequestHandler)
+    print(f"[로드] {pdf_path}: 문제 {len(PdfRequestHandler.document.index)}개 ({elapsed:.2f}초)")
+    print(f"[대기] http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+class PdfClient:
+    """데몬용 얇은 HTTP 클라이언트"""
+
+    def __init__(self, host=HOST, port=PORT, timeout=5):
+        self.base_url = f"http://{host}:{port}"
+        self.timeout = timeout
+
+    def _get(self, path):
+        """JSON 응답 (404면 None). 연결 실패는 OSError, JSON이 아닌 응답은 ValueError"""
+        try:
+            with urllib.request.urlopen(self.base_url + path, timeout=self.timeout) as resp:
+                return json.loads(resp.read().decode('utf-8'))
+        except urllib.error.HTTPError as e:
+            if e.code == 404:
+                return None
+            raise
+
+    def health(self):
+        """데몬 상태 {"pdf", "path", "questions"} (데몬이 없거나 포트에 다른 서버가 있으면 None)"""
+        try:
+            result = self._get("/health")
+        except (OSError, ValueError):
+            return None
+        if not isinstance(result, dict) or "questions" not in result:
+            return None
+        return result
+
+    def is_running(self):
+        return self.health() is not None
+
+    def segment(self, q_num):
+        """문제 N 구간 {"number", "pages", "text"} (없거나 데몬 응답이 아니면 None)"""
+        try:
+            result = self._get(f"/segment/{int(q_num)}")
+        except ValueError:
+            return None
+        if not isinstance(result, dict) or not isinstance(result.get("text"), str):
+            return None
+        return result
+
+    def page(self, page_num):
+        """페이지 P 텍스트 {"page", "text"} (없으면 None)"""
+        return self._get(f"/page/{int(page_num)}")
+
+    def search(self, query, limit=SEARCH_LIMIT):
+        """텍스트 검색 결과 리스트"""
+        params = urllib.parse.urlencode({"q": query, "limit": limit})
+        return self._get(f"/search?{params}")["results"]
+
+
+def _same_file(path, other):
+    try:
+        return os.path.samefile(path, other)
+    except (OSError, TypeError):
+        return False
+
+
+def fetch_segment(q_num, pdf_path=pdf_cache.DEFAULT_PDF):
+    """
+    데몬이 pdf_path를 올려 두고 있으면 데몬에서, 아니면 로컬 캐시/인덱스로 문제 텍스트 조회
+    (데몬이 다른 PDF를 올려 두었거나 응답하지 않으면 로컬 조회)
+    """
+    client = PdfClient()
+    health = client.health()
+    if health is not None and _same_file(health.get("path"), pdf_path):
+        try:
+            result = client.segment(q_num)
+            return result["text"] if result else None
+        except OSError:
+            pass
+    return QuestionIndex.from_pdf(pdf_path).segment(q_num)
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    pdf_file = sys.argv[1] if len(sys.argv) > 1 else pdf_cache.DEFAULT_PDF
+    port = int(sys.argv[2]) if len(sys.argv) > 2 else PORT
+
+    if not os.path.exists(pdf_file):
+        print(f"[오류] '{pdf_file}' 파일을 찾을 수 없습니다.")
+    else:
+        serve(pdf_file, port=port)
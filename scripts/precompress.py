@@ -0,0 +1,131 @@
+"""
+정적 파일 사전 압축
+app.js, style.css, data/ 아래 JSON(분할 번들 포함)마다 최대 압축한 .gz / .br 파일을 옆에 만들고
+크기 보고서를 출력. server.js는 브라우저가 지원하면 요청마다 압축하지 않고 이 파일을 그대로 보냄
+
+brotli는 선택 사항 (pip install brotli). 없으면 .gz만 만든다.
+원본보다 커지는 압축 파일은 만들지 않고, 원본이 사라진 압축 파일은 삭제
+
+사용법 (저장소 루트에서):
+    python scripts/precompress.py [--force]
+"""
+
+import gzip
+import os
+import sys
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ROOT_FILES = ["app.js", "style.css"]
+DATA_DIR = "data"
+EXTENSIONS = (".json", ".js", ".css")
+ENCODINGS = (".gz", ".br")
+
+
+def find_targets(root="."):
+    """압축 대상 파일 경로 리스트"""
+    targets = [os.path.join(root, name) for name in ROOT_FILES
+               if os.path.isfile(os.path.join(root, name))]
+    for folder, _, files in os.walk(os.path.join(root, DATA_DIR)):
+        for name in sorted(files):
+            if name.endswith(EXTENSIONS):
+                targets.append(os.path.join(folder, name))
+    return targets
+
+
+def compress_gzip(raw):
+    # mtime=0: 내용이 같으면 결과 파일도 같음
+    return gzip.compress(raw, compresslevel=9, mtime=0)
+
+
+def compress_brotli(raw):
+    return brotli.compress(raw, mode=brotli.MODE_TEXT, quality=11, lgwin=24)
+
+
+def _is_fresh(path, sibling):
+    return os.path.exists(sibling) and os.path.getmtime(sibling) >= os.path.getmtime(path)
+
+
+def precompress_file(path, force=False):
+    """
+    파일 하나의 .gz / .br 생성
+    반환: {"path", "original", ".gz": 크기 또는 None, ".br": 크기 또는 None}
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+
+    compressors = {".gz": compress_gzip}
+    if brotli is not None:
+        compressors[".br"] = compress_brotli
+
+    result = {"path": path, "original": len(raw), ".gz": None, ".br": None}
+    for ext, compress in compressors.items():
+        sibling = path + ext
+        if not force and _is_fresh(path, sibling):
+            result[ext] = os.path.getsize(sibling)
+            continue
+
+        data = compress(raw)
+        if len(data) >= len(raw):
+            if os.path.exists(sibling):
+                os.remove(sibling)
+            continue
+
+        tmp_path = sibling + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, sibling)
+        result[ext] = len(data)
+    return result
+
+
+def remove_orphans(root="."):
+    """원본이 없는 .gz / .br 삭제 (예: 다시 빌드된 번들 샤드)"""
+    removed = []
+    for folder, _, files in os.walk(os.path.join(root, DATA_DIR)):
+        for name in files:
+            base, ext = os.path.splitext(name)
+            if ext in ENCODINGS and base.endswith(EXTENSIONS) and base not in files:
+                os.remove(os.path.join(folder, name))
+                removed.append(os.path.join(folder, name))
+    return removed
+
+
+def precompress_all(root=".", force=False):
+    """모든 대상 압축 → 파일별 결과 리스트"""
+    remove_orphans(root)
+    return [precompress_file(path, force) for path in find_targets(root)]
+
+
+def _column(original, size):
+    if size is None:
+        return f"{'-':>10} {'':>6}"
+    return f"{size:>10,} {original / size:5.1f}x"
+
+
+def print_report(results):
+    """파일별 원본 / .gz / .br 크기와 압축률 (합계는 브라우저가 받는 크기 기준)"""
+    print(f"{'파일':<48} {'원본':>10} {'.gz':>17} {'.br':>17}")
+    totals = {"original": 0, ".gz": 0, ".br": 0}
+    for r in results:
+        totals["original"] += r["original"]
+        # 압축 파일이 없으면 원본을 그대로 보냄
+        totals[".gz"] += r[".gz"] or r["original"]
+        totals[".br"] += r[".br"] or r[".gz"] or r["original"]
+        print(f"{r['path']:<48} {r['original']:>10,} "
+              f"{_column(r['original'], r['.gz'])} {_column(r['original'], r['.br'])}")
+
+    print(f"{'합계':<48} {totals['original']:>10,} "
+          f"{_column(totals['original'], totals['.gz'])} "
+          f"{_column(totals['original'], totals['.br'] if brotli else None)}")
+    if brotli is None:
+        print("\n⚠️  brotli 미설치: .br 파일은 만들지 않음 (pip install brotli)")
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    print_report(precompress_all(force="--force" in sys.argv))
@@ -1,41 +1,33 @@
 """
 모든 HOTSPOT/HOT_AREA 문제 자동 처리
+
+workers > 1이면 문제 구간을 여러 프로세스에 나눠 파싱
+문서 텍스트는 shared_corpus.SharedCorpus로 공유 메모리에 한 번만 올리고 작업에는 문제 번호만 보내므로
+문제마다 텍스트를 pickle해서 넘기지 않음. 결과는 문제 번호로 모아서 순차 처리와 같은 순서로 반영
+
+사용법:
+    python process_hotspot_questions.py [--workers=N]   # N 생략 시 CPU 코어 수
 """
 
-import fitz
 import json
-import re
+import os
 import sys
 import io
 
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+import patterns
+from question_index import QuestionIndex
+from shared_corpus import SharedCorpus
 
 # 제외할 문제
 EXCLUDE_IDS = [97, 109, 112, 168, 199, 215, 276, 328]
 
-def load_pdf_text(pdf_path):
-    """PDF 전체 텍스트 로드"""
-    pdf = fitz.open(pdf_path)
-    all_text = ""
-    for page in pdf:
-        all_text += page.get_text() + "\n"
-    pdf.close()
-    return all_text
-
-def extract_question_from_pdf(all_text, q_num):
-    """특정 문제 번호의 텍스트 추출"""
-    pattern = rf'Question #{q_num}\n(.+?)Question #{q_num + 1}'
-    match = re.search(pattern, all_text, re.DOTALL)
-    if match:
-        return match.group(1)
-    
-    # 마지막 문제인 경우
-    pattern = rf'Question #{q_num}\n(.+?)$'
-    match = re.search(pattern, all_text, re.DOTALL)
-    if match:
-        return match.group(1)
-    
-    return None
+def load_pdf_index(pdf_path):
+    """PDF 문제 구간 인덱스 로드"""
+    return QuestionIndex.from_pdf(pdf_path)
+
+def extract_question_from_pdf(index, q_num):
+    """특정 문제 번호의 텍스트 추출 (마지막 문제는 문서 끝까지)"""
+    return index.segment(q_num)
 
 def classify_hotspot_type(content):
     """HOTSPOT 문제 타입 분류
@@ -45,25 +37,10 @@ def classify_hotspot_type(content):
         'dropdown': 빈칸 채우기 형식
         'unknown': 판단 불가
     """
-    content_upper = content.upper()
-    
-    # Checkbox 형식 키워드
-    checkbox_keywords = [
-        'SELECT YES IF THE STATEMENT IS TRUE',
-        'SELECT NO IF',
-        'FOR EACH OF THE FOLLOWING STATEMENTS',
-        'EACH CORRECT SELECTION IS WORTH ONE POINT'
-    ]
-    
-    # Dropdown 형식 키워드
-    dropdown_keywords = [
-        'TO COMPLETE THE SENTENCE',
-        'SELECT THE APPROPRIATE OPTION',
-        'ANSWER AREA'
-    ]
-    
-    checkbox_score = sum(1 for kw in checkbox_keywords if kw in content_upper)
-    dropdown_score = sum(1 for kw in dropdown_keywords if kw in content_upper)
+    # Checkbox / Dropdown 형식 키워드를 한 번에 스캔
+    hits = patterns.scan_segment(content)
+    checkbox_score = patterns.keyword_score(hits, patterns.CHECKBOX_KEYWORDS)
+    dropdown_score = patterns.keyword_score(hits, patterns.DROPDOWN_KEYWORDS)
     
     if checkbox_score > dropdown_score:
         return 'checkbox'
@@ -71,7 +48,7 @@ def classify_hotspot_type(content):
         return 'dropdown'
     else:
         # Box 1, Box 2, Box 3 패턴 확인
-        if re.search(r'Box \d+:', content):
+        if patterns.BOX_ANY.search(content):
             return 'checkbox'
         return 'unknown'
 
@@ -79,13 +56,16 @@ def parse_checkbox_question(q_num, content):
     """Checkbox 형식 파싱"""
     
     # 정답 추출 (Box 1: Yes, Box 2: No, Box 3: Yes)
+    # 한 번의 스캔으로 Box 번호별 첫 답을 모은 뒤 1번부터 연속된 것만 사용 (최대 5개)
+    box_answers = {}
+    for match in patterns.BOX_YES_NO.finditer(content):
+        box_answers.setdefault(int(match.group(1)), match.group(2).capitalize())
+    
     answers = []
-    for i in range(1, 6):  # 최대 5개까지
-        match = re.search(rf'Box {i}:\s*(Yes|No)', content, re.IGNORECASE)
-        if match:
-            answers.append(match.group(1).capitalize())
-        else:
+    for i in range(1, 6):
+        if i not in box_answers:
             break
+        answers.append(box_answers[i])
     
     if not answers:
         return None
@@ -97,7 +77,7 @@ def parse_checkbox_question(q_num, content):
     
     # 해설 추출
     explanation = ""
-    exp_match = re.search(r'(?:References?|Explanation):\s*(.+?)(?=Topic|$)', content, re.DOTALL | re.IGNORECASE)
+    exp_match = patterns.REFERENCE_TO_TOPIC.search(content)
     if exp_match:
         explanation = exp_match.group(1).strip()[:1000]
     
@@ -114,7 +94,7 @@ def parse_dropdown_question(q_num, content):
     
     # 빈칸 문장 찾기 (일반적으로 간단한 문장)
     # 정답에서 유추
-    answer_match = re.search(r'Correct Answer:\s*(.+)', content)
+    answer_match = patterns.CORRECT_ANSWER_LINE.search(content)
     if not answer_match:
         return None
     
@@ -136,11 +116,40 @@ def parse_dropdown_question(q_num, content):
         'explanation': answer_text
     }
 
-def process_all_hotspot_questions(pdf_path, json_path):
-    """모든 HOTSPOT 문제 처리"""
+def classify_and_parse(q_num, content):
+    """문제 하나 분류 + 파싱 → (유형, 파싱 결과 또는 None)"""
+    q_type = classify_hotspot_type(content)
+    if q_type == 'checkbox':
+        return q_type, parse_checkbox_question(q_num, content)
+    if q_type == 'dropdown':
+        return q_type, parse_dropdown_question(q_num, content)
+    return q_type, None
+
+def parse_segments_parallel(index, q_nums, workers):
+    """
+    문제 번호들을 workers개 프로세스로 파싱 (문서 텍스트는 공유 메모리 코퍼스로 전달)
+    반환: {번호: (유형, 파싱 결과)} (PDF에 없거나 빈 구간은 빠짐)
+    """
+    with SharedCorpus.from_index(index, q_nums) as corpus:
+        return corpus.map(classify_and_parse, q_nums, workers)
+
+def parse_segments(index, q_nums, workers=1):
+    """문제 번호들 파싱 → {번호: (유형, 파싱 결과)} (workers > 1이면 병렬)"""
+    if workers > 1 and len(q_nums) > 1:
+        return parse_segments_parallel(index, q_nums, workers)
+    
+    results = {}
+    for q_num in q_nums:
+        content = extract_question_from_pdf(index, q_num)
+        if content:
+            results[q_num] = classify_and_parse(q_num, content)
+    return results
+
+def process_all_hotspot_questions(pdf_path, json_path, workers=1):
+    """모든 HOTSPOT 문제 처리 (workers: 파싱 프로세스 수)"""
     
     print("PDF 로딩 중...")
-    pdf_text = load_pdf_text(pdf_path)
+    index = load_pdf_index(pdf_path)
     
     print("JSON 로딩 중...")
     with open(json_path, 'r', encoding='utf-8') as f:
@@ -157,6 +166,9 @@ def process_all_hotspot_questions(pdf_path, json_path):
     target_questions = [q for q in hotspot_questions if q['id'] not in EXCLUDE_IDS]
     print(f"처리할 문제: {len(target_questions)}개")
     
+    # 파싱 (병렬이어도 결과는 번호로 모아 아래에서 문제 순서대로 반영)
+    parsed_map = parse_segments(index, [q['id'] for q in target_questions], workers)
+    
     # 각 문제 처리
     updated_count = 0
     checkbox_count = 0
@@ -166,18 +178,15 @@ def process_all_hotspot_questions(pdf_path, json_path):
     for q in target_questions:
         q_num = q['id']
         
-        # PDF에서 문제 텍스트 추출
-        content = extract_question_from_pdf(pdf_text, q_num)
-        if not content:
+        # PDF에서 찾은 문제만 파싱 결과가 있음
+        if q_num not in parsed_map:
             print(f"Q{q_num}: PDF에서 찾을 수 없음")
             unknown_count += 1
             continue
         
-        # 타입 분류
-        q_type = classify_hotspot_type(content)
+        q_type, parsed = parsed_map[q_num]
         
         if q_type == 'checkbox':
-            parsed = parse_checkbox_question(q_num, content)
             if parsed:
                 q.update(parsed)
                 checkbox_count += 1
@@ -185,7 +194,6 @@ def process_all_hotspot_questions(pdf_path, json_path):
                 print(f"Q{q_num}: Checkbox 형식 처리 완료")
         
         elif q_type == 'dropdown':
-            parsed = parse_dropdown_question(q_num, content)
             if parsed:
                 q.update(parsed)
                 dropdown_count += 1
@@ -208,9 +216,19 @@ def process_all_hotspot_questions(pdf_path, json_path):
     print(f"  총 업데이트: {updated_count}개")
     print("=" * 60)
 
+def _workers_option():
+    for arg in sys.argv[1:]:
+        if arg == "--workers":
+            return os.cpu_count() or 1
+        if arg.startswith("--workers="):
+            return int(arg.split("=", 1)[1])
+    return 1
+
 if __name__ == "__main__":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    
     pdf_file = "AZ-900 영문 474.pdf"
     json_file = "quiz_data.json"
     
-    process_all_hotspot_questions(pdf_file, json_file)
+    process_all_hotspot_questions(pdf_file, json_file, workers=_workers_option())
 
@@ -0,0 +1,187 @@
+"""
+문제 구간 인덱스
+전체 텍스트를 한 번만 스캔해서 문제 번호 → (시작, 끝) 오프셋 / 페이지 범위 매핑
+문제마다 re.search로 문서 전체를 다시 훑지 않도록 모든 스크립트가 공유
+
+SegmentView: 문서의 [start, end) 구간을 부분 문자열 없이 가리키는 view
+파서는 pattern.search(view.text, view.start, view.end)처럼 구간 안에서만 검색하고
+필드로 내보낼 때만 slice_stripped로 필요한 만큼 잘라냄
+"""
+
+import re
+from bisect import bisect_right
+
+import pdf_cache
+
+HEADER_PATTERN = re.compile(r'Question #(\d+)\n')
+TOPIC_PATTERN = re.compile(r'Topic \d+')
+
+
+class SegmentView:
+    """문서 텍스트의 [start, end) 구간 (str()로 변환할 때만 부분 문자열 생성)"""
+
+    __slots__ = ("text", "start", "end", "number")
+
+    def __init__(self, text, start=0, end=None, number=None):
+        self.text = text
+        self.start = start
+        self.end = len(text) if end is None else end
+        self.number = number
+
+    def __len__(self):
+        return self.end - self.start
+
+    def __str__(self):
+        return self.text[self.start:self.end]
+
+    def __repr__(self):
+        return f"SegmentView(number={self.number!r}, start={self.start}, end={self.end})"
+
+
+def segment_bounds(content):
+    """문자열 또는 SegmentView → (텍스트, 시작, 끝)"""
+    if isinstance(content, SegmentView):
+        return content.text, content.start, content.end
+    return content, 0, len(content)
+
+
+def slice_stripped(text, start, end, limit=None):
+    """text[start:end].strip()[:limit]와 같은 결과를 중간 문자열 없이 생성"""
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    if limit is not None:
+        end = min(end, start + limit)
+    return text[start:end]
+
+
+def iter_segments(text, pattern=HEADER_PATTERN, pos=0, endpos=None):
+    """
+    헤더 패턴이 나올 때마다 다음 헤더 직전까지의 SegmentView를 문서 순서대로 (번호 중복 포함)
+    re.split(pattern, text)의 (번호, 내용) 쌍과 같은 구간이지만 문자열을 복사하지 않음
+    number는 헤더의 첫 그룹 문자열
+    """
+    if endpos is None:
+        endpos = len(text)
+    number = None
+    body_start = None
+    for match in pattern.finditer(text, pos, endpos):
+        if number is not None:
+            yield SegmentView(text, body_start, match.start(), number)
+        number = match.group(1)
+        body_start = match.end()
+    if number is not None:
+        yield SegmentView(text, body_start, endpos, number)
+
+
+class QuestionIndex:
+    """문제 번호 → 텍스트 구간 인덱스"""
+
+    def __init__(self, text, page_offsets=None):
+        """
+        text: 전체 텍스트 (페이지마다 줄바꿈이 붙은 pdf_cache.get_pdf_text 형식)
+        page_offsets: 각 페이지 시작 오프셋 리스트 (없으면 페이지 정보 생략)
+        """
+        self.text = text
+        self.page_offsets = page_offsets
+        self._spans = {}
+
+        # 헤더 위치를 한 번의 finditer로 수집
+        headers = [(int(m.group(1)), m.start(), m.end())
+                   for m in HEADER_PATTERN.finditer(text)]
+
+        for i, (q_num, _, body_start) in enumerate(headers):
+            body_end = headers[i + 1][1] if i + 1 < len(headers) else len(text)
+            # 같은 번호가 여러 번 나오면 첫 번째 (기존 re.search와 동일)
+            if q_num not in self._spans:
+                self._spans[q_num] = (body_start, body_end)
+
+        # 오프셋 → 문제 번호 역조회용 (문서 순서)
+        self._starts = [start for _, start, _ in headers]
+        self._start_numbers = [q_num for q_num, _, _ in headers]
+
+    @classmethod
+    def from_pages(cls, pages):
+        """페이지 텍스트 리스트로 생성 (페이지 범위 조회 가능)"""
+        offsets = []
+        position = 0
+        for page in pages:
+            offsets.append(position)
+            position += len(page) + 1
+        text = "".join(page + "\n" for page in pages)
+        return cls(text, offsets)
+
+    @classmethod
+    def from_pdf(cls, pdf_path=pdf_cache.DEFAULT_PDF):
+        """PDF 페이지 캐시에서 생성"""
+        return cls.from_pages(pdf_cache.load_pages(pdf_path))
+
+    def __len__(self):
+        return len(self._spans)
+
+    def __contains__(self, q_num):
+        return q_num in self._spans
+
+    def numbers(self):
+        """문서에 등장한 문제 번호 (문서 순서)"""
+        return list(self._spans)
+
+    def span(self, q_num):
+        """(시작, 끝) 오프셋 반환 (없으면 None)"""
+        return self._spans.get(q_num)
+
+    def page_span(self, q_num):
+        """(첫 페이지, 마지막 페이지) 1부터 시작하는 번호 (없으면 None)"""
+        span = self._spans.get(q_num)
+        if span is None or self.page_offsets is None:
+            return None
+        start, end = span
+        first = bisect_right(self.page_offsets, start)
+        last = bisect_right(self.page_offsets, max(start, end - 1))
+        return first, last
+
+    def question_at(self, offset):
+        """오프셋이 속한 문제 번호 (첫 문제 이전이면 None)"""
+        i = bisect_right(self._starts, offset) - 1
+        return self._start_numbers[i] if i >= 0 else None
+
+    def page_at(self, offset):
+        """오프셋이 속한 페이지 번호 (1부터, 페이지 정보 없으면 None)"""
+        if self.page_offsets is None:
+            return None
+        return bisect_right(self.page_offsets, offset)
+
+    def view(self, q_num):
+        """문제 본문 SegmentView (없으면 None)"""
+        span = self._spans.get(q_num)
+        if span is None:
+            return None
+        return SegmentView(self.text, span[0], span[1], q_num)
+
+    def segment(self, q_num, stop_at_topic=False):
+        """
+        문제 본문 텍스트 반환 (없으면 None)
+
+        stop_at_topic: 'Topic N' 표시가 나오면 거기서 자름
+        """
+        span = self._spans.get(q_num)
+        if span is None:
+            return None
+        start, end = span
+        if stop_at_topic:
+            topic = TOPIC_PATTERN.search(self.text, start, end)
+            if topic:
+                end = topic.start()
+        return self.text[start:end]
+
+    def page(self, page_num):
+        """페이지 텍스트 반환 (1부터 시작, 없으면 None)"""
+        if self.page_offsets is None or not 1 <= page_num <= len(self.page_offsets):
+            return None
+        start = self.page_offsets[page_num - 1]
+        if page_num < len(self.page_offsets):
+            end = self.page_offsets[page_num] - 1
+        else:
+            end = len(self.text) - 1
+        return self.text[start:end]
@@ -0,0 +1,314 @@
+"""
+열 기반(columnar) 이진 문제은행 포맷
+id/유형은 고정 폭 배열, 문자열은 하나의 힙 + 오프셋 테이블에 저장해서 mmap으로 열고
+필요한 열만 읽는다. 해설 등 긴 텍스트는 요청할 때만 디코딩한다.
+quiz_data.json과 무손실 왕복 변환 가능
+
+파일 구조 (리틀 엔디언):
+    헤더      magic 'QZCB', version u16, reserved u16, count u32, 섹션 오프셋 u64 × 8
+    ids       int32 × count
+    types     uint16 × count (유형 테이블 인덱스, 0xFFFF = questionType 없음)
+    answer / question / explanation / rest 오프셋   uint64 × (count + 1) 씩
+    meta      JSON (최상위 필드, 키 순서, 유형 테이블)
+    heap      UTF-8 문자열 (열 단위로 연속 저장, i번째 값 = heap[off[i]:off[i+1]])
+
+사용법:
+    python quiz_columnar.py build quiz_data.json quiz_data.qzcb
+    python quiz_columnar.py dump quiz_data.qzcb quiz_data.json
+    python quiz_columnar.py bench quiz_data.json [quiz_data.qzcb]
+"""
+
+import json
+import mmap
+import struct
+import sys
+import time
+
+MAGIC = b"QZCB"
+VERSION = 1
+NO_TYPE = 0xFFFF
+
+HEADER = struct.Struct("<4sHHI8Q")
+SECTIONS = ["ids", "types", "answer", "question", "explanation", "rest", "meta", "heap"]
+STRING_COLUMNS = ["answer", "question", "explanation", "rest"]
+
+# 고정 열로 빠지는 키 (나머지는 rest 열에 JSON으로)
+FIXED_KEYS = {"id", "questionType", "answer", "question", "explanation"}
+
+
+def _json(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def write_columnar(data, path):
+    """문제은행 dict → 열 기반 파일"""
+    questions = data["questions"]
+    count = len(questions)
+
+    type_table = []
+    type_codes = {}
+    ids = []
+    types = []
+    # 열마다 따로 모은 뒤 힙에 열 단위로 이어 붙임 (해설은 한 구역에 모여 있어 안 읽으면 페이지도 안 건드림)
+    heaps = {name: bytearray() for name in STRING_COLUMNS}
+    offsets = {name: [] for name in STRING_COLUMNS}
+
+    def put(column, text):
+        offsets[column].append(len(heaps[column]))
+        heaps[column].extend(text.encode('utf-8'))
+
+    for q in questions:
+        ids.append(q["id"])
+
+        q_type = q.get("questionType")
+        if "questionType" not in q or not isinstance(q_type, str):
+            types.append(NO_TYPE)
+        else:
+            if q_type not in type_codes:
+                type_codes[q_type] = len(type_table)
+                type_table.append(q_type)
+            types.append(type_codes[q_type])
+
+        put("answer", _json(q["answer"]) if "answer" in q else "")
+        put("question", q["question"] if isinstance(q.get("question"), str) else "")
+        put("explanation", q["explanation"] if isinstance(q.get("explanation"), str) else "")
+
+        # 키 순서 + 고정 열에 못 들어간 값(문자열이 아닌 question 등 포함)
+        rest = {k: v for k, v in q.items() if k not in FIXED_KEYS}
+        for key in ("question", "explanation", "questionType"):
+            if key in q and not isinstance(q[key], str):
+                rest[key] = q[key]
+        put("rest", _json([list(q), rest]))
+
+    heap = bytearray()
+    for column in STRING_COLUMNS:
+        base = len(heap)
+        offsets[column] = [base + offset for offset in offsets[column]]
+        offsets[column].append(base + len(heaps[column]))
+        heap.extend(heaps[column])
+
+    meta = {
+        "topLevel": {k: v for k, v in data.items() if k != "questions"},
+        "keyOrder": list(data),
+        "types": type_table,
+    }
+    meta_bytes = _json(meta).encode('utf-8')
+
+    sections = {
+        "ids": struct.pack(f"<{count}i", *ids),
+        "types": struct.pack(f"<{count}H", *types),
+    }
+    for column in STRING_COLUMNS:
+        sections[column] = struct.pack(f"<{count + 1}Q", *offsets[column])
+    sections["meta"] = meta_bytes
+    sections["heap"] = bytes(heap)
+
+    section_offsets = []
+    position = HEADER.size
+    for name in SECTIONS:
+        # 배열 섹션은 8바이트 정렬
+        position += -position % 8
+        section_offsets.append(position)
+        position += len(sections[name])
+
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, count, *section_offsets))
+        for name, offset in zip(SECTIONS, section_offsets):
+            f.write(b"\0" * (offset - f.tell()))
+            f.write(sections[name])
+
+    return count
+
+
+class ColumnarBank:
+    """mmap으로 연 열 기반 문제은행 (열은 필요할 때만 읽음)"""
+
+    def __init__(self, path):
+        self._file = open(path, 'rb')
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mm)
+
+        magic, version, _, count, *offsets = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"열 기반 문제은행 파일이 아님: {path}")
+
+        self.count = count
+        self._offsets = dict(zip(SECTIONS, offsets))
+        self._heap = self._offsets["heap"]
+
+        meta_start = self._offsets["meta"]
+        meta_end = self._offsets["heap"]
+        self.meta = json.loads(bytes(self._view[meta_start:meta_end]).decode('utf-8').rstrip('\0'))
+        self.type_table = self.meta["types"]
+
+        # 열 배열은 처음 접근할 때 mmap 위의 memoryview로 만들고 재사용
+        self._arrays = {}
+
+    def _array(self, name, fmt, length):
+        array = self._arrays.get(name)
+        if array is None:
+            start = self._offsets[name]
+            size = struct.calcsize(fmt) * length
+            array = self._view[start:start + size].cast(fmt)
+            self._arrays[name] = array
+        return array
+
+    def close(self):
+        """mmap 해제 (ids() 등으로 받은 memoryview도 더 이상 사용 불가)"""
+        for array in getattr(self, "_arrays", {}).values():
+            array.release()
+        self._arrays = {}
+        if getattr(self, "_view", None) is not None:
+            self._view.release()
+            self._view = None
+        if getattr(self, "_mm", None) is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    # ------------------------------------------------------------------
+    # 열 조회
+    # ------------------------------------------------------------------
+
+    def ids(self):
+        """id 열 (복사 없는 memoryview)"""
+        return self._array("ids", "i", self.count)
+
+    def type_codes(self):
+        return self._array("types", "H", self.count)
+
+    def types(self):
+        """questionType 열 (없으면 None)"""
+        table = self.type_table
+        return [table[code] if code != NO_TYPE else None for code in self.type_codes()]
+
+    def _string(self, column, i):
+        offsets = self._array(column, "Q", self.count + 1)
+        start = self._heap + offsets[i]
+        end = self._heap + offsets[i + 1]
+        return str(self._mm[start:end], 'utf-8')
+
+    def answer(self, i):
+        text = self._string("answer", i)
+        return json.loads(text) if text else None
+
+    def answers(self):
+        return [self.answer(i) for i in range(self.count)]
+
+    def question(self, i):
+        return self._string("question", i)
+
+    def explanation(self, i):
+        """해설 (요청 시에만 디코딩)"""
+        return self._string("explanation", i)
+
+    # ------------------------------------------------------------------
+    # 전체 레코드
+    # ------------------------------------------------------------------
+
+    def record(self, i):
+        """i번째 문제 dict (원래 키 순서)"""
+        key_order, rest = json.loads(self._string("rest", i))
+        code = self.type_codes()[i]
+
+        q = {}
+        for key in key_order:
+            if key in rest:
+                q[key] = rest[key]
+            elif key == "id":
+                q[key] = self.ids()[i]
+            elif key == "questionType":
+                q[key] = self.type_table[code]
+            elif key == "answer":
+                q[key] = self.answer(i)
+            elif key == "question":
+                q[key] = self.question(i)
+            elif key == "explanation":
+                q[key] = self.explanation(i)
+        return q
+
+    def to_data(self):
+        """quiz_data.json과 같은 dict"""
+        questions = [self.record(i) for i in range(self.count)]
+        data = {}
+        for key in self.meta["keyOrder"]:
+            data[key] = questions if key == "questions" else self.meta["topLevel"][key]
+        return data
+
+
+def build(json_path, columnar_path):
+    with open(json_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return write_columnar(data, columnar_path)
+
+
+def dump(columnar_path, json_path):
+    with ColumnarBank(columnar_path) as bank:
+        data = bank.to_data()
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    return len(data["questions"])
+
+
+def benchmark(json_path, columnar_path=None, repeat=20):
+    """
+    id/유형/정답만 필요한 도구 기준 로딩 시간 비교
+    반환: {"json": 초, "columnar": 초} (repeat회 중 최솟값)
+    """
+    if columnar_path is None:
+        columnar_path = json_path.rsplit('.', 1)[0] + ".qzcb"
+        build(json_path, columnar_path)
+
+    def load_json():
+        with open(json_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        questions = data["questions"]
+        return ([q["id"] for q in questions],
+                [q.get("questionType") for q in questions],
+                [q.get("answer") for q in questions])
+
+    def load_columnar():
+        with ColumnarBank(columnar_path) as bank:
+            return list(bank.ids()), bank.types(), bank.answers()
+
+    results = {}
+    for name, loader in [("json", load_json), ("columnar", load_columnar)]:
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            loader()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        results[name] = best
+
+    assert load_json() == load_columnar(), "두 포맷의 id/유형/정답이 다름"
+    return results
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    args = sys.argv[1:]
+    if len(args) >= 3 and args[0] == "build":
+        count = build(args[1], args[2])
+        print(f"[변환] {args[1]} → {args[2]} ({count}개 문제)")
+    elif len(args) >= 3 and args[0] == "dump":
+        count = dump(args[1], args[2])
+        print(f"[복원] {args[1]} → {args[2]} ({count}개 문제)")
+    elif len(args) >= 2 and args[0] == "bench":
+        result = benchmark(args[1], args[2] if len(args) > 2 else None)
+        print(f"json.load + 열 추출: {result['json'] * 1000:.2f} ms")
+        print(f"columnar mmap     : {result['columnar'] * 1000:.2f} ms")
+        print(f"배율              : {result['json'] / result['columnar']:.1f}x")
+    else:
+        print(__doc__)
@@ -0,0 +1,337 @@
+"""
+SQLite 문제은행
+quiz_data.json을 정규화된 테이블(questions, options, statements, drop_zones, matching_items)로 가져오고
+문제/해설 텍스트에 FTS5 전문 검색 인덱스를 만든다.
+내보내기는 app.js가 읽는 JSON 모양(키 순서 포함)을 그대로 다시 생성한다.
+
+사용법:
+    python quiz_db.py import quiz_data.json quiz.db
+    python quiz_db.py export quiz.db quiz_data.json
+    python quiz_db.py search quiz.db "Availability Zone" [HOTSPOT]
+"""
+
+import json
+import sqlite3
+import sys
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS questions (
+    id INTEGER PRIMARY KEY,
+    position INTEGER NOT NULL,
+    original_number TEXT,
+    question_type TEXT,
+    question TEXT,
+    answer TEXT,
+    explanation TEXT,
+    image TEXT,
+    key_order TEXT NOT NULL,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_questions_type ON questions(question_type);
+CREATE INDEX IF NOT EXISTS idx_questions_position ON questions(position);
+
+CREATE TABLE IF NOT EXISTS options (
+    question_id INTEGER NOT NULL REFERENCES questions(id),
+    position INTEGER NOT NULL,
+    letter TEXT,
+    text TEXT,
+    raw TEXT,
+    PRIMARY KEY (question_id, position)
+);
+
+CREATE TABLE IF NOT EXISTS statements (
+    question_id INTEGER NOT NULL REFERENCES questions(id),
+    position INTEGER NOT NULL,
+    text TEXT,
+    raw TEXT,
+    PRIMARY KEY (question_id, position)
+);
+
+CREATE TABLE IF NOT EXISTS drop_zones (
+    question_id INTEGER NOT NULL REFERENCES questions(id),
+    position INTEGER NOT NULL,
+    description TEXT,
+    correct_answer TEXT,
+    raw TEXT,
+    PRIMARY KEY (question_id, position)
+);
+
+CREATE TABLE IF NOT EXISTS matching_items (
+    question_id INTEGER NOT NULL REFERENCES questions(id),
+    position INTEGER NOT NULL,
+    item TEXT,
+    options TEXT,
+    answer TEXT,
+    raw TEXT,
+    PRIMARY KEY (question_id, position)
+);
+"""
+
+# 문제 dict 키 → questions 컬럼
+QUESTION_COLUMNS = {
+    "original_number": "original_number",
+    "questionType": "question_type",
+    "question": "question",
+    "explanation": "explanation",
+    "image": "image",
+}
+
+# 자식 테이블: 문제 dict 키 → (테이블, 표준 원소 키 → 컬럼)
+CHILD_TABLES = {
+    "options": ("options", {"letter": "letter", "text": "text"}),
+    "statements": ("statements", None),
+    "dropZones": ("drop_zones", {"description": "description", "correctAnswer": "correct_answer"}),
+    "matchingItems": ("matching_items", {"item": "item", "options": "options", "answer": "answer"}),
+}
+JSON_CHILD_COLUMNS = {"options"}  # matching_items.options는 리스트라 JSON으로 저장
+
+
+def fts_tokenizer(conn):
+    """한국어 부분 일치를 위해 가능하면 trigram 토크나이저 사용 (SQLite 3.34+)"""
+    version = tuple(int(v) for v in sqlite3.sqlite_version.split('.'))
+    return "trigram" if version >= (3, 34, 0) else "unicode61"
+
+
+def connect(db_path):
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA)
+    conn.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS questions_fts USING fts5("
+        "question, explanation, content='questions', content_rowid='id', "
+        f"tokenize='{fts_tokenizer(conn)}')"
+    )
+    return conn
+
+
+# ---------------------------------------------------------------------------
+# 가져오기
+# ---------------------------------------------------------------------------
+
+def _child_rows(q_id, elements, columns):
+    """자식 원소 → (question_id, position, 컬럼값..., raw) 행"""
+    rows = []
+    for position, element in enumerate(elements):
+        if columns is None:
+            # statements: 문자열 리스트
+            if isinstance(element, str):
+                rows.append((q_id, position, element, None))
+            else:
+                rows.append((q_id, position, None, json.dumps(element, ensure_ascii=False)))
+            continue
+
+        standard = isinstance(element, dict) and list(element) == list(columns)
+        values = []
+        for key in columns:
+            value = element.get(key) if standard else None
+            if key in JSON_CHILD_COLUMNS and value is not None:
+                value = json.dumps(value, ensure_ascii=False)
+            values.append(value)
+        # 표준 모양이 아니면(예: 이미지 선택지) 원소 전체를 raw로 보존
+        raw = None if standard else json.dumps(element, ensure_ascii=False)
+        rows.append((q_id, position, *values, raw))
+    return rows
+
+
+def import_json(json_path, db_path):
+    """quiz_data.json → SQLite (기존 내용은 교체)"""
+    with open(json_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    conn = connect(db_path)
+    with conn:
+        for table in ["meta", "options", "statements", "drop_zones", "matching_items", "questions"]:
+            conn.execute(f"DELETE FROM {table}")
+
+        top_level = {k: v for k, v in data.items() if k != "questions"}
+        conn.execute("INSERT INTO meta VALUES ('top_level', ?)", (json.dumps(top_level, ensure_ascii=False),))
+        conn.execute("INSERT INTO meta VALUES ('key_order', ?)", (json.dumps(list(data), ensure_ascii=False),))
+
+        child_rows = {table: [] for table, _ in CHILD_TABLES.values()}
+        question_rows = []
+
+        for position, q in enumerate(data["questions"]):
+            # 컬럼/자식 테이블에 맞지 않는 값은 extra(JSON)로 보존
+            extra = {}
+            for key, value in q.items():
+                if key in ("id", "answer"):
+                    continue
+                if key in QUESTION_COLUMNS and isinstance(value, str):
+                    continue
+                if key in CHILD_TABLES and isinstance(value, list):
+                    table, columns = CHILD_TABLES[key]
+                    child_rows[table].extend(_child_rows(q["id"], value, columns))
+                    continue
+                extra[key] = value
+
+            question_rows.append((
+                q["id"],
+                position,
+                *(None if key in extra else q.get(key) for key in QUESTION_COLUMNS),
+                json.dumps(q["answer"], ensure_ascii=False) if "answer" in q else None,
+                json.dumps(list(q), ensure_ascii=False),
+                json.dumps(extra, ensure_ascii=False) if extra else None
+            ))
+
+        conn.executemany(
+            "INSERT INTO questions (id, position, original_number, question_type, question, "
+            "explanation, image, answer, key_order, extra) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            question_rows
+        )
+        conn.executemany("INSERT INTO options VALUES (?, ?, ?, ?, ?)", child_rows["options"])
+        conn.executemany("INSERT INTO statements VALUES (?, ?, ?, ?)", child_rows["statements"])
+        conn.executemany("INSERT INTO drop_zones VALUES (?, ?, ?, ?, ?)", child_rows["drop_zones"])
+        conn.executemany("INSERT INTO matching_items VALUES (?, ?, ?, ?, ?, ?)", child_rows["matching_items"])
+
+        conn.execute("INSERT INTO questions_fts(questions_fts) VALUES ('rebuild')")
+
+    conn.close()
+    return len(data["questions"])
+
+
+# ---------------------------------------------------------------------------
+# 내보내기
+# ---------------------------------------------------------------------------
+
+def _load_children(conn, table, columns):
+    """question_id → 원소 리스트"""
+    children = {}
+    if columns is None:
+        query = f"SELECT question_id, text, raw FROM {table} ORDER BY question_id, position"
+        for q_id, text, raw in conn.execute(query):
+            children.setdefault(q_id, []).append(json.loads(raw) if raw is not None else text)
+        return children
+
+    names = list(columns.values())
+    query = f"SELECT question_id, {', '.join(names)}, raw FROM {table} ORDER BY question_id, position"
+    for row in conn.execute(query):
+        q_id, values, raw = row[0], row[1:-1], row[-1]
+        if raw is not None:
+            element = json.loads(raw)
+        else:
+            element = {}
+            for key, value in zip(columns, values):
+                if key in JSON_CHILD_COLUMNS and value is not None:
+                    value = json.loads(value)
+                element[key] = value
+        children.setdefault(q_id, []).append(element)
+    return children
+
+
+def export_data(db_path):
+    """SQLite → app.js가 읽는 JSON dict"""
+    conn = connect(db_path)
+
+    meta = dict(conn.execute("SELECT key, value FROM meta"))
+    top_level = json.loads(meta["top_level"])
+    key_order = json.loads(meta["key_order"])
+
+    children = {key: _load_children(conn, table, columns)
+                for key, (table, columns) in CHILD_TABLES.items()}
+
+    questions = []
+    query = ("SELECT id, original_number, question_type, question, explanation, image, "
+             "answer, key_order, extra FROM questions ORDER BY position")
+    for row in conn.execute(query):
+        q_id, answer, q_key_order, extra = row[0], row[6], row[7], row[8]
+        columns = dict(zip(QUESTION_COLUMNS, row[1:6]))
+        extra = json.loads(extra) if extra else {}
+
+        q = {}
+        for key in json.loads(q_key_order):
+            if key == "id":
+                q[key] = q_id
+            elif key == "answer":
+                q[key] = json.loads(answer)
+            elif key in extra:
+                q[key] = extra[key]
+            elif key in CHILD_TABLES:
+                q[key] = children[key].get(q_id, [])
+            else:
+                q[key] = columns[key]
+        questions.append(q)
+
+    conn.close()
+
+    data = {}
+    for key in key_order:
+        data[key] = questions if key == "questions" else top_level[key]
+    return data
+
+
+def export_json(db_path, json_path):
+    data = export_data(db_path)
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    return len(data["questions"])
+
+
+# ---------------------------------------------------------------------------
+# 검색
+# ---------------------------------------------------------------------------
+
+TRIGRAM_MIN_LENGTH = 3
+
+
+def _uses_trigram(conn):
+    """questions_fts가 trigram 토크나이저로 만들어졌는지 (이미 있는 DB는 만들 때의 설정을 따름)"""
+    row = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'questions_fts'").fetchone()
+    return row is not None and "trigram" in row[0]
+
+
+def _like_pattern(text):
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def search(db_path, text, question_type=None, limit=100):
+    """
+    문제/해설 전문 검색 → [(id, questionType, 문제 앞부분)]
+    text는 구문(phrase)으로 검색
+    trigram 색인은 3글자 미만 검색어("VM", "구독")를 찾지 못하므로 그때는 LIKE로 전체를 확인 (문제 순서대로)
+    """
+    conn = connect(db_path)
+    if _uses_trigram(conn) and len(text) < TRIGRAM_MIN_LENGTH:
+        pattern = _like_pattern(text)
+        sql = ("SELECT q.id, q.question_type, substr(q.question, 1, 80) FROM questions q "
+               "WHERE (q.question LIKE ? ESCAPE '\\' OR q.explanation LIKE ? ESCAPE '\\')")
+        params = [pattern, pattern]
+        order = " ORDER BY q.position LIMIT ?"
+    else:
+        phrase = '"' + text.replace('"', '""') + '"'
+        sql = ("SELECT q.id, q.question_type, substr(q.question, 1, 80) "
+               "FROM questions_fts JOIN questions q ON q.id = questions_fts.rowid "
+               "WHERE questions_fts MATCH ?")
+        params = [phrase]
+        order = " ORDER BY rank LIMIT ?"
+    if question_type:
+        sql += " AND q.question_type = ?"
+        params.append(question_type)
+    sql += order
+    params.append(limit)
+
+    rows = conn.execute(sql, params).fetchall()
+    conn.close()
+    return rows
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    args = sys.argv[1:]
+    if len(args) >= 3 and args[0] == "import":
+        count = import_json(args[1], args[2])
+        print(f"[가져오기] {args[1]} → {args[2]} ({count}개 문제)")
+    elif len(args) >= 3 and args[0] == "export":
+        count = export_json(args[1], args[2])
+        print(f"[내보내기] {args[1]} → {args[2]} ({count}개 문제)")
+    elif len(args) >= 3 and args[0] == "search":
+        q_type = args[3] if len(args) > 3 else None
+        for q_id, q_type_value, preview in search(args[1], args[2], q_type):
+            print(f"Q{q_id:4d} [{q_type_value}] {preview}")
+    else:
+        print(__doc__)
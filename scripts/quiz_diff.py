@@ -0,0 +1,160 @@
+"""
+문제은행 구조 비교 (data/quiz_data.json / quiz_data_backup.json / quiz_data_full.json)
+문제마다 레코드 해시를 id 기준으로 만들고 한 번의 선형 순회로 추가/삭제/변경된 id를 찾은 뒤
+변경된 문제만 필드별 해시(options, statements, answer 등)를 비교해서 바뀐 필드를 JSON으로 보고
+키 순서만 다른 경우는 변경으로 보지 않음
+
+사용법:
+    python quiz_diff.py                               # data/의 기본 세 파일 (첫 파일 기준, 저장소 루트에서 실행)
+    python quiz_diff.py base.json other.json [...]    # 첫 파일 기준으로 나머지 비교
+    python quiz_diff.py ... --summary                 # 사람이 읽는 요약
+"""
+
+import hashlib
+import json
+import os
+import sys
+
+DEFAULT_FILES = [os.path.join("data", name)
+                 for name in ("quiz_data.json", "quiz_data_backup.json", "quiz_data_full.json")]
+
+
+def value_hash(value):
+    """키 순서와 무관한 값 해시"""
+    canonical = json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).digest()
+
+
+def field_hashes(q):
+    """{필드: 해시}"""
+    return {key: value_hash(value) for key, value in q.items()}
+
+
+def digest_bank(data):
+    """
+    문제은행 dict → (id → (레코드 해시, 레코드), 중복 id 리스트)
+    같은 id가 여러 번 나오면 첫 번째를 사용
+    """
+    digests = {}
+    duplicates = []
+    for q in data["questions"]:
+        q_id = q.get("id")
+        if q_id in digests:
+            duplicates.append(q_id)
+            continue
+        digests[q_id] = (value_hash(q), q)
+    return digests, duplicates
+
+
+def diff_digests(old, new):
+    """
+    두 다이제스트 비교
+    반환: {"added", "removed", "changed": {id: [필드]}, "unchanged"}
+    """
+    changed = {}
+    removed = []
+    unchanged = 0
+
+    for q_id, (old_hash, old_q) in old.items():
+        entry = new.get(q_id)
+        if entry is None:
+            removed.append(q_id)
+            continue
+        new_hash, new_q = entry
+        if new_hash == old_hash:
+            unchanged += 1
+            continue
+        # 필드 해시는 레코드가 다를 때만 계산
+        old_fields = field_hashes(old_q)
+        new_fields = field_hashes(new_q)
+        changed[q_id] = sorted(
+            key for key in old_fields.keys() | new_fields.keys()
+            if old_fields.get(key) != new_fields.get(key)
+        )
+
+    added = [q_id for q_id in new if q_id not in old]
+
+    return {
+        "added": added,
+        "removed": removed,
+        "changed": changed,
+        "unchanged": unchanged
+    }
+
+
+def diff_data(old_data, new_data):
+    """문제은행 dict 두 개 비교 (최상위 필드 포함)"""
+    old_digests, old_duplicates = digest_bank(old_data)
+    new_digests, new_duplicates = digest_bank(new_data)
+
+    result = diff_digests(old_digests, new_digests)
+
+    top_keys = (old_data.keys() | new_data.keys()) - {"questions"}
+    result["topLevel"] = sorted(
+        key for key in top_keys
+        if key not in old_data or key not in new_data or old_data[key] != new_data[key]
+    )
+    result["duplicates"] = {"old": old_duplicates, "new": new_duplicates}
+    result["counts"] = {"old": len(old_data["questions"]), "new": len(new_data["questions"])}
+    return result
+
+
+def load_bank(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def diff_files(paths):
+    """첫 파일을 기준으로 나머지 파일 각각 비교 (각 파일은 한 번만 읽음)"""
+    base_path = paths[0]
+    base = load_bank(base_path)
+
+    reports = []
+    for path in paths[1:]:
+        report = {"old": base_path, "new": path}
+        report.update(diff_data(base, load_bank(path)))
+        reports.append(report)
+    return reports
+
+
+def field_summary(changed):
+    """필드별 변경 문제 수"""
+    counts = {}
+    for fields in changed.values():
+        for key in fields:
+            counts[key] = counts.get(key, 0) + 1
+    return dict(sorted(counts.items(), key=lambda item: (-item[1], item[0])))
+
+
+def print_summary(reports):
+    for report in reports:
+        print(f"\n[{report['old']} → {report['new']}]")
+        print(f"   문제 수: {report['counts']['old']} → {report['counts']['new']}")
+        print(f"   추가 {len(report['added'])}개 / 삭제 {len(report['removed'])}개 / "
+              f"변경 {len(report['changed'])}개 / 동일 {report['unchanged']}개")
+        if report['topLevel']:
+            print(f"   최상위 필드 변경: {', '.join(report['topLevel'])}")
+        for key, count in field_summary(report['changed']).items():
+            print(f"   - {key}: {count}개 문제")
+        for side in ("old", "new"):
+            if report['duplicates'][side]:
+                print(f"   [경고] {report[side]} 중복 id: {report['duplicates'][side]}")
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    if len(args) == 1:
+        # 비교할 대상이 없음 (기본 파일로 조용히 바꾸지 않음)
+        print(__doc__)
+        sys.exit(1)
+    files = args or DEFAULT_FILES
+
+    reports = diff_files(files)
+    if "--summary" in sys.argv:
+        print_summary(reports)
+    else:
+        # JSON 키는 문자열이어야 하므로 changed의 id는 문자열로 변환됨
+        json.dump(reports, sys.stdout, ensure_ascii=False, indent=2)
+        print()
@@ -0,0 +1,225 @@
+"""
+quiz_data.json 래퍼
+id → 레코드 인덱스로 문제를 상수 시간에 조회하고, 유형별 조회와 일괄 수정을 제공
+여러 수정 스크립트의 변경은 QuizPatch로 모아 한 번에 적용하고, 저장은 임시 파일 + rename으로 원자적으로 수행
+"""
+
+import json
+import os
+import tempfile
+
+QUESTION_TYPES = ["MULTIPLE_CHOICE", "HOTSPOT", "DRAG_DROP", "MATCHING"]
+
+
+class QuizStore:
+    """문제은행 JSON을 id 인덱스와 함께 메모리에 유지"""
+
+    def __init__(self, path="quiz_data.json"):
+        self.path = path
+        with open(path, 'r', encoding='utf-8') as f:
+            self.data = json.load(f)
+        self._reindex()
+
+    @classmethod
+    def from_data(cls, data, path="quiz_data.json"):
+        """이미 메모리에 있는 문제은행 dict로 생성 (save 기본 경로는 path)"""
+        store = cls.__new__(cls)
+        store.path = path
+        store.data = data
+        store._reindex()
+        return store
+
+    def _reindex(self):
+        self._by_id = {q['id']: q for q in self.data['questions']}
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    @property
+    def questions(self):
+        return self.data['questions']
+
+    def __len__(self):
+        return len(self.data['questions'])
+
+    def __iter__(self):
+        return iter(self.data['questions'])
+
+    def __contains__(self, q_id):
+        return q_id in self._by_id
+
+    def ids(self):
+        return list(self._by_id)
+
+    def get(self, q_id):
+        """id로 문제 조회 (없으면 None)"""
+        return self._by_id.get(q_id)
+
+    def of_type(self, *q_types):
+        """questionType이 주어진 값 중 하나인 문제 리스트"""
+        return [q for q in self.data['questions'] if q.get('questionType') in q_types]
+
+    def multiple_choice(self):
+        return self.of_type("MULTIPLE_CHOICE")
+
+    def hotspot(self):
+        return self.of_type("HOTSPOT", "HOT_AREA")
+
+    def drag_drop(self):
+        return self.of_type("DRAG_DROP")
+
+    def matching(self):
+        return self.of_type("MATCHING")
+
+    # ------------------------------------------------------------------
+    # 수정
+    # ------------------------------------------------------------------
+
+    def update(self, q_id, fields, remove=()):
+        """
+        문제 하나 수정 (fields 덮어쓰기, remove 키 삭제)
+        반환: 문제가 있으면 True
+        """
+        q = self._by_id.get(q_id)
+        if q is None:
+            return False
+        q.update(fields)
+        for key in remove:
+            q.pop(key, None)
+        return True
+
+    def update_many(self, changes, remove=()):
+        """
+        여러 문제 일괄 수정 {id: fields}
+        반환: (수정된 id 리스트, 없는 id 리스트)
+        """
+        updated = []
+        missing = []
+        for q_id, fields in changes.items():
+            if self.update(q_id, fields, remove):
+                updated.append(q_id)
+            else:
+                missing.append(q_id)
+        return updated, missing
+
+    def add(self, question):
+        """문제 추가 (같은 id가 있으면 ValueError)"""
+        if question['id'] in self._by_id:
+            raise ValueError(f"Q{question['id']} 이미 존재")
+        self.data['questions'].append(question)
+        self._by_id[question['id']] = question
+        self.data['totalQuestions'] = len(self.data['questions'])
+
+    def remove(self, q_id):
+        """문제 삭제 (반환: 삭제된 레코드 또는 None)"""
+        q = self._by_id.pop(q_id, None)
+        if q is not None:
+            self.data['questions'].remove(q)
+            self.data['totalQuestions'] = len(self.data['questions'])
+        return q
+
+    def apply(self, patch, strict=False):
+        """
+        QuizPatch 적용 (메모리에서만, 저장은 save)
+        strict=True면 없는 id가 하나라도 있을 때 아무것도 바꾸지 않고 KeyError
+        반환: (수정된 id 리스트, 없는 id 리스트)
+        """
+        missing = [q_id for q_id in patch.ids() if q_id not in self._by_id]
+        if strict and missing:
+            raise KeyError(f"문제 없음: {missing}")
+
+        updated = []
+        for q_id, change in patch.items():
+            if self.update(q_id, change["set"], change["remove"]):
+                updated.append(q_id)
+        return updated, missing
+
+    def save(self, path=None, compact=False):
+        """
+        JSON 저장 (기본: 읽어온 파일)
+        같은 폴더의 임시 파일에 쓴 뒤 os.replace로 교체하므로 중간에 죽어도 기존 파일이 깨지지 않음
+        compact=True면 들여쓰기 없이 저장
+        """
+        path = path or self.path
+        folder = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(prefix=".quiz_", suffix=".tmp", dir=folder)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                if compact:
+                    json.dump(self.data, f, ensure_ascii=False, separators=(',', ':'))
+                else:
+                    json.dump(self.data, f, ensure_ascii=False, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            # mkstemp는 0600으로 만들기 때문에 기존 파일 권한 유지
+            mode = os.stat(path).st_mode & 0o777 if os.path.exists(path) else 0o644
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+class QuizPatch:
+    """
+    문제별 변경 묶음
+    같은 id에 여러 번 set하면 나중 값이 이김 (적용 순서 = 추가 순서)
+    """
+
+    def __init__(self, source=None):
+        self.source = source
+        self._changes = {}
+
+    def _entry(self, q_id):
+        return self._changes.setdefault(q_id, {"set": {}, "remove": []})
+
+    def set(self, q_id, fields):
+        """필드 덮어쓰기 예약"""
+        entry = self._entry(q_id)
+        entry["set"].update(fields)
+        for key in fields:
+            if key in entry["remove"]:
+                entry["remove"].remove(key)
+        return self
+
+    def remove(self, q_id, *keys):
+        """필드 삭제 예약"""
+        entry = self._entry(q_id)
+        for key in keys:
+            entry["set"].pop(key, None)
+            if key not in entry["remove"]:
+                entry["remove"].append(key)
+        return self
+
+    def merge(self, other):
+        """다른 패치를 뒤에 이어 붙임"""
+        for q_id, change in other.items():
+            self.set(q_id, change["set"])
+            self.remove(q_id, *change["remove"])
+        return self
+
+    def ids(self):
+        return list(self._changes)
+
+    def items(self):
+        return self._changes.items()
+
+    def __len__(self):
+        return len(self._changes)
+
+
+def apply_patches(patches, path="quiz_data.json", compact=False, strict=False):
+    """
+    여러 패치를 한 번 로드 / 한 번 저장으로 적용
+    반환: (수정된 id 리스트, 없는 id 리스트)
+    """
+    combined = QuizPatch()
+    for patch in patches:
+        combined.merge(patch)
+
+    store = QuizStore(path)
+    updated, missing = store.apply(combined, strict=strict)
+    store.save(compact=compact)
+    return updated, missing
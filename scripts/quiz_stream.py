@@ -0,0 +1,132 @@
+"""
+문제은행 스트리밍 리더
+파일 전체를 json.load 하지 않고 "questions" 배열을 문제 하나씩 읽어서 돌려줌
+청크 단위로 읽으면서 json.JSONDecoder.raw_decode로 레코드 하나씩 디코딩하므로
+메모리는 청크 + 문제 하나 크기만큼만 사용
+
+    reader = QuizStreamReader("quiz_data.json")
+    for q in reader:
+        ...
+    reader.meta     # questions 외 최상위 필드 (title, totalQuestions 등)
+    reader.count    # 읽은 문제 수
+"""
+
+import json
+
+CHUNK_SIZE = 64 * 1024
+MAX_RECORD = 16 * 1024 * 1024  # 레코드 하나가 이보다 크면 깨진 파일로 판단
+
+_WHITESPACE = " \t\n\r"
+_SCALAR_END = _WHITESPACE + ",]}"
+
+
+class QuizStreamReader:
+    """최상위 객체의 "questions" 배열을 스트리밍으로 순회"""
+
+    def __init__(self, path, chunk_size=CHUNK_SIZE, max_record=MAX_RECORD):
+        self.path = path
+        self.chunk_size = chunk_size
+        self.max_record = max_record
+        self.meta = {}
+        self.count = 0
+        self._decoder = json.JSONDecoder()
+
+    # ------------------------------------------------------------------
+    # 버퍼
+    # ------------------------------------------------------------------
+
+    def _fill(self):
+        """청크 하나 더 읽기 (소비한 앞부분은 버림). 반환: 더 읽었으면 True"""
+        chunk = self._file.read(self.chunk_size)
+        if not chunk:
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self):
+        """공백을 건너뛴 다음 글자 (파일 끝이면 '')"""
+        while True:
+            buffer = self._buffer
+            pos = self._pos
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, char):
+        found = self._peek()
+        if found != char:
+            raise ValueError(f"{self.path}: '{char}' 예상, '{found or 'EOF'}' 발견")
+        self._pos += 1
+
+    def _decode(self):
+        """현재 위치의 JSON 값 하나 디코딩 (버퍼가 모자라면 더 읽고 재시도)"""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if len(self._buffer) - self._pos > self.max_record or not self._fill():
+                    raise
+                continue
+            # 숫자/리터럴은 청크 경계에서 잘렸을 수 있음 ('1.5'가 '1.'까지만 있으면 raw_decode는 '1'을 돌려줌)
+            # → 바로 뒤에 구분자가 보일 때까지 더 읽고, 파일 끝이면 그대로 사용
+            if (self._buffer[self._pos] not in '{["'
+                    and (end == len(self._buffer) or self._buffer[end] not in _SCALAR_END)
+                    and len(self._buffer) - self._pos <= self.max_record
+                    and self._fill()):
+                continue
+            self._pos = end
+            return value
+
+    # ------------------------------------------------------------------
+    # 순회
+    # ------------------------------------------------------------------
+
+    def __iter__(self):
+        with open(self.path, 'r', encoding='utf-8') as f:
+            self._file = f
+            self._buffer = ""
+            self._pos = 0
+            self.meta = {}
+            self.count = 0
+
+            self._expect("{")
+            if self._peek() == "}":
+                return
+            while True:
+                key = self._decode()
+                self._expect(":")
+                if key == "questions":
+                    yield from self._iter_array()
+                else:
+                    self.meta[key] = self._decode()
+
+                if self._peek() == ",":
+                    self._pos += 1
+                    continue
+                self._expect("}")
+                break
+
+    def _iter_array(self):
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self._decode()
+            self.count += 1
+            if self._peek() == ",":
+                self._pos += 1
+                continue
+            self._expect("]")
+            return
+
+
+def iter_questions(path, chunk_size=CHUNK_SIZE):
+    """문제 dict를 하나씩 (최상위 필드가 필요하면 QuizStreamReader 사용)"""
+    return iter(QuizStreamReader(path, chunk_size))
@@ -0,0 +1,367 @@
+"""
+문제은행 스키마 검증
+questionType마다 검사 함수 목록을 한 번만 만들어(compile) 두고 모든 문제에 적용
+첫 오류에서 멈추지 않고 전체 오류/경고 목록을 만든다
+
+검사 항목:
+    공통          id(정수, 중복 없음), question, explanation, answer, 알려진 questionType
+    MULTIPLE_CHOICE  options(letter/text), 정답 letter가 선택지에 있는지
+    MULTIPLE_CHOICE_MULTI / HOT_AREA  MULTIPLE_CHOICE와 같은 선택지 검사 (app.js 기본 선택지 화면)
+    DROPDOWN      dropdowns가 있으면 드롭다운마다 id/options, 정답(answer[id])이 그 options에 있는지
+                  없으면 MULTIPLE_CHOICE와 같은 선택지 검사
+    HOTSPOT       statements가 있으면 문항 수 = 정답 수, 정답은 예/아니오
+                  없으면 MULTIPLE_CHOICE와 같은 선택지 검사
+    DRAG_DROP     dragOptions, dropZones(description/correctAnswer), 정답이 dragOptions에 있는지
+    MATCHING      matchingItems(item/options/answer), 정답이 options에 있는지
+
+사용법:
+    python quiz_validator.py [quiz_data.json] [--stream] [--json]
+    --stream: 파일 전체를 올리지 않고 문제 하나씩 읽으며 검증 (아주 큰 문제은행용)
+"""
+
+import json
+import sys
+from collections import Counter
+
+from quiz_stream import QuizStreamReader
+
+ERROR = "error"
+WARNING = "warning"
+
+# app.js가 HOTSPOT 문항 정답으로 비교하는 값
+YES_NO = {"예", "아니오"}
+
+
+class Issue:
+    """검증 문제 하나"""
+
+    __slots__ = ("level", "id", "index", "field", "message")
+
+    def __init__(self, level, q_id, index, field, message):
+        self.level = level
+        self.id = q_id
+        self.index = index
+        self.field = field
+        self.message = message
+
+    def to_dict(self):
+        return {"level": self.level, "id": self.id, "index": self.index,
+                "field": self.field, "message": self.message}
+
+    def __str__(self):
+        mark = "❌" if self.level == ERROR else "⚠️ "
+        where = f"Q{self.id}" if self.id is not None else "-"
+        return f"{mark} {where} [{self.field}] {self.message}"
+
+
+# ---------------------------------------------------------------------------
+# 검사 함수 (문제 dict → [(level, field, message)])
+# ---------------------------------------------------------------------------
+
+def require(field, types, non_empty=False):
+    """필드 존재 + 타입 (+ 비어 있지 않음)"""
+    type_names = "/".join(t.__name__ for t in types)
+
+    def check(q):
+        if field not in q:
+            return [(ERROR, field, "필드 없음")]
+        value = q[field]
+        if not isinstance(value, types):
+            return [(ERROR, field, f"{type_names} 아님 ({type(value).__name__})")]
+        if non_empty and not value:
+            return [(ERROR, field, "비어 있음")]
+        return []
+    return check
+
+
+def answer_letters(answer):
+    """정답 → letter 리스트 (app.js와 같은 규칙: 리스트 / 줄바꿈 / 쉼표 / 한 글자)"""
+    if isinstance(answer, list):
+        return answer
+    if "\n" in answer:
+        return [a.strip() for a in answer.split("\n") if len(a.strip()) == 1]
+    if "," in answer:
+        return [a.strip() for a in answer.split(",") if len(a.strip()) == 1]
+    return [answer.strip()]
+
+
+def check_letter_options(q):
+    """letter/text 선택지 + 정답 letter 일치"""
+    options = q.get("options")
+    if not isinstance(options, list) or not options:
+        return [(ERROR, "options", "선택지 없음")]
+
+    issues = []
+    letters = []
+    for i, option in enumerate(options):
+        if not isinstance(option, dict) or "letter" not in option:
+            issues.append((ERROR, "options", f"{i}번 선택지에 letter 없음"))
+            continue
+        if not isinstance(option.get("text"), str) and not option.get("image"):
+            issues.append((ERROR, "options", f"{option['letter']} 선택지에 text 없음"))
+        letters.append(option["letter"])
+
+    duplicates = sorted(letter for letter, count in Counter(letters).items() if count > 1)
+    if duplicates:
+        issues.append((ERROR, "options", f"letter 중복: {duplicates}"))
+
+    answer = q.get("answer")
+    if isinstance(answer, (str, list)):
+        chosen = answer_letters(answer)
+        if not chosen:
+            issues.append((ERROR, "answer", "정답 letter 없음"))
+        missing = [a for a in chosen if a not in letters]
+        if missing:
+            issues.append((ERROR, "answer", f"선택지에 없는 정답 {missing} (선택지 {letters})"))
+    elif isinstance(answer, dict):
+        issues.append((ERROR, "answer", "선택지 문제인데 정답이 객체임"))
+    return issues
+
+
+def check_statements(q):
+    """HOTSPOT 예/아니오 문항"""
+    statements = q["statements"]
+    if not isinstance(statements, list) or not statements:
+        return [(ERROR, "statements", "문항 없음")]
+
+    issues = []
+    if not all(isinstance(s, str) and s.strip() for s in statements):
+        issues.append((ERROR, "statements", "빈 문항 또는 문자열이 아닌 문항"))
+
+    answer = q.get("answer")
+    if not isinstance(answer, list):
+        issues.append((ERROR, "answer", "문항별 정답 리스트가 아님"))
+        return issues
+    if len(answer) != len(statements):
+        issues.append((ERROR, "answer", f"정답 {len(answer)}개 / 문항 {len(statements)}개"))
+    invalid = sorted({a for a in answer if a not in YES_NO}, key=str)
+    if invalid:
+        issues.append((ERROR, "answer", f"예/아니오가 아닌 정답: {invalid}"))
+    return issues
+
+
+def check_hotspot(q):
+    if "statements" in q:
+        return check_statements(q)
+    return check_letter_options(q)
+
+
+def check_dropdowns(q):
+    """DROPDOWN: dropdowns [{id, options}] + answer {id: letter}"""
+    if "dropdowns" not in q:
+        return check_letter_options(q)
+
+    dropdowns = q["dropdowns"]
+    if not isinstance(dropdowns, list) or not dropdowns:
+        return [(ERROR, "dropdowns", "드롭다운 없음")]
+
+    answer = q.get("answer")
+    if not isinstance(answer, dict):
+        return [(ERROR, "answer", "드롭다운별 정답 객체가 아님")]
+
+    issues = []
+    for i, dropdown in enumerate(dropdowns):
+        if not isinstance(dropdown, dict) or "id" not in dropdown:
+            issues.append((ERROR, "dropdowns", f"{i}번 드롭다운에 id 없음"))
+            continue
+        options = dropdown.get("options")
+        if not isinstance(options, list) or not options:
+            issues.append((ERROR, "dropdowns", f"{dropdown['id']} 드롭다운에 options 없음"))
+            continue
+        letters = [o.get("letter") for o in options if isinstance(o, dict)]
+        # app.js는 answer[dropdown.id]로 조회 (JSON 키는 문자열)
+        chosen = answer.get(str(dropdown["id"]))
+        if chosen not in letters:
+            issues.append((ERROR, "answer", f"{dropdown['id']} 드롭다운 정답이 options에 없음: {chosen!r}"))
+    return issues
+
+
+def check_drop_zones(q):
+    drag_options = q.get("dragOptions")
+    zones = q.get("dropZones")
+    if not isinstance(drag_options, list) or not isinstance(zones, list):
+        return []  # require()에서 이미 보고
+
+    issues = []
+    available = set(drag_options)
+    correct = []
+    for i, zone in enumerate(zones):
+        if not isinstance(zone, dict) or "correctAnswer" not in zone:
+            issues.append((ERROR, "dropZones", f"{i}번 영역에 correctAnswer 없음"))
+            continue
+        if not zone.get("description"):
+            issues.append((ERROR, "dropZones", f"{i}번 영역에 description 없음"))
+        if zone["correctAnswer"] not in available:
+            issues.append((ERROR, "dropZones", f"{i}번 영역 정답이 dragOptions에 없음: {zone['correctAnswer']!r}"))
+        correct.append(zone["correctAnswer"])
+
+    # 최상위 answer는 표시용 요약 (채점은 dropZones 기준)
+    if isinstance(q.get("answer"), str) and correct and q["answer"] != ", ".join(correct):
+        issues.append((WARNING, "answer", "dropZones 정답 요약과 다름"))
+    return issues
+
+
+def check_matching_items(q):
+    items = q.get("matchingItems")
+    if not isinstance(items, list):
+        return []
+
+    issues = []
+    for i, item in enumerate(items):
+        if not isinstance(item, dict):
+            issues.append((ERROR, "matchingItems", f"{i}번 항목이 객체가 아님"))
+            continue
+        if not item.get("item"):
+            issues.append((ERROR, "matchingItems", f"{i}번 항목에 item 없음"))
+        options = item.get("options")
+        if not isinstance(options, list) or not options:
+            issues.append((ERROR, "matchingItems", f"{i}번 항목에 options 없음"))
+        elif item.get("answer") not in options:
+            issues.append((ERROR, "matchingItems", f"{i}번 항목 정답이 options에 없음: {item.get('answer')!r}"))
+    return issues
+
+
+COMMON_CHECKS = [
+    require("question", (str,), non_empty=True),
+    require("explanation", (str,)),
+    require("answer", (str, list, dict)),  # dict는 DROPDOWN 드롭다운별 정답
+]
+
+SCHEMAS = {
+    "MULTIPLE_CHOICE": [
+        check_letter_options,
+    ],
+    "MULTIPLE_CHOICE_MULTI": [
+        check_letter_options,
+    ],
+    "HOT_AREA": [
+        check_letter_options,
+    ],
+    "DROPDOWN": [
+        check_dropdowns,
+    ],
+    "HOTSPOT": [
+        check_hotspot,
+    ],
+    "DRAG_DROP": [
+        require("dragOptions", (list,), non_empty=True),
+        require("dropZones", (list,), non_empty=True),
+        check_drop_zones,
+    ],
+    "MATCHING": [
+        require("matchingItems", (list,), non_empty=True),
+        check_matching_items,
+    ],
+}
+
+
+def compile_checkers(schemas=SCHEMAS, common=COMMON_CHECKS):
+    """questionType → 검사 함수 튜플 (공통 검사 포함)"""
+    return {q_type: tuple(common) + tuple(checks) for q_type, checks in schemas.items()}
+
+
+CHECKERS = compile_checkers()
+
+
+# ---------------------------------------------------------------------------
+# 검증
+# ---------------------------------------------------------------------------
+
+def validate_questions(questions, checkers=CHECKERS):
+    """문제 리스트(또는 이터레이터) 검증 → Issue 리스트 (전체)"""
+    issues = []
+    seen = {}
+
+    for index, q in enumerate(questions):
+        if not isinstance(q, dict):
+            issues.append(Issue(ERROR, None, index, "-", "문제가 객체가 아님"))
+            continue
+
+        q_id = q.get("id")
+        if not isinstance(q_id, int) or isinstance(q_id, bool):
+            issues.append(Issue(ERROR, q_id, index, "id", "정수 id 아님"))
+        elif q_id in seen:
+            issues.append(Issue(ERROR, q_id, index, "id", f"중복 id ({seen[q_id]}번째 문제와 같음)"))
+        else:
+            seen[q_id] = index
+
+        q_type = q.get("questionType")
+        checks = checkers.get(q_type) if isinstance(q_type, str) else None
+        if checks is None:
+            preview = repr(q_type)
+            if len(preview) > 40:
+                preview = preview[:40] + "…"
+            issues.append(Issue(ERROR, q_id, index, "questionType", f"알 수 없는 유형: {preview}"))
+            checks = COMMON_CHECKS
+
+        for check in checks:
+            for level, field, message in check(q):
+                issues.append(Issue(level, q_id, index, field, message))
+
+    return issues
+
+
+def validate(data, checkers=CHECKERS):
+    """문제은행 dict 검증 (totalQuestions 포함) → Issue 리스트"""
+    questions = data.get("questions")
+    if not isinstance(questions, list):
+        return [Issue(ERROR, None, None, "questions", "문제 리스트 없음")]
+
+    issues = validate_questions(questions, checkers)
+    issues.extend(_check_total(data.get("totalQuestions"), len(questions)))
+    return issues
+
+
+def validate_file(path, checkers=CHECKERS):
+    """
+    파일을 스트리밍으로 검증 (메모리: 문제 하나 + id 집합)
+    반환: (Issue 리스트, QuizStreamReader - meta/count 조회용)
+    """
+    reader = QuizStreamReader(path)
+    issues = validate_questions(reader, checkers)
+    issues.extend(_check_total(reader.meta.get("totalQuestions"), reader.count))
+    return issues, reader
+
+
+def _check_total(total, count):
+    if total != count:
+        return [Issue(WARNING, None, None, "totalQuestions", f"{total} / 실제 {count}개")]
+    return []
+
+
+def summarize(issues):
+    """(오류 수, 경고 수, 필드별 개수)"""
+    errors = sum(1 for issue in issues if issue.level == ERROR)
+    by_field = Counter(f"{issue.level}:{issue.field}" for issue in issues)
+    return errors, len(issues) - errors, by_field
+
+
+def print_report(issues, limit=None):
+    errors, warnings, by_field = summarize(issues)
+    print(f"오류 {errors}개 / 경고 {warnings}개")
+    for key, count in sorted(by_field.items()):
+        print(f"   {key}: {count}개")
+    shown = issues if limit is None else issues[:limit]
+    for issue in shown:
+        print(f"   {issue}")
+    if limit is not None and len(issues) > limit:
+        print(f"   ... 외 {len(issues) - limit}개")
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    json_file = args[0] if args else "quiz_data.json"
+    if "--stream" in sys.argv:
+        result, _ = validate_file(json_file)
+    else:
+        with open(json_file, 'r', encoding='utf-8') as f:
+            result = validate(json.load(f))
+
+    if "--json" in sys.argv:
+        json.dump([issue.to_dict() for issue in result], sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        print_report(result)
+    sys.exit(1 if any(issue.level == ERROR for issue in result) else 0)
@@ -0,0 +1,249 @@
+"""
+문제 검색용 역색인 생성
+문제/선택지/해설 텍스트를 정규화(소문자 + 공백 하나로)한 뒤 글자 2-gram → 문제 번호 목록으로 색인
+한국어는 두 글자 단어가 많고 영어도 2-gram이면 부분 문자열 검색에 충분
+app.js는 검색어의 2-gram 목록을 교집합해서 후보만 실제 텍스트로 확인
+
+출력 (data/search_index.json):
+    version, ngram, ids           문제 번호 i → id
+    textHash                      문제별 검색 텍스트의 FNV-1a 해시 (app.js가 불러온 문제와 다르면 색인을 버리고 선형 탐색)
+    common                        절반 넘는 문제에 나오는 gram (색인하지 않고 후보를 줄이지 않음)
+    postings                      gram → 문제 번호 델타 목록 ([3, 1, 4] = 3, 4, 8번째 문제)
+
+사용법:
+    python search_index.py build [data/quiz_data.json] [data/search_index.json]
+    python search_index.py bench [data/quiz_data.json]
+"""
+
+import json
+import os
+import random
+import struct
+import sys
+import time
+
+DEFAULT_JSON = os.path.join("data", "quiz_data.json")
+DEFAULT_OUT = os.path.join("data", "search_index.json")
+NGRAM = 2
+COMMON_RATIO = 0.5
+VERSION = 2
+FNV_OFFSET = 0x811c9dc5
+FNV_PRIME = 0x01000193
+
+
+def normalize(text):
+    """소문자 + 연속 공백을 공백 하나로 (app.js normalizeSearchText와 동일)"""
+    return " ".join(text.lower().split())
+
+
+def searchable_text(q):
+    """검색 대상 텍스트: 문제 + 선택지 + 해설"""
+    parts = [q.get("question") or ""]
+    for option in q.get("options") or []:
+        if isinstance(option, str):
+            parts.append(option)
+        elif isinstance(option, dict) and isinstance(option.get("text"), str):
+            parts.append(option["text"])
+    parts.append(q.get("explanation") or "")
+    return normalize("\n".join(p for p in parts if isinstance(p, str)))
+
+
+def ngrams(text, n=NGRAM):
+    """텍스트의 서로 다른 n-gram 집합"""
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def text_hash(texts):
+    """
+    검색 텍스트들을 줄바꿈으로 이은 문자열의 FNV-1a 32비트 해시
+    JS 문자열과 같은 UTF-16 단위로 계산 (app.js searchTextHash와 동일)
+    """
+    value = FNV_OFFSET
+    data = "\n".join(texts).encode("utf-16-le")
+    for (unit,) in struct.iter_unpack("<H", data):
+        value = ((value ^ unit) * FNV_PRIME) & 0xffffffff
+    return value
+
+
+def build_index(questions, n=NGRAM, common_ratio=COMMON_RATIO):
+    """문제 리스트 → 역색인 dict"""
+    postings = {}
+    texts = [searchable_text(q) for q in questions]
+    for doc, text in enumerate(texts):
+        for gram in ngrams(text, n):
+            postings.setdefault(gram, []).append(doc)
+
+    limit = len(questions) * common_ratio
+    common = sorted(gram for gram, docs in postings.items() if len(docs) > limit)
+
+    encoded = {}
+    for gram in sorted(postings):
+        docs = postings[gram]
+        if len(docs) > limit:
+            continue
+        # 문제 번호는 오름차순이므로 델타로 저장
+        previous = 0
+        deltas = []
+        for doc in docs:
+            deltas.append(doc - previous)
+            previous = doc
+        encoded[gram] = deltas
+
+    return {
+        "version": VERSION,
+        "ngram": n,
+        "ids": [q["id"] for q in questions],
+        "textHash": text_hash(texts),
+        "common": common,
+        "postings": encoded
+    }
+
+
+def decode_postings(deltas):
+    docs = []
+    current = 0
+    for delta in deltas:
+        current += delta
+        docs.append(current)
+    return docs
+
+
+def candidates(index, query):
+    """
+    검색어 → 후보 문제 번호 리스트 (None이면 색인으로 좁힐 수 없음 → 전체 확인)
+    후보는 검색어의 모든 gram을 포함하지만 실제로 이어져 있는지는 호출 쪽에서 확인
+    """
+    text = normalize(query)
+    grams = ngrams(text, index["ngram"])
+    if not grams:
+        return None
+
+    common = set(index["common"])
+    lists = []
+    for gram in grams:
+        if gram in common:
+            continue
+        deltas = index["postings"].get(gram)
+        if deltas is None:
+            return []
+        lists.append(deltas)
+    if not lists:
+        return None
+
+    # 짧은 목록부터 교집합
+    lists.sort(key=len)
+    result = set(decode_postings(lists[0]))
+    for deltas in lists[1:]:
+        result.intersection_update(decode_postings(deltas))
+        if not result:
+            break
+    return sorted(result)
+
+
+def search(index, texts, query):
+    """검색어를 포함하는 문제 id 리스트 (texts: 문제 번호 → searchable_text)"""
+    needle = normalize(query)
+    docs = candidates(index, query)
+    if docs is None:
+        docs = range(len(texts))
+    return [index["ids"][doc] for doc in docs if needle in texts[doc]]
+
+
+def write_index(json_path=DEFAULT_JSON, out_path=DEFAULT_OUT):
+    with open(json_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    index = build_index(data["questions"])
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, out_path)
+    return index
+
+
+# ---------------------------------------------------------------------------
+# 벤치마크
+# ---------------------------------------------------------------------------
+
+def synthetic_bank(questions, size, seed=0):
+    """실제 문제를 섞어 복제한 size개 문제 (id는 새로 부여, 문장 일부를 섞어 gram 분포 유지)"""
+    rng = random.Random(seed)
+    words = [w for q in questions for w in searchable_text(q).split()]
+    bank = []
+    for i in range(size):
+        base = questions[i % len(questions)]
+        q = dict(base, id=i + 1)
+        if i >= len(questions):
+            q["question"] = (base.get("question") or "") + " " + " ".join(rng.choices(words, k=8))
+        bank.append(q)
+    return bank
+
+
+def benchmark(json_path=DEFAULT_JSON, sizes=(500, 50000), queries=None, repeat=5):
+    """
+    크기별 색인 생성 시간 / 색인 크기 / 검색 지연(색인 vs 선형 탐색)
+    반환: 크기별 결과 dict 리스트
+    """
+    with open(json_path, 'r', encoding='utf-8') as f:
+        questions = json.load(f)["questions"]
+    queries = queries or ["availability zone", "가용성", "resource group",
+                          "구독", "SLA", "azure ad", "비용", "region pair"]
+
+    results = []
+    for size in sizes:
+        bank = synthetic_bank(questions, size)
+
+        start = time.perf_counter()
+        index = build_index(bank)
+        build_seconds = time.perf_counter() - start
+        index_bytes = len(json.dumps(index, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+
+        texts = [searchable_text(q) for q in bank]
+
+        def timed(fn):
+            best = None
+            for _ in range(repeat):
+                start = time.perf_counter()
+                for query in queries:
+                    fn(query)
+                elapsed = (time.perf_counter() - start) / len(queries)
+                best = elapsed if best is None else min(best, elapsed)
+            return best
+
+        def linear(query):
+            needle = normalize(query)
+            return [bank[doc]["id"] for doc, text in enumerate(texts) if needle in text]
+
+        for query in queries:
+            assert search(index, texts, query) == linear(query), query
+
+        results.append({
+            "questions": size,
+            "build_seconds": build_seconds,
+            "index_bytes": index_bytes,
+            "grams": len(index["postings"]),
+            "query_indexed_ms": timed(lambda query: search(index, texts, query)) * 1000,
+            "query_linear_ms": timed(linear) * 1000
+        })
+    return results
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    args = sys.argv[1:]
+    if args and args[0] == "build":
+        json_file = args[1] if len(args) > 1 else DEFAULT_JSON
+        out_file = args[2] if len(args) > 2 else DEFAULT_OUT
+        index = write_index(json_file, out_file)
+        size_kb = os.path.getsize(out_file) / 1024
+        print(f"[색인] {json_file} → {out_file}")
+        print(f"   문제 {len(index['ids'])}개 / gram {len(index['postings'])}개 "
+              f"(공통 {len(index['common'])}개 제외) / {size_kb:.1f} KB")
+    elif args and args[0] == "bench":
+        json_file = args[1] if len(args) > 1 else DEFAULT_JSON
+        for r in benchmark(json_file):
+            print(f"[{r['questions']:>6}문제] 색인 생성 {r['build_seconds']:.2f}초, "
+                  f"{r['index_bytes'] / 1024:.0f} KB, gram {r['grams']}개")
+            print(f"   검색 1회: 색인 {r['query_indexed_ms']:.3f} ms / 선형 {r['query_linear_ms']:.3f} ms")
+    else:
+        print(__doc__)
@@ -0,0 +1,256 @@
+"""
+공유 메모리 문서 코퍼스
+PDF에서 추출한 전체 텍스트와 문제 구간 오프셋 표를 multiprocessing.shared_memory 블록 하나에 올려 두고
+워커 프로세스는 이름으로 연결(attach)해서 복사 없이 구간을 잘라 읽음
+작업마다 수 MB 텍스트를 pickle하지 않으므로 PDF 쪽 단계를 워커 수와 상관없이 같은 메모리로 병렬화할 수 있음
+
+블록 구조 (리틀 엔디언):
+    헤더   magic "QZSC", version(uint16), 패딩 2, count(uint64), text_size(uint64)   = 24바이트
+    표     count × (문제 번호, 바이트 시작, 바이트 끝) int64
+    텍스트 UTF-8
+
+사용법:
+    with SharedCorpus.from_index(index) as corpus:
+        results = corpus.map(parse_fn, numbers, workers=4)    # parse_fn(번호, 텍스트)는 모듈 최상위 함수
+
+    # 직접 풀을 만들 때
+    ProcessPoolExecutor(initializer=init_worker, initargs=(corpus.name,))
+    worker_corpus().segment(q_num)                             # 워커 안에서
+
+정리: 만든 프로세스(owner)가 close()할 때 unlink까지 하고, close를 잊어도 GC / 인터프리터 종료 시 해제
+(강제 종료되면 multiprocessing resource tracker가 남은 블록을 지움)
+워커는 close만 하고 블록을 지우지 않음
+"""
+
+import struct
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+MAGIC = b"QZSC"
+VERSION = 1
+HEADER = struct.Struct("<4sHxxQQ")
+ROW_FIELDS = 3  # 문제 번호, 바이트 시작, 바이트 끝
+
+
+def utf8_offsets(text, offsets):
+    """문자 오프셋들 → {문자 오프셋: UTF-8 바이트 오프셋} (문서를 한 번만 훑음)"""
+    result = {}
+    position = 0
+    byte_position = 0
+    for offset in sorted(set(offsets)):
+        byte_position += len(text[position:offset].encode('utf-8'))
+        position = offset
+        result[offset] = byte_position
+    return result
+
+
+def _open_block(name=None, size=0):
+    """공유 메모리 생성/연결 (3.13+에서는 워커 연결을 resource tracker에 등록하지 않음)"""
+    create = name is None
+    try:
+        return shared_memory.SharedMemory(name=name, create=create, size=size, track=create)
+    except TypeError:
+        # 3.12 이하: 풀 워커는 부모의 resource tracker를 공유하므로 등록돼도 부모 unlink 때 같이 정리됨
+        return shared_memory.SharedMemory(name=name, create=create, size=size)
+
+
+def _release(shm, views, owner):
+    """view 해제 → close → (owner면) unlink. 중복 호출되지 않도록 weakref.finalize로만 부름"""
+    for view in views:
+        try:
+            view.release()
+        except BufferError:
+            pass
+    try:
+        shm.close()
+    except BufferError:
+        # 밖에서 아직 구간 view를 잡고 있음 → 매핑은 프로세스 종료 시 해제
+        pass
+    if owner:
+        try:
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class SharedCorpus:
+    """공유 메모리에 올린 문서 텍스트 + 문제 구간 표"""
+
+    def __init__(self, shm, owner):
+        self._shm = shm
+        self.owner = owner
+
+        magic, version, count, text_size = HEADER.unpack_from(shm.buf, 0)
+        if magic != MAGIC or version != VERSION:
+            shm.close()
+            raise ValueError(f"공유 코퍼스가 아님: {shm.name}")
+
+        table_end = HEADER.size + count * ROW_FIELDS * 8
+        self._table = shm.buf[HEADER.size:table_end].cast("q")
+        self._text = shm.buf[table_end:table_end + text_size]
+        self._rows = {self._table[i * ROW_FIELDS]: i for i in range(count)}
+        self._finalizer = weakref.finalize(self, _release, shm, [self._table, self._text], owner)
+
+    @classmethod
+    def create(cls, text, spans):
+        """
+        텍스트 + {문제 번호: (문자 시작, 문자 끝)}로 공유 블록 생성 (이 프로세스가 owner)
+        구간은 문제 번호 순으로 저장
+        """
+        byte_offsets = utf8_offsets(text, [o for span in spans.values() for o in span])
+        encoded = text.encode('utf-8')
+        rows = sorted(spans.items())
+
+        table_size = len(rows) * ROW_FIELDS * 8
+        size = HEADER.size + table_size + len(encoded)
+        shm = _open_block(size=max(1, size))
+        try:
+            HEADER.pack_into(shm.buf, 0, MAGIC, VERSION, len(rows), len(encoded))
+            table = [0] * (len(rows) * ROW_FIELDS)
+            for i, (q_num, (start, end)) in enumerate(rows):
+                table[i * ROW_FIELDS:(i + 1) * ROW_FIELDS] = q_num, byte_offsets[start], byte_offsets[end]
+            struct.pack_into(f"<{len(table)}q", shm.buf, HEADER.size, *table)
+            shm.buf[HEADER.size + table_size:size] = encoded
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+        return cls(shm, owner=True)
+
+    @classmethod
+    def from_index(cls, index, q_nums=None):
+        """QuestionIndex의 문제 구간으로 생성 (q_nums: 이 번호들만, 없는 번호는 무시)"""
+        if q_nums is None:
+            q_nums = index.numbers()
+        spans = {q_num: index.span(q_num) for q_num in q_nums}
+        return cls.create(index.text, {q_num: span for q_num, span in spans.items() if span is not None})
+
+    @classmethod
+    def attach(cls, name):
+        """다른 프로세스가 만든 블록에 이름으로 연결 (close해도 블록은 남음)"""
+        return cls(_open_block(name), owner=False)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    @property
+    def name(self):
+        return self._shm.name
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __contains__(self, q_num):
+        return q_num in self._rows
+
+    def numbers(self):
+        """저장된 문제 번호 (번호 순)"""
+        return list(self._rows)
+
+    def byte_span(self, q_num):
+        """(바이트 시작, 끝) (없으면 None)"""
+        row = self._rows.get(q_num)
+        if row is None:
+            return None
+        base = row * ROW_FIELDS
+        return self._table[base + 1], self._table[base + 2]
+
+    def segment_view(self, q_num):
+        """문제 구간 UTF-8 memoryview (복사 없음, 없으면 None). close 전에 release해야 함"""
+        span = self.byte_span(q_num)
+        if span is None:
+            return None
+        return self._text[span[0]:span[1]]
+
+    def segment(self, q_num):
+        """문제 구간 텍스트 (공유 메모리에서 바로 디코딩, 없으면 None)"""
+        span = self.byte_span(q_num)
+        if span is None:
+            return None
+        return str(self._text[span[0]:span[1]], 'utf-8')
+
+    @property
+    def text(self):
+        """전체 텍스트 (한 번 디코딩해서 새 문자열을 만듦)"""
+        return str(self._text, 'utf-8')
+
+    # ------------------------------------------------------------------
+    # 병렬 처리
+    # ------------------------------------------------------------------
+
+    def map(self, func, q_nums=None, workers=1):
+        """
+        func(번호, 구간 텍스트)를 문제마다 실행 → {번호: 결과}
+        workers > 1이면 프로세스 풀에서 실행 (func는 pickle 가능한 모듈 최상위 함수)
+        없거나 빈 구간은 결과에서 빠짐, 결과 dict는 번호 순
+        """
+        if q_nums is None:
+            q_nums = self.numbers()
+        tasks = []
+        for q_num in sorted(set(q_nums)):
+            span = self.byte_span(q_num)
+            if span is not None and span[0] < span[1]:
+                tasks.append(q_num)
+
+        if workers <= 1 or len(tasks) <= 1:
+            return {q_num: func(q_num, self.segment(q_num)) for q_num in tasks}
+
+        results = {}
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                                 initargs=(self.name,)) as pool:
+            jobs = [(func, chunk) for chunk in _chunks(tasks, workers)]
+            for chunk_results in pool.map(_run_chunk, jobs):
+                results.update(chunk_results)
+        return dict(sorted(results.items()))
+
+    # ------------------------------------------------------------------
+    # 정리
+    # ------------------------------------------------------------------
+
+    def close(self):
+        """연결 해제 (owner면 블록 삭제까지). 여러 번 불러도 됨"""
+        self._finalizer()
+
+    @property
+    def closed(self):
+        return not self._finalizer.alive
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ---------------------------------------------------------------------------
+# 워커 쪽
+# ---------------------------------------------------------------------------
+
+_worker = None
+
+
+def init_worker(name):
+    """풀 initializer: 프로세스당 한 번 코퍼스에 연결"""
+    global _worker
+    _worker = SharedCorpus.attach(name)
+
+
+def worker_corpus():
+    """init_worker로 연결한 코퍼스"""
+    if _worker is None:
+        raise RuntimeError("init_worker로 연결되지 않은 프로세스")
+    return _worker
+
+
+def _run_chunk(job):
+    func, q_nums = job
+    corpus = worker_corpus()
+    return [(q_num, func(q_num, corpus.segment(q_num))) for q_num in q_nums]
+
+
+def _chunks(tasks, workers):
+    """워커당 여러 묶음으로 나눠 부하를 고르게 분배"""
+    size = max(1, -(-len(tasks) // (workers * 4)))
+    return [tasks[i:i + size] for i in range(0, len(tasks), size)]
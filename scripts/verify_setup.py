@@ -5,8 +5,12 @@
 
 import json
 import os
+import sys
 from pathlib import Path
 
+import quiz_validator
+from quiz_stream import iter_questions
+
 def check_dependencies():
     """필요한 Python 패키지 확인"""
     print("\n" + "=" * 60)
@@ -72,25 +76,52 @@ def check_files():
     return all_exist
 
 
-def validate_json():
-    """quiz_data.json 검증"""
+def print_schema_issues(issues):
+    """유형별 스키마 검증 결과 (앞 20개만 표시)"""
+    errors, warnings, _ = quiz_validator.summarize(issues)
+    if issues:
+        print(f"\n{'❌' if errors else '⚠️ '} 스키마 검증: 오류 {errors}개 / 경고 {warnings}개")
+        for issue in issues[:20]:
+            print(f"   {issue}")
+        if len(issues) > 20:
+            print(f"   ... 외 {len(issues) - 20}개 (python quiz_validator.py 로 전체 확인)")
+    else:
+        print(f"✅ 스키마 검증 통과")
+
+
+def validate_json(stream=False):
+    """
+    quiz_data.json 검증
+    stream=True면 파일 전체를 올리지 않고 문제 하나씩 읽으며 검증
+    (반환값의 questions도 다시 스트리밍하는 이터레이터)
+    """
     print("\n" + "=" * 60)
     print("3. quiz_data.json 검증")
     print("=" * 60)
     
     try:
-        with open('quiz_data.json', 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if stream:
+            issues, reader = quiz_validator.validate_file('quiz_data.json')
+            data = dict(reader.meta, questions=iter_questions('quiz_data.json'))
+            actual = reader.count
+        else:
+            with open('quiz_data.json', 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            issues = quiz_validator.validate(data)
+            actual = len(data.get('questions', []))
         
         print(f"✅ JSON 파싱 성공")
         print(f"   제목: {data.get('title', 'N/A')}")
         print(f"   총 문제: {data.get('totalQuestions', 0)}개")
-        print(f"   실제 문제: {len(data.get('questions', []))}개")
+        print(f"   실제 문제: {actual}개")
         
         # 불일치 확인
-        if data.get('totalQuestions') != len(data.get('questions', [])):
+        if data.get('totalQuestions') != actual:
             print(f"⚠️  문제 수 불일치 (메타데이터 업데이트 필요)")
         
+        # 유형별 스키마 검증 (전체 오류 목록)
+        print_schema_issues(issues)
+        
         return data
     
     except json.JSONDecodeError as e:
@@ -225,7 +256,7 @@ if __name__ == "__main__":
     # 순차적 검증
     deps_ok = check_dependencies()
     files_ok = check_files()
-    data = validate_json()
+    data = validate_json(stream="--stream" in sys.argv)
     check_images(data)
     check_server()
     
@@ -1,8 +1,91 @@
 const express = require('express');
+const crypto = require('crypto');
+const fs = require('fs');
 const path = require('path');
 const app = express();
 const port = process.env.PORT || 3000;
 
+// 사전 압축 파일 (scripts/precompress.py가 만든 .br / .gz), 선호 순서대로
+const PRECOMPRESSED = [
+    { encoding: 'br', ext: '.br' },
+    { encoding: 'gzip', ext: '.gz' }
+];
+const PRECOMPRESSED_TYPES = new Set(['.json', '.js', '.css']);
+
+// 원본보다 오래된 압축 파일은 쓰지 않음 (데이터를 고치고 다시 압축하지 않은 경우)
+function freshSibling(filePath, ext) {
+    try {
+        const original = fs.statSync(filePath);
+        const sibling = fs.statSync(filePath + ext);
+        return sibling.isFile() && sibling.mtimeMs >= original.mtimeMs;
+    } catch (error) {
+        return false;
+    }
+}
+
+// 분할 번들 매니페스트(scripts/build_bundles.py)의 sourceHash가 현재 문제은행과 다르면 409
+// → app.js가 번들 대신 data/quiz_data.json을 받음 (문제은행을 고치고 번들을 다시 만들지 않은 경우)
+const BANK_PATH = path.join(__dirname, 'data', 'quiz_data.json');
+const MANIFEST_PATH = path.join(__dirname, 'data', 'bundle', 'manifest.json');
+let bankHashCache = { key: null, hash: null };
+
+function bankHash() {
+    const stat = fs.statSync(BANK_PATH);
+    const key = `${stat.mtimeMs}:${stat.size}`;
+    if (bankHashCache.key !== key) {
+        const hash = crypto.createHash('sha256').update(fs.readFileSync(BANK_PATH)).digest('hex');
+        bankHashCache = { key, hash };
+    }
+    return bankHashCache.hash;
+}
+
+app.get('/data/bundle/manifest.json', (req, res, next) => {
+    let sourceHash;
+    let currentHash;
+    try {
+        sourceHash = JSON.parse(fs.readFileSync(MANIFEST_PATH, 'utf8')).sourceHash;
+        currentHash = bankHash();
+    } catch (error) {
+        return next();
+    }
+    if (sourceHash === currentHash) return next();
+
+    console.warn('번들이 data/quiz_data.json과 다름 - scripts/build_bundles.py를 다시 실행하세요');
+    res.set('Cache-Control', 'no-store');
+    res.status(409).json({ error: 'stale bundle' });
+});
+
+// 브라우저가 지원하면 요청마다 압축하지 않고 미리 압축된 파일을 그대로 보냄
+app.use((req, res, next) => {
+    if (req.method !== 'GET' && req.method !== 'HEAD') return next();
+
+    const ext = path.extname(req.path);
+    if (!PRECOMPRESSED_TYPES.has(ext)) return next();
+
+    let relativePath;
+    try {
+        relativePath = decodeURIComponent(req.path);
+    } catch (error) {
+        return next();
+    }
+    const filePath = path.join(__dirname, relativePath);
+    if (!filePath.startsWith(__dirname + path.sep)) return next();
+
+    const variant = PRECOMPRESSED.find(v => req.acceptsEncodings(v.encoding) && freshSibling(filePath, v.ext));
+
+    res.vary('Accept-Encoding');
+    if (!variant) return next();
+
+    res.type(ext);
+    res.set('Content-Encoding', variant.encoding);
+    res.sendFile(relativePath + variant.ext, { root: __dirname }, (error) => {
+        if (error && !res.headersSent) {
+            res.removeHeader('Content-Encoding');
+            next();
+        }
+    });
+});
+
 // 정적 파일 서빙 (현재 디렉토리)
 app.use(express.static(path.join(__dirname, '.')));
 